@@ -1,22 +1,40 @@
 # backend/app/api/deps.py
-from typing import AsyncGenerator
-from fastapi import Depends, HTTPException, status, Header
+import time
+from typing import AsyncGenerator, Optional
+from fastapi import Depends, HTTPException, status, Header, Query
 from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_session
 from app.repositories.user_repo import UserRepo
 from app.core.config import SECRET_KEY, ALGORITHM
+from app.core.auth_cache import token_cache, user_cache
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async for s in get_session():
         yield s
 
-async def get_current_user(
-    authorization: str = Header(None),
-    session: AsyncSession = Depends(get_db)
-):
+def decode_token(token: str) -> Optional[int]:
     """
-    Extract and validate JWT token from Authorization header
+    Verify a JWT and return its user id, or None if it is invalid.
+    Verified tokens are cached until they expire (bounded by the cache TTL).
+    """
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id = int(payload.get("sub"))
+    except (JWTError, TypeError, ValueError):
+        return None
+    exp = payload.get("exp")
+    token_cache.set(token, user_id, ttl_seconds=exp - time.time() if exp else None)
+    return user_id
+
+async def get_current_user_id(authorization: str | None = Header(None)) -> int:
+    """
+    Extract and validate the JWT from the Authorization header.
+    Needs no database access, so routes that only need the caller's id
+    should depend on this rather than get_current_user.
     """
     if not authorization:
         raise HTTPException(
@@ -24,39 +42,59 @@ async def get_current_user(
             detail="Not authenticated"
         )
     
-    try:
-        # Extract token from "Bearer <token>"
-        scheme, _, token = authorization.partition(" ")
-        if scheme.lower() != "bearer":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication scheme"
-            )
-        
-        # Decode JWT token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
-        
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token"
-            )
-        
-        # Get user from database
-        user_repo = UserRepo(session)
-        user = await user_repo.get_by_id(int(user_id))
-        
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found"
-            )
-        
-        return user
-        
-    except JWTError:
+    # Extract token from "Bearer <token>"
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication scheme"
+        )
+    
+    user_id = decode_token(token)
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
         )
+    return user_id
+
+async def get_current_user_id_or_token(
+    token: str | None = Query(None),
+    authorization: str | None = Header(None)
+) -> int:
+    """
+    get_current_user_id that also accepts the JWT as ?token=, for URLs the
+    browser fetches itself (<img src>, download links) without a header.
+    """
+    if token is None:
+        return await get_current_user_id(authorization)
+    user_id = decode_token(token)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+    return user_id
+
+async def get_current_user(
+    user_id: int = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db)
+):
+    """
+    Resolve the authenticated user row, served from the user cache when possible
+    """
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user_repo = UserRepo(session)
+    user = await user_repo.get_by_id(user_id)
+    
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
+    
+    user_cache.set(user_id, user)
+    return user
@@ -1,5 +1,5 @@
 # backend/app/api/routes/auth.py
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from jose import jwt
@@ -8,6 +8,8 @@ from app.db import get_session
 from app.services.user_service import UserService
 from app.schemas.schemas import UserCreate, Token
 from app.schemas.schemas import UserLogin
+from app.api.deps import get_current_user, get_current_user_id
+from app.models.models import User
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -43,29 +45,8 @@ async def login(payload: UserLogin, session: AsyncSession = Depends(get_session)
     token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return {"access_token": token, "token_type": "bearer"}
 
-# helper to decode token inside routes
-def decode_token(token: str):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return int(payload.get("sub"))
-    except Exception:
-        return None
-
-async def get_user_id_from_header(authorization: str | None = Header(None)):
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing token")
-    token = authorization.split(" ", 1)[1]
-    uid = decode_token(token)
-    if uid is None:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    return uid
-
 @router.get("/profile")
-async def get_profile(session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
-    svc = UserService(session)
-    user = await svc.get_by_id(user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+async def get_profile(user: User = Depends(get_current_user)):
     return {
         "id": user.id,
         "name": user.name,
@@ -76,7 +57,7 @@ async def get_profile(session: AsyncSession = Depends(get_session), user_id: int
     }
 
 @router.patch("/profile")
-async def update_profile(payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def update_profile(payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = UserService(session)
     user = await svc.get_by_id(user_id)
     if not user:
@@ -97,7 +78,7 @@ async def update_profile(payload: dict, session: AsyncSession = Depends(get_sess
     return {"message": "Profile updated", "user": {"id": updated.id, "name": updated.name, "email": updated.email, "profile_picture": updated.profile_picture}}
 
 @router.patch("/password")
-async def update_password(payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def update_password(payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = UserService(session)
     user = await svc.get_by_id(user_id)
     if not user:
@@ -107,12 +88,11 @@ async def update_password(payload: dict, session: AsyncSession = Depends(get_ses
         raise HTTPException(status_code=400, detail="current_password and new_password required")
     
     # Verify current password
-    if user.password != payload["current_password"]:
+    if not await svc.check_password(user, payload["current_password"]):
         raise HTTPException(status_code=401, detail="Current password is incorrect")
     
     # Update to new password
-    user.password = payload["new_password"]
-    await svc.repo.update(user)
+    await svc.set_password(user, payload["new_password"])
     
     return {"message": "Password updated successfully"}
 
@@ -0,0 +1,16 @@
+# backend/app/api/routes/dashboard.py
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_current_user_id
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter()
+
+@router.get("/stats")
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """Task counts by status, overdue and due this week, plus completion per project"""
+    service = DashboardService(db)
+    return await service.get_stats(user_id)
@@ -0,0 +1,58 @@
+# backend/app/api/routes/files.py
+from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_current_user_id, get_current_user_id_or_token
+from app.core.blob_store import blob_store
+from app.services.file_service import FileService, blob_url, served_content_type, INLINE_IMAGE_TYPES
+
+router = APIRouter()
+
+@router.post("/")
+async def upload_file(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Upload a chat attachment as multipart/form-data.
+    Returns a file_id to pass to POST /messages/; identical files are stored once.
+    """
+    service = FileService(db)
+    blob = await service.store(file.file, file.content_type)
+    return {
+        "file_id": blob.id,
+        "size": blob.size,
+        "content_type": blob.content_type,
+        "file_url": blob_url(blob.id)
+    }
+
+@router.get("/{file_id}")
+async def download_file(
+    file_id: str,
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id_or_token)
+):
+    """
+    Download an attachment. Supports Range requests.
+    Only active members of a team the file was posted in can fetch it (404
+    otherwise). <img src> can't send an Authorization header, so the JWT may
+    be passed as ?token=. The id is the SHA-256 of the content, so the
+    response never changes and can be cached for a year. Only recognised
+    images are served inline; everything else is a download, and nosniff
+    stops the browser second-guessing the type.
+    """
+    service = FileService(db)
+    blob = await service.get_for_user(file_id, user_id)
+    media_type = served_content_type(blob.content_type)
+    disposition = "inline" if media_type in INLINE_IMAGE_TYPES else "attachment"
+    return FileResponse(
+        blob_store.path_for(blob.id),
+        media_type=media_type,
+        headers={
+            "Cache-Control": "private, max-age=31536000, immutable",
+            "ETag": f'"{blob.id}"',
+            "Content-Disposition": disposition,
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
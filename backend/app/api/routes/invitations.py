@@ -1,11 +1,11 @@
 # backend/app/api/routes/invitations.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import List, Optional
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user_id
 from app.services.invitation_service import InvitationService
-from app.models.models import User
+from app.core.config import USER_SEARCH_MAX_RESULTS
 
 router = APIRouter()
 
@@ -26,12 +26,12 @@ class UserSearchResponse(BaseModel):
 async def create_invitation(
     request: CreateInvitationRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Send an invitation to join a team"""
     service = InvitationService(db)
     invitation = await service.create_invitation(
-        sender_id=current_user.id,
+        sender_id=user_id,
         receiver_id=request.receiver_id,
         team_id=request.team_id
     )
@@ -45,50 +45,52 @@ async def create_invitation(
 async def get_received_invitations(
     status: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Get invitations received by current user"""
     service = InvitationService(db)
-    return await service.get_received_invitations(current_user.id, status)
+    return await service.get_received_invitations(user_id, status)
 
 @router.get("/sent")
 async def get_sent_invitations(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Get invitations sent by current user"""
     service = InvitationService(db)
-    return await service.get_sent_invitations(current_user.id)
+    return await service.get_sent_invitations(user_id)
 
 @router.post("/accept")
 async def accept_invitation(
     request: InvitationActionRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Accept an invitation"""
     service = InvitationService(db)
-    return await service.accept_invitation(request.invitation_id, current_user.id)
+    return await service.accept_invitation(request.invitation_id, user_id)
 
 @router.post("/reject")
 async def reject_invitation(
     request: InvitationActionRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Reject an invitation"""
     service = InvitationService(db)
-    return await service.reject_invitation(request.invitation_id, current_user.id)
+    return await service.reject_invitation(request.invitation_id, user_id)
 
 @router.get("/search-users")
 async def search_users(
     q: str,
+    limit: int = Query(USER_SEARCH_MAX_RESULTS, ge=1, le=USER_SEARCH_MAX_RESULTS),
+    offset: int = Query(0, ge=0, le=1000),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
-    """Search for users by name or code_id"""
+    """Search for users by name or code_id, best matches first, one page at a time"""
     if not q or len(q) < 2:
         raise HTTPException(status_code=400, detail="Query must be at least 2 characters")
     
     service = InvitationService(db)
-    return await service.search_users(q, current_user.id)
+    return await service.search_users(q, user_id, limit, offset)
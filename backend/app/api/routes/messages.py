@@ -1,17 +1,19 @@
 # backend/app/api/routes/messages.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_current_user_id
+from app.api.conditional import etag_for, not_modified
+from app.api.serializers import json_response, message_list
 from app.services.message_service import MessageService
-from app.models.models import User
 
 router = APIRouter()
 
 class SendMessageRequest(BaseModel):
     team_id: int
     message: str
-    file_data: str | None = None
+    file_id: str | None = None  # from POST /files/
+    file_data: str | None = None  # legacy inline base64, stored as a blob
     file_name: str | None = None
     file_type: str | None = None
 
@@ -19,7 +21,7 @@ class SendMessageRequest(BaseModel):
 async def send_message(
     request: SendMessageRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Send a message to a team chat"""
     if not request.message or not request.message.strip():
@@ -28,20 +30,37 @@ async def send_message(
     service = MessageService(db)
     return await service.send_message(
         request.team_id, 
-        current_user.id, 
+        user_id, 
         request.message,
         file_data=request.file_data,
         file_name=request.file_name,
-        file_type=request.file_type
+        file_type=request.file_type,
+        file_id=request.file_id
     )
 
 @router.get("/{team_id}")
 async def get_team_messages(
     team_id: int,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    after_id: int | None = None,
+    before_id: int | None = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
-    """Get messages for a team"""
+    """
+    Get messages for a team.
+    Pass after_id to fetch only messages newer than the last one seen, or
+    before_id to scroll back through older history.
+    """
+    cached = not_modified(request, response, etag_for(
+        request, user_id, ("team_messages", team_id), ("team", team_id), ("users",)
+    ))
+    if cached:
+        return cached
     service = MessageService(db)
-    return await service.get_team_messages(team_id, current_user.id, limit)
+    messages = await service.get_team_messages(
+        team_id, user_id, limit, after_id=after_id, before_id=before_id
+    )
+    return json_response(message_list, messages, response)
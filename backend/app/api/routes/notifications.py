@@ -1,10 +1,16 @@
 # backend/app/api/routes/notifications.py
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
-from app.api.deps import get_db, get_current_user
+from app.db import AsyncSessionLocal
+from app.api.deps import get_db, get_current_user_id, decode_token
+from app.api.conditional import etag_for, not_modified
 from app.services.notification_service import NotificationService
-from app.models.models import User
+from app.core.notification_hub import notification_hub
+from app.core.config import NOTIFICATION_STREAM_HEARTBEAT_SECONDS
 
 router = APIRouter()
 
@@ -13,39 +19,115 @@ class MarkAsReadRequest(BaseModel):
 
 @router.get("/")
 async def get_notifications(
+    request: Request,
+    response: Response,
     unread_only: bool = False,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
-    """Get all notifications for current user"""
+    """
+    Page of the current user's notifications, newest first.
+    Pass next_cursor back as cursor for the next page.
+    """
+    cached = not_modified(request, response, etag_for(request, user_id, ("notifications", user_id)))
+    if cached:
+        return cached
     service = NotificationService(db)
-    return await service.get_notifications(current_user.id, unread_only)
+    try:
+        return await service.get_notifications(user_id, unread_only, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/unread-count")
 async def get_unread_count(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Get count of unread notifications"""
     service = NotificationService(db)
-    count = await service.get_unread_count(current_user.id)
+    count = await service.get_unread_count(user_id)
     return {"count": count}
 
+@router.get("/summary")
+async def get_summary(
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """Get unread notification and pending invitation counts in one call"""
+    service = NotificationService(db)
+    return await service.get_summary(user_id)
+
+STREAM_PAGE = 20  # new notifications sent per wake-up
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.get("/stream")
+async def stream_notifications(token: str | None = None):
+    """
+    Live badge counts and new notifications as Server-Sent Events.
+    EventSource can't set an Authorization header, so the JWT is passed as
+    ?token=. Sends a "summary" snapshot on connect, then "notification" and
+    "summary" events as they happen, and a keep-alive comment when idle.
+    The stream holds no database session; it opens one only when a commit
+    touches this user.
+    """
+    user_id = decode_token(token) if token else None
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    async def events():
+        listener = notification_hub.subscribe(user_id)
+        try:
+            async with AsyncSessionLocal() as db:
+                service = NotificationService(db)
+                summary = await service.get_summary(user_id)
+                last_id = await service.get_latest_id(user_id)
+            yield "retry: 5000\n\n"
+            yield _sse("summary", summary)
+            while True:
+                try:
+                    await asyncio.wait_for(listener.wake.wait(), NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                listener.wake.clear()
+                changes, listener.changes = listener.changes, set()
+                async with AsyncSessionLocal() as db:
+                    service = NotificationService(db)
+                    new = await service.get_new_notifications(user_id, last_id, STREAM_PAGE) if "notifications" in changes else []
+                    summary = await service.get_summary(user_id, fresh=True)
+                if len(new) == STREAM_PAGE:
+                    notification_hub.publish(user_id, "notifications")  # fetch the rest next round
+                for n in new:
+                    last_id = n["id"]
+                    yield _sse("notification", n)
+                yield _sse("summary", summary)
+        finally:
+            notification_hub.unsubscribe(user_id, listener)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # don't let a proxy buffer the stream
+    })
+
 @router.post("/mark-read")
 async def mark_as_read(
     request: MarkAsReadRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Mark a notification as read"""
     service = NotificationService(db)
-    return await service.mark_as_read(request.notification_id, current_user.id)
+    return await service.mark_as_read(request.notification_id, user_id)
 
 @router.post("/mark-all-read")
 async def mark_all_as_read(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    user_id: int = Depends(get_current_user_id)
 ):
     """Mark all notifications as read"""
     service = NotificationService(db)
-    return await service.mark_all_as_read(current_user.id)
+    return await service.mark_all_as_read(user_id)
@@ -1,33 +1,26 @@
 # backend/app/api/routes/projects.py
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.db import get_session
 from app.services.project_service import ProjectService
 from app.services.team_service import TeamService
 from app.schemas.schemas import ProjectCreate, ProjectOut
-from app.api.routes.auth import decode_token
+from app.api.deps import get_current_user_id
+from app.api.conditional import etag_for, not_modified
+from app.api.serializers import json_response, project_list
 from app.models.models import Team
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
-async def get_user_id_from_header(authorization: str | None = Header(None)):
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing token")
-    token = authorization.split(" ", 1)[1]
-    uid = decode_token(token)
-    if uid is None:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    return uid
-
 @router.post("/")
-async def create_project(payload: ProjectCreate, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def create_project(payload: ProjectCreate, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     if payload.team_id:
         team_svc = TeamService(session)
         if not await team_svc.is_member(payload.team_id, user_id):
             raise HTTPException(status_code=403, detail="Not a team member")
     svc = ProjectService(session)
-    project = await svc.create_project(payload.name, payload.description, payload.team_id)
+    project = await svc.create_project(payload.name, payload.description, payload.team_id, created_by=user_id)
     
     # Return with team info
     team = None
@@ -49,15 +42,20 @@ async def create_project(payload: ProjectCreate, session: AsyncSession = Depends
     }
 
 @router.get("/team/{team_id}")
-async def get_projects(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def get_projects(team_id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
+    # Membership changes bump the team version, so a 304 never outlives access
+    cached = not_modified(request, response, etag_for(request, user_id, ("team", team_id)))
+    if cached:
+        return cached
     team_svc = TeamService(session)
     if not await team_svc.is_member(team_id, user_id):
         raise HTTPException(status_code=403, detail="Not a team member")
     svc = ProjectService(session)
-    return await svc.list_projects_for_team(team_id)
+    projects = await svc.list_projects_for_team(team_id)
+    return json_response(project_list, projects, response)
 
 @router.patch("/{project_id}")
-async def update_project(project_id: int, payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def update_project(project_id: int, payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = ProjectService(session)
     try:
         updated = await svc.update_project(project_id, user_id, **payload)
@@ -68,7 +66,7 @@ async def update_project(project_id: int, payload: dict, session: AsyncSession =
         raise HTTPException(status_code=403, detail=str(e))
 
 @router.delete("/{project_id}")
-async def delete_project(project_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def delete_project(project_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = ProjectService(session)
     try:
         await svc.delete_project(project_id, user_id)
@@ -0,0 +1,27 @@
+# backend/app/api/routes/search.py
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_current_user_id
+from app.services.search_service import SearchService, SEARCH_TYPES
+
+router = APIRouter()
+
+@router.get("/")
+async def search(
+    q: str,
+    types: Optional[List[str]] = Query(None),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Full-text search across tasks, projects and team chat.
+    Every word must match (as a prefix). Hits are ranked best first and carry
+    an HTML snippet: the text is escaped and matches are wrapped in <mark>
+    tags, so it can be rendered as-is.
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Query cannot be empty")
+    service = SearchService(db)
+    return await service.search(user_id, q, types or SEARCH_TYPES, limit)
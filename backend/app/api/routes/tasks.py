@@ -1,58 +1,117 @@
 # backend/app/api/routes/tasks.py
-from fastapi import APIRouter, Depends, HTTPException, Header, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_session
 from app.services.task_service import TaskService
-from app.schemas.schemas import TaskCreate, TaskOut
-from app.api.routes.auth import decode_token
+from app.schemas.schemas import TaskCreate, TaskOut, TaskPage, BulkTaskRequest, BulkTaskResponse
+from typing import List, Optional
+from app.api.deps import get_current_user_id
+from app.api.conditional import etag_for, not_modified
+from app.api.serializers import json_response, task_list, task_page
 from datetime import datetime
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
-async def get_user_id_from_header(authorization: str | None = Header(None)):
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing token")
-    token = authorization.split(" ", 1)[1]
-    uid = decode_token(token)
-    if uid is None:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    return uid
-
 @router.post("/", response_model=TaskOut)
-async def create_task(payload: TaskCreate, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def create_task(payload: TaskCreate, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TaskService(session)
     due = payload.due_date
     task = await svc.create_task(title=payload.title, created_by=user_id, project_id=payload.project_id,
                                  description=payload.description, assignee_id=payload.assignee_id,
-                                 priority=payload.priority, due_date=due)
+                                 priority=payload.priority, due_date=due,
+                                 estimate_minutes=payload.estimate_minutes, tags=payload.tags)
     return task
 
-@router.get("/project/{project_id}")
-async def list_tasks(project_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+@router.post("/bulk", response_model=BulkTaskResponse)
+async def bulk_tasks(payload: BulkTaskRequest, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
+    """
+    Create, update, change status, reassign and delete many tasks in one transaction.
+    Each operation gets a result in request order; with atomic=true nothing is
+    applied unless every operation is valid. A task may appear in at most one
+    operation per batch; repeats are rejected.
+    """
+    svc = TaskService(session)
+    return await svc.bulk_apply(user_id, payload.operations, atomic=payload.atomic)
+
+@router.get("/search", response_model=TaskPage)
+async def search_tasks(
+    status: Optional[List[str]] = Query(None),
+    priority: Optional[List[str]] = Query(None),
+    assignee_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+    tags: Optional[List[str]] = Query(None),
+    q: Optional[str] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Search tasks the user can see (created, assigned, or in one of their teams' projects).
+    Repeat status/priority/tags to match several values. Pass next_cursor back as cursor for the next page.
+    """
+    svc = TaskService(session)
+    try:
+        page = await svc.search_tasks(
+            user_id, sort=sort, order=order, cursor=cursor, limit=limit,
+            statuses=status, priorities=priority, assignee_id=assignee_id, project_id=project_id,
+            due_from=due_from, due_to=due_to, tags=tags, text=q
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(task_page, page, from_orm=True)
+
+@router.get("/tags")
+async def tag_counts(
+    project_id: Optional[int] = None,
+    team_id: Optional[int] = None,
+    session: AsyncSession = Depends(get_session),
+    user_id: int = Depends(get_current_user_id)
+):
+    """Per-tag task counts for a project or a team"""
+    svc = TaskService(session)
+    try:
+        return await svc.tag_counts(user_id, project_id=project_id, team_id=team_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+@router.get("/project/{project_id}", response_model=List[TaskOut])
+async def list_tasks(project_id: int, request: Request, response: Response, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
+    cached = not_modified(request, response, etag_for(request, user_id, ("project", project_id)))
+    if cached:
+        return cached
     svc = TaskService(session)
     tasks = await svc.list_tasks_for_project(project_id)
-    return tasks
+    return json_response(task_list, tasks, response, from_orm=True)
 
 @router.patch("/{task_id}")
-async def update_task(task_id: int, payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def update_task(task_id: int, payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TaskService(session)
     try:
-        updated = await svc.update_task(task_id, **payload)
+        updated = await svc.update_task(task_id, **{**payload, "actor_id": user_id})
         return updated
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 @router.patch("/{task_id}/status")
-async def change_status(task_id: int, status: str = Query(...), session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def change_status(task_id: int, status: str = Query(...), session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TaskService(session)
     try:
-        updated = await svc.change_status(task_id, new_status=status)
+        updated = await svc.change_status(task_id, new_status=status, actor_id=user_id)
         return updated
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{task_id}")
-async def delete_task(task_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def delete_task(task_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TaskService(session)
     try:
         await svc.delete_task(task_id, user_id)
@@ -62,9 +121,9 @@ async def delete_task(task_id: int, session: AsyncSession = Depends(get_session)
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
-@router.get("/user/all")
-async def list_all_user_tasks(session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+@router.get("/user/all", response_model=List[TaskOut])
+async def list_all_user_tasks(session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     """Get all tasks created by or assigned to the user, including tasks without projects"""
     svc = TaskService(session)
     tasks = await svc.list_all_user_tasks(user_id)
-    return tasks
+    return json_response(task_list, tasks, from_orm=True)
@@ -1,25 +1,18 @@
 # backend/app/api/routes/teams.py
-from fastapi import APIRouter, Depends, HTTPException, Header
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db import get_session
 from app.services.team_service import TeamService
 from app.services.user_service import UserService
 from app.schemas.schemas import TeamCreate, AddMemberIn, TeamOut
-from app.api.routes.auth import decode_token
+from app.api.deps import get_current_user_id
+from app.api.conditional import etag_for, not_modified
+from app.api.serializers import json_response, team_list, team_members
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
-async def get_user_id_from_header(authorization: str | None = Header(None)):
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing token")
-    token = authorization.split(" ", 1)[1]
-    uid = decode_token(token)
-    if uid is None:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    return uid
-
 @router.post("/")
-async def create_team(payload: TeamCreate, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def create_team(payload: TeamCreate, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TeamService(session)
     team = await svc.create_team(payload.name, owner_id=user_id)
     # Return team with member_count like /my endpoint
@@ -34,7 +27,7 @@ async def create_team(payload: TeamCreate, session: AsyncSession = Depends(get_s
     }
 
 @router.post("/{team_id}/add-member")
-async def add_member(team_id: int, payload: AddMemberIn, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def add_member(team_id: int, payload: AddMemberIn, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     # find user by code
     user_svc = UserService(session)
     user = await user_svc.get_by_code(payload.code_id)
@@ -49,13 +42,16 @@ async def add_member(team_id: int, payload: AddMemberIn, session: AsyncSession =
     return {"member_id": member.id}
 
 @router.get("/my")
-async def my_teams(session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def my_teams(request: Request, response: Response, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
+    cached = not_modified(request, response, etag_for(request, user_id, ("user", user_id)))
+    if cached:
+        return cached
     svc = TeamService(session)
     teams = await svc.list_teams_for_user(user_id)
-    return teams
+    return json_response(team_list, teams, response)
 
 @router.patch("/{team_id}")
-async def update_team(team_id: int, payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def update_team(team_id: int, payload: dict, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TeamService(session)
     try:
         updated = await svc.update_team(team_id, user_id, **payload)
@@ -66,7 +62,7 @@ async def update_team(team_id: int, payload: dict, session: AsyncSession = Depen
         raise HTTPException(status_code=403, detail=str(e))
 
 @router.delete("/{team_id}")
-async def delete_team(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def delete_team(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TeamService(session)
     try:
         await svc.delete_team(team_id, user_id)
@@ -77,7 +73,7 @@ async def delete_team(team_id: int, session: AsyncSession = Depends(get_session)
         raise HTTPException(status_code=403, detail=str(e))
 
 @router.post("/{team_id}/leave")
-async def leave_team(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def leave_team(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TeamService(session)
     try:
         await svc.leave_team(team_id, user_id)
@@ -88,11 +84,11 @@ async def leave_team(team_id: int, session: AsyncSession = Depends(get_session),
         raise HTTPException(status_code=403, detail=str(e))
 
 @router.get("/{team_id}/members")
-async def get_team_members(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_user_id_from_header)):
+async def get_team_members(team_id: int, session: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     svc = TeamService(session)
     try:
         members = await svc.get_team_members_with_details(team_id, user_id)
-        return members
+        return json_response(team_members, members)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except PermissionError as e:
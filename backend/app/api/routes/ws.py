@@ -0,0 +1,47 @@
+# backend/app/api/routes/ws.py
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
+from app.db import AsyncSessionLocal
+from app.services.message_service import MessageService
+from app.api.deps import decode_token
+from app.core.chat_hub import chat_hub
+
+router = APIRouter(prefix="/ws", tags=["ws"])
+
+@router.websocket("/teams/{team_id}")
+async def team_chat_socket(websocket: WebSocket, team_id: int, token: str | None = None):
+    """
+    Live team chat channel.
+    Browsers can't set an Authorization header on a WebSocket, so the JWT is
+    passed as ?token=. Membership is checked once on connect; after that the
+    socket only receives messages pushed by MessageService.send_message, so an
+    idle chat costs no queries. Removing a member closes their sockets
+    through chat_hub.
+
+    Rejections are sent after accepting: a close before the handshake
+    reaches the browser as a bare 1006, and the client needs 4401/4403/4404
+    to know that reconnecting is pointless.
+    """
+    await websocket.accept()
+    user_id = decode_token(token) if token else None
+    if user_id is None:
+        await websocket.close(code=4401)
+        return
+
+    async with AsyncSessionLocal() as session:
+        try:
+            await MessageService(session).ensure_member(team_id, user_id)
+        except HTTPException as e:
+            await websocket.close(code=4000 + e.status_code)
+            return
+
+    await chat_hub.subscribe(team_id, user_id, websocket)
+    try:
+        while True:
+            # Clients only send keep-alive pings; messages still go through POST /messages/
+            data = await websocket.receive_text()
+            if data == "ping":
+                await websocket.send_text("pong")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await chat_hub.unsubscribe(team_id, websocket)
@@ -0,0 +1,90 @@
+# backend/app/api/serializers.py
+"""
+Precompiled serializers for the large list responses.
+
+Returning dicts or ORM rows makes FastAPI walk every value with
+jsonable_encoder and then json.dumps the result. These TypeAdapters are
+built once at import and encode straight to JSON bytes in pydantic-core.
+The TypedDicts describe the dicts the services already build, so the
+response bodies are unchanged.
+"""
+from typing import Any, List, Optional
+from typing_extensions import NotRequired, TypedDict
+from fastapi import Response
+from pydantic import TypeAdapter
+from app.schemas.schemas import TaskOut, TaskPage
+
+class TeamListItem(TypedDict):
+    id: int
+    name: str
+    owner_id: int
+    team_code: str
+    description: Optional[str]
+    created_at: Optional[str]
+    member_count: int
+
+class TeamRef(TypedDict):
+    id: int
+    name: str
+
+class ProjectListItem(TypedDict):
+    id: int
+    name: str
+    description: Optional[str]
+    team_id: Optional[int]
+    team: Optional[TeamRef]
+    status: str
+    start_date: Optional[str]
+    end_date: Optional[str]
+
+class MemberUser(TypedDict):
+    id: int
+    name: str
+    email: str
+    profile_picture: Optional[str]
+
+class MemberItem(TypedDict):
+    id: int
+    role: Optional[str]
+    status: Optional[str]
+    left_at: Optional[str]
+    user: MemberUser
+
+class TeamMembers(TypedDict):
+    active: List[MemberItem]
+    past: List[MemberItem]
+
+class MessageUser(TypedDict):
+    id: int
+    name: str
+    profile_picture: Optional[str]
+
+class MessageItem(TypedDict):
+    id: int
+    team_id: int
+    user: MessageUser
+    message: str
+    created_at: str
+    file_url: NotRequired[Optional[str]]
+    file_name: NotRequired[Optional[str]]
+    file_type: NotRequired[Optional[str]]
+
+task_list = TypeAdapter(List[TaskOut])
+task_page = TypeAdapter(TaskPage)
+team_list = TypeAdapter(List[TeamListItem])
+project_list = TypeAdapter(List[ProjectListItem])
+team_members = TypeAdapter(TeamMembers)
+message_list = TypeAdapter(List[MessageItem])
+
+def json_response(adapter: TypeAdapter, data: Any, response: Optional[Response] = None, from_orm: bool = False) -> Response:
+    """
+    Encode `data` with a precompiled adapter. ORM rows need from_orm=True
+    (one validation pass to read the attributes). Headers already set on
+    the route's injected `response` (e.g. ETag) are carried over.
+    """
+    if from_orm:
+        data = adapter.validate_python(data, from_attributes=True)
+    headers = dict(response.headers) if response is not None else None
+    if headers:
+        headers.pop("content-length", None)
+    return Response(content=adapter.dump_json(data), media_type="application/json", headers=headers)
@@ -0,0 +1,43 @@
+# backend/app/core/auth_cache.py
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from app.core.config import AUTH_CACHE_TTL_SECONDS, AUTH_CACHE_MAX_ENTRIES, USER_SEARCH_CACHE_TTL_SECONDS
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after a TTL"""
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+# JWT -> user id, for tokens whose signature and expiry were already checked
+token_cache = TTLCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+# user id -> User row; UserRepo.update invalidates
+user_cache = TTLCache(AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS)
+# (query, searcher, page) -> invite picker results; UserRepo.create/update clear it
+user_search_cache = TTLCache(AUTH_CACHE_MAX_ENTRIES, USER_SEARCH_CACHE_TTL_SECONDS)
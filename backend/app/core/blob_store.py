@@ -0,0 +1,75 @@
+# backend/app/core/blob_store.py
+import hashlib
+import os
+import re
+import tempfile
+from typing import BinaryIO, Tuple
+from app.core.config import BLOB_STORAGE_DIR
+
+_CHUNK_SIZE = 64 * 1024
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+class BlobTooLarge(ValueError):
+    pass
+
+class BlobStore:
+    """
+    Local-disk, content-addressed file store.
+    A blob lives at <root>/ab/cd/<sha256>, so identical uploads share one
+    file and a stored blob never changes. Methods do blocking file IO and
+    are meant to be run in a worker thread.
+    """
+    def __init__(self, root: str):
+        self.root = root
+
+    @staticmethod
+    def is_valid_digest(digest: str) -> bool:
+        return bool(_DIGEST_RE.match(digest))
+
+    def path_for(self, digest: str) -> str:
+        if not self.is_valid_digest(digest):
+            raise ValueError("Invalid blob id")
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.isfile(self.path_for(digest))
+
+    def read_head(self, digest: str, size: int = 16) -> bytes:
+        """First bytes of a stored blob, for content type sniffing"""
+        with open(self.path_for(digest), "rb") as f:
+            return f.read(size)
+
+    def write_stream(self, fileobj: BinaryIO, max_bytes: int) -> Tuple[str, int]:
+        """Copy a file object into the store in chunks. Returns (sha256, size)."""
+        tmp_dir = os.path.join(self.root, "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = fileobj.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if size > max_bytes:
+                        raise BlobTooLarge(f"File exceeds {max_bytes} bytes")
+                    digest.update(chunk)
+                    out.write(chunk)
+
+            blob_id = digest.hexdigest()
+            final_path = self.path_for(blob_id)
+            if os.path.exists(final_path):
+                # Same content already stored
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+            return blob_id, size
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+blob_store = BlobStore(BLOB_STORAGE_DIR)
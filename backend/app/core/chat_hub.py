@@ -0,0 +1,68 @@
+# backend/app/core/chat_hub.py
+import asyncio
+from typing import Dict, Set, Any
+from fastapi import WebSocket
+
+class ChatHub:
+    """
+    In-process registry of open team chat sockets.
+    Subscribers are kept per team so a new message is pushed only to the
+    members that have that team's chat open. State lives in this process,
+    so it assumes a single app worker (as deployed on Render).
+    """
+    def __init__(self):
+        self._subscribers: Dict[int, Dict[WebSocket, int]] = {}
+        self._lock = asyncio.Lock()
+
+    async def subscribe(self, team_id: int, user_id: int, websocket: WebSocket) -> None:
+        async with self._lock:
+            self._subscribers.setdefault(team_id, {})[websocket] = user_id
+
+    async def unsubscribe(self, team_id: int, websocket: WebSocket) -> None:
+        async with self._lock:
+            sockets = self._subscribers.get(team_id)
+            if sockets is None:
+                return
+            sockets.pop(websocket, None)
+            if not sockets:
+                del self._subscribers[team_id]
+
+    async def broadcast(self, team_id: int, payload: Dict[str, Any]) -> None:
+        """Push an event to every socket subscribed to the team"""
+        async with self._lock:
+            sockets = list(self._subscribers.get(team_id, {}))
+        stale: Set[WebSocket] = set()
+        for ws in sockets:
+            try:
+                await ws.send_json(payload)
+            except Exception:
+                stale.add(ws)
+        for ws in stale:
+            await self.unsubscribe(team_id, ws)
+
+    async def disconnect_user(self, team_id: int, user_id: int) -> None:
+        """Close a user's sockets for a team (e.g. after they leave it)"""
+        async with self._lock:
+            sockets = self._subscribers.get(team_id, {})
+            targets = [ws for ws, uid in sockets.items() if uid == user_id]
+        for ws in targets:
+            try:
+                await ws.close(code=4403)
+            except Exception:
+                pass
+            await self.unsubscribe(team_id, ws)
+
+    async def disconnect_team(self, team_id: int) -> None:
+        """Close every socket for a team (e.g. after it is deleted)"""
+        async with self._lock:
+            targets = list(self._subscribers.pop(team_id, {}))
+        for ws in targets:
+            try:
+                await ws.close(code=4404)
+            except Exception:
+                pass
+
+    def connection_count(self, team_id: int) -> int:
+        return len(self._subscribers.get(team_id, {}))
+
+chat_hub = ChatHub()
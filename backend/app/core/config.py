@@ -5,4 +5,62 @@ from datetime import timedelta
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-change-me")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 12  # 12 hours
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./taskflow.db")
\ No newline at end of file
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./taskflow.db")
+# SQLite connection PRAGMAs applied to every pooled connection (see SQLITE_PROFILES)
+DB_PROFILE = os.getenv("DB_PROFILE", "performance")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+SQLITE_PROFILES = {
+    # SQLite defaults: rollback journal, full fsync, fail immediately when locked
+    "default": {},
+    # WAL lets readers run alongside the writer; NORMAL sync is durable in WAL
+    # mode except for the last transactions on power loss
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negative = KiB, i.e. 64MB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms to wait for a lock before "database is locked"
+    },
+}
+
+# Chat attachments are stored on local disk, addressed by their SHA-256
+BLOB_STORAGE_DIR = os.getenv("BLOB_STORAGE_DIR", "./blobs")
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))  # 10MB
+
+# Verified tokens and user rows are cached in-process by the auth dependencies
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+# bcrypt cost factor and the size of the thread pool that runs it
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+
+# Invite picker: results per page and how long a repeated query is served from memory
+USER_SEARCH_MAX_RESULTS = int(os.getenv("USER_SEARCH_MAX_RESULTS", "20"))
+USER_SEARCH_CACHE_TTL_SECONDS = int(os.getenv("USER_SEARCH_CACHE_TTL_SECONDS", "15"))
+
+# Log a warning (and count it on /metrics) when one request issues more SQL statements than this
+SQL_STATEMENT_WARN_THRESHOLD = int(os.getenv("SQL_STATEMENT_WARN_THRESHOLD", "25"))
+
+# Background reminders for tasks that are due soon or overdue
+REMINDERS_ENABLED = os.getenv("REMINDERS_ENABLED", "true").lower() in ("1", "true", "yes")
+REMINDER_SCAN_INTERVAL_SECONDS = int(os.getenv("REMINDER_SCAN_INTERVAL_SECONDS", "300"))
+REMINDER_LEAD_HOURS = int(os.getenv("REMINDER_LEAD_HOURS", "24"))
+REMINDER_OVERDUE_LOOKBACK_DAYS = int(os.getenv("REMINDER_OVERDUE_LOOKBACK_DAYS", "7"))
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "500"))
+
+# Notification fan-out: how often queued events are expanded, and how many per transaction
+OUTBOX_POLL_SECONDS = int(os.getenv("OUTBOX_POLL_SECONDS", "2"))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "200"))
+
+# Seconds between keep-alive comments on an idle /notifications/stream
+NOTIFICATION_STREAM_HEARTBEAT_SECONDS = int(os.getenv("NOTIFICATION_STREAM_HEARTBEAT_SECONDS", "25"))
+
+# Retention: delete read notifications and answered invitations older than this many days (0 keeps them)
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+INVITATION_RETENTION_DAYS = int(os.getenv("INVITATION_RETENTION_DAYS", "30"))
+RETENTION_INTERVAL_HOURS = int(os.getenv("RETENTION_INTERVAL_HOURS", "6"))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "1000"))
@@ -0,0 +1,32 @@
+# backend/app/core/counter_cache.py
+import time
+from typing import Dict, Optional, Tuple
+
+class UserCounterCache:
+    """
+    In-process cache of per-user badge counters (unread notifications,
+    pending invitations). Repositories invalidate a user's entry whenever
+    they write a row that changes one of the counts; the TTL only bounds
+    staleness from writes made by other processes.
+    """
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[int, Tuple[float, Dict[str, int]]] = {}
+
+    def get(self, user_id: int) -> Optional[Dict[str, int]]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, counts = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        return counts
+
+    def set(self, user_id: int, counts: Dict[str, int]) -> None:
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, counts)
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+user_counters = UserCounterCache()
@@ -0,0 +1,86 @@
+# backend/app/core/metrics.py
+import time
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import Counter, Histogram
+from app.core.config import SQL_STATEMENT_WARN_THRESHOLD
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Request latency", ["method", "route", "status"],
+)
+REQUEST_STATEMENTS = Histogram(
+    "http_request_sql_statements", "SQL statements issued per request", ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per request", ["method", "route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+REQUEST_DB_ROWS = Histogram(
+    "http_request_db_rows", "Rows returned or changed by SQL per request", ["method", "route"],
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000, 10000),
+)
+STATEMENT_WARNINGS = Counter(
+    "http_request_sql_statement_warnings_total", "Requests over the SQL statement threshold", ["method", "route"],
+)
+
+class RequestStats:
+    """SQL done on behalf of one request, filled in by the engine hooks in db.py"""
+    __slots__ = ("statements", "db_seconds", "rows")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+
+# Stats of the request being served (None outside a request, e.g. startup)
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+def record_statement(seconds: float, rows: int) -> None:
+    stats = current_request.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += seconds
+        stats.rows += max(rows, 0)
+
+class MetricsMiddleware:
+    """
+    Times each HTTP request and records its SQL work, labelled by route
+    template (/tasks/{task_id}) so ids don't explode the label set.
+    Plain ASGI rather than BaseHTTPMiddleware: it adds no extra task, and
+    the request context (and so current_request) reaches the DB hooks.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            REQUEST_LATENCY.labels(method, path, str(status)).observe(time.perf_counter() - start)
+            REQUEST_STATEMENTS.labels(method, path).observe(stats.statements)
+            REQUEST_DB_TIME.labels(method, path).observe(stats.db_seconds)
+            REQUEST_DB_ROWS.labels(method, path).observe(stats.rows)
+            if stats.statements > SQL_STATEMENT_WARN_THRESHOLD:
+                STATEMENT_WARNINGS.labels(method, path).inc()
+                print(f"⚠️ {method} {path} issued {stats.statements} SQL statements "
+                      f"({stats.db_seconds * 1000:.1f} ms in the database, threshold {SQL_STATEMENT_WARN_THRESHOLD})")
@@ -0,0 +1,64 @@
+# backend/app/core/notification_hub.py
+import asyncio
+from typing import Dict, Set
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = "notification_stream_changes"
+
+class Listener:
+    """One open notification stream: the kinds of change since it last woke"""
+    __slots__ = ("changes", "wake")
+
+    def __init__(self):
+        self.changes: Set[str] = set()
+        self.wake = asyncio.Event()
+
+class NotificationHub:
+    """
+    In-process registry of open notification streams, per user.
+    Repositories mark the users whose notifications ("notifications") or
+    badge counts ("counts") they change; once that transaction commits the
+    user's streams are woken and re-read what changed. A stream with
+    nothing to report just sleeps, so idle sessions cost no queries. Like
+    ChatHub, this assumes a single app worker.
+    """
+    def __init__(self):
+        self._listeners: Dict[int, Set[Listener]] = {}
+
+    def subscribe(self, user_id: int) -> Listener:
+        listener = Listener()
+        self._listeners.setdefault(user_id, set()).add(listener)
+        return listener
+
+    def unsubscribe(self, user_id: int, listener: Listener) -> None:
+        listeners = self._listeners.get(user_id)
+        if listeners is None:
+            return
+        listeners.discard(listener)
+        if not listeners:
+            del self._listeners[user_id]
+
+    def publish(self, user_id: int, *kinds: str) -> None:
+        for listener in self._listeners.get(user_id, ()):
+            listener.changes.update(kinds)
+            listener.wake.set()
+
+    def touch(self, session, user_id: int, *kinds: str) -> None:
+        """Publish `kinds` for the user when the session's current transaction commits"""
+        if user_id in self._listeners:
+            session.info.setdefault(_PENDING_KEY, set()).update((user_id, kind) for kind in kinds)
+
+    def connection_count(self) -> int:
+        return sum(len(listeners) for listeners in self._listeners.values())
+
+notification_hub = NotificationHub()
+
+@event.listens_for(Session, "after_commit")
+def _publish_on_commit(session: Session) -> None:
+    for user_id, kind in session.info.pop(_PENDING_KEY, ()):
+        notification_hub.publish(user_id, kind)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,39 @@
+# backend/app/core/security.py
+import asyncio
+import hmac
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from passlib.context import CryptContext
+from app.core.config import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS
+
+def make_password_context(rounds: int = BCRYPT_ROUNDS) -> CryptContext:
+    # Hashes with a different cost are re-hashed on the next successful login
+    return CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds, deprecated="auto")
+
+pwd_context = make_password_context()
+
+# bcrypt is deliberately slow; running it on a bounded pool keeps the event
+# loop responsive and caps how many CPU cores a login spike can take
+_hash_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+
+async def hash_password(password: str, context: CryptContext = pwd_context) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, context.hash, password)
+
+async def verify_password(
+    password: str, stored: str, context: CryptContext = pwd_context
+) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password against the stored value.
+    Returns (matches, replacement_hash); replacement_hash is set when the
+    stored value should be upgraded, either because it is a legacy plaintext
+    password or because it was hashed with a different cost factor.
+    """
+    if context.identify(stored, required=False) is None:
+        # Legacy row from before passwords were hashed
+        if not hmac.compare_digest(password.encode(), stored.encode()):
+            return False, None
+        return True, await hash_password(password, context)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, context.verify_and_update, password, stored)
@@ -0,0 +1,13 @@
+# backend/app/core/tags.py
+from typing import List, Optional
+
+def normalize_tags(raw: Optional[str]) -> List[str]:
+    """Split a comma-separated tag string into unique, lowercased tags (order kept)"""
+    if not raw:
+        return []
+    seen = []
+    for part in raw.split(","):
+        tag = part.strip().lower()
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
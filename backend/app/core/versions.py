@@ -0,0 +1,43 @@
+# backend/app/core/versions.py
+import secrets
+from typing import Dict, Hashable, Iterable, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = "changed_versions"
+
+class VersionCounters:
+    """
+    In-process version numbers for polled reads, keyed like ("team", 7).
+    Repository writes mark the keys they change on their session; the
+    counters are bumped only once that transaction commits, so a reader
+    never sees a new version paired with old rows. The boot epoch makes
+    versions from a previous process run compare unequal.
+    """
+    def __init__(self):
+        self.epoch = secrets.token_hex(8)
+        self._versions: Dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> int:
+        return self._versions.get(key, 0)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(k, 0) for k in keys)
+
+    def bump(self, key: Hashable) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def touch(self, session, *keys: Hashable) -> None:
+        """Bump `keys` when the session's current transaction commits"""
+        session.info.setdefault(_PENDING_KEY, set()).update(keys)
+
+versions = VersionCounters()
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session: Session) -> None:
+    for key in session.info.pop(_PENDING_KEY, ()):
+        versions.bump(key)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,62 +1,80 @@
 # backend/app/db.py
+import time
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from app.core.config import DATABASE_URL
-import sqlite3
-import os
+from app.core.config import DATABASE_URL, DB_PROFILE, DB_POOL_SIZE, DB_MAX_OVERFLOW, SQLITE_PROFILES
+from app.core.metrics import record_statement
+from app.migrations import run_migrations
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+_is_sqlite = DATABASE_URL.startswith("sqlite")
+
+if _is_sqlite and DB_PROFILE not in SQLITE_PROFILES:
+    raise ValueError(f"Unknown DB_PROFILE '{DB_PROFILE}', expected one of {sorted(SQLITE_PROFILES)}")
+_pragmas = SQLITE_PROFILES[DB_PROFILE] if _is_sqlite else {}
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 Base = declarative_base()
 
-def apply_migrations():
-    """Apply migrations to add missing columns without deleting data"""
-    db_path = DATABASE_URL.replace('sqlite+aiosqlite:///', '')
-    
-    if not os.path.exists(db_path):
-        print("Database doesn't exist yet, will be created")
+@event.listens_for(engine.sync_engine, "connect")
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    if not _pragmas:
         return
-    
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    migrations = []
-    
-    # Check and add status column to team_members
-    try:
-        cursor.execute("PRAGMA table_info(team_members)")
-        columns = [col[1] for col in cursor.fetchall()]
-        
-        if 'status' not in columns:
-            cursor.execute("ALTER TABLE team_members ADD COLUMN status TEXT DEFAULT 'active'")
-            migrations.append("Added 'status' column to team_members")
-        
-        if 'left_at' not in columns:
-            cursor.execute("ALTER TABLE team_members ADD COLUMN left_at TEXT")
-            migrations.append("Added 'left_at' column to team_members")
-        
-        if migrations:
-            # Update existing members to active status
-            cursor.execute("UPDATE team_members SET status = 'active' WHERE status IS NULL")
-            conn.commit()
-    except Exception as e:
-        print(f"Migration error: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
-    
-    if migrations:
-        print("✅ Applied migrations:")
-        for m in migrations:
-            print(f"  - {m}")
+    cursor = dbapi_connection.cursor()
+    # journal_mode is stored in the database file; the rest are per connection
+    for name, value in _pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+    cursor.close()
+
+# Per-request SQL accounting for /metrics; outside a request record_statement is a no-op
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_start", []).append(time.perf_counter())
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["statement_start"].pop()
+    # The async adapters buffer SELECT results, so rowcount is only set for writes
+    rows = cursor.rowcount
+    if rows is None or rows < 0:
+        rows = len(getattr(cursor, "_rows", None) or ())
+    record_statement(elapsed, rows)
+
+async def _describe_engine() -> str:
+    if not _is_sqlite:
+        return f"pool_size={DB_POOL_SIZE} max_overflow={DB_MAX_OVERFLOW}"
+    settings = []
+    async with engine.connect() as conn:
+        for name in ("journal_mode", "synchronous", "mmap_size", "cache_size", "temp_store", "busy_timeout"):
+            value = (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar()
+            settings.append(f"{name}={value}")
+    return f"profile={DB_PROFILE} " + " ".join(settings) + f" pool_size={DB_POOL_SIZE} max_overflow={DB_MAX_OVERFLOW}"
 
 async def init_db():
-    # Apply any pending migrations first
-    apply_migrations()
-    
-    # create tables (sync operation via run_sync)
+    # Tables only join Base.metadata once their models are imported, so load
+    # them here rather than relying on the caller (app.main does, a bare
+    # `python -c` migration command does not)
+    import app.models.models  # noqa: F401
+
     async with engine.begin() as conn:
+        # create missing tables (sync operation via run_sync), then bring
+        # existing ones up to date with the versioned migrations
         await conn.run_sync(Base.metadata.create_all)
+        applied = await conn.run_sync(run_migrations)
+
+    if applied:
+        print("✅ Applied migrations:")
+        for m in applied:
+            print(f"  - {m}")
+
+    print(f"Database engine: {await _describe_engine()}")
 
 async def get_session():
     async with AsyncSessionLocal() as session:
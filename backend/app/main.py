@@ -1,10 +1,13 @@
 # backend/app/main.py
 import asyncio
 import os
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from app.db import init_db
-from app.api.routes import auth, teams, projects, tasks, invitations, notifications, messages
+from app.scheduler import start_scheduler, stop_scheduler
+from app.core.metrics import MetricsMiddleware
+from app.api.routes import auth, teams, projects, tasks, invitations, notifications, messages, ws, files, search, dashboard
 
 app = FastAPI(title="Task Manager API")
 
@@ -24,10 +27,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Outermost, so latency covers CORS handling too
+app.add_middleware(MetricsMiddleware)
+
 @app.on_event("startup")
 async def on_startup():
     # initialize DB (create tables)
     await init_db()
+    start_scheduler()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    stop_scheduler()
 
 @app.get("/")
 async def root():
@@ -44,6 +55,11 @@ async def health_check():
     """Health check endpoint for monitoring"""
     return {"status": "healthy"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint: latency, SQL statements, DB time and rows per route"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 # include routers
 app.include_router(auth.router)
 app.include_router(teams.router)
@@ -52,3 +68,7 @@ app.include_router(tasks.router)
 app.include_router(invitations.router, prefix="/invitations", tags=["invitations"])
 app.include_router(notifications.router, prefix="/notifications", tags=["notifications"])
 app.include_router(messages.router, prefix="/messages", tags=["messages"])
+app.include_router(files.router, prefix="/files", tags=["files"])
+app.include_router(search.router, prefix="/search", tags=["search"])
+app.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+app.include_router(ws.router)
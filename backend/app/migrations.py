@@ -0,0 +1,236 @@
+# backend/app/migrations.py
+"""
+Versioned schema migrations.
+
+Base.metadata.create_all builds new tables, but it never alters tables that
+already exist, so columns and indexes added later are applied here as
+ordered steps. Each applied step is recorded in schema_version. Steps are
+idempotent because a fresh database already has everything create_all
+produced; a step only has to catch up databases created by older code.
+"""
+import io
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import Table, Column, Integer, String, DateTime, MetaData, inspect, select, insert, text
+from sqlalchemy.engine import Connection
+from app.core.tags import normalize_tags
+
+_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+def _add_column(conn: Connection, table: str, column: str, ddl: str) -> bool:
+    columns = {c["name"] for c in inspect(conn).get_columns(table)}
+    if column in columns:
+        return False
+    conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    return True
+
+def _create_index(conn: Connection, name: str, table: str, columns: str, where: str = "") -> None:
+    conn.exec_driver_sql(
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})" + (f" WHERE {where}" if where else "")
+    )
+
+def _team_member_status(conn: Connection) -> None:
+    _add_column(conn, "team_members", "status", "TEXT DEFAULT 'active'")
+    _add_column(conn, "team_members", "left_at", "TEXT")
+    conn.exec_driver_sql("UPDATE team_members SET status = 'active' WHERE status IS NULL")
+
+def _profile_and_attachment_columns(conn: Connection) -> None:
+    _add_column(conn, "users", "profile_picture", "TEXT")
+    _add_column(conn, "teams", "description", "TEXT")
+    _add_column(conn, "teams", "created_at", "TEXT")
+    _add_column(conn, "team_messages", "file_url", "TEXT")
+    _add_column(conn, "team_messages", "file_name", "TEXT")
+    _add_column(conn, "team_messages", "file_type", "TEXT")
+
+def _notification_related_id(conn: Connection) -> None:
+    _add_column(conn, "notifications", "related_id", "INTEGER")
+
+def _team_active_member_count(conn: Connection) -> None:
+    if _add_column(conn, "teams", "active_member_count", "INTEGER NOT NULL DEFAULT 0"):
+        conn.exec_driver_sql("""
+            UPDATE teams SET active_member_count = (
+                SELECT COUNT(*) FROM team_members
+                WHERE team_members.team_id = teams.id AND team_members.status = 'active'
+            )
+        """)
+
+def _hot_path_indexes(conn: Connection) -> None:
+    _create_index(conn, "ix_tasks_project_id", "tasks", "project_id")
+    _create_index(conn, "ix_tasks_assignee_id", "tasks", "assignee_id")
+    _create_index(conn, "ix_tasks_created_by", "tasks", "created_by")
+    _create_index(conn, "ix_team_members_team_user_status", "team_members", "team_id, user_id, status")
+    _create_index(conn, "ix_team_messages_team_id_id", "team_messages", "team_id, id")
+    _create_index(conn, "ix_invitations_receiver_status", "invitations", "receiver_id, status")
+    # Superseded by the (user_id, is_read, created_at) index, which also serves the counters
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_notifications_user_id_is_read")
+    _create_index(conn, "ix_notifications_user_read_created", "notifications", "user_id, is_read, created_at")
+
+def _team_message_blob_id(conn: Connection) -> None:
+    _add_column(conn, "team_messages", "blob_id", "VARCHAR REFERENCES blobs (id)")
+
+def _team_message_blob_index(conn: Connection) -> None:
+    _create_index(conn, "ix_team_messages_blob_team", "team_messages", "blob_id, team_id", where="blob_id IS NOT NULL")
+
+def _backfill_message_blobs(conn: Connection) -> None:
+    # Attachments used to be stored inline in file_url as base64 data: URLs
+    # and sent with every history page. Write each into the blob store and
+    # keep only the reference; rows that don't decode are left untouched.
+    # Imported here because the service imports the models, which import app.db
+    from app.core.blob_store import blob_store
+    from app.services.file_service import decode_data_url, sniff_content_type
+
+    last_id = 0
+    while True:
+        # A page at a time: each row can hold megabytes of base64
+        rows = conn.execute(text(
+            "SELECT id, file_url, file_type FROM team_messages"
+            " WHERE file_url IS NOT NULL AND blob_id IS NULL AND id > :last_id ORDER BY id LIMIT 20"
+        ), {"last_id": last_id}).all()
+        if not rows:
+            return
+        for message_id, file_url, file_type in rows:
+            last_id = message_id
+            try:
+                raw, declared = decode_data_url(file_url, file_type)
+            except ValueError:
+                continue
+            blob_id, size = blob_store.write_stream(io.BytesIO(raw), len(raw))
+            content_type = sniff_content_type(raw[:16], declared)
+            conn.execute(text(
+                "INSERT INTO blobs (id, size, content_type, created_at) VALUES (:id, :size, :content_type, :now)"
+                " ON CONFLICT (id) DO NOTHING"
+            ), {"id": blob_id, "size": size, "content_type": content_type, "now": datetime.utcnow()})
+            conn.execute(text(
+                "UPDATE team_messages SET blob_id = :blob_id, file_url = NULL,"
+                " file_type = COALESCE(file_type, :content_type) WHERE id = :id"
+            ), {"blob_id": blob_id, "content_type": content_type, "id": message_id})
+
+def _task_status_due_index(conn: Connection) -> None:
+    _create_index(conn, "ix_tasks_status_due_date", "tasks", "status, due_date")
+
+def _backfill_task_tags(conn: Connection) -> None:
+    # task_tags itself is created by create_all; split the existing strings into it
+    rows = conn.execute(text("SELECT id, tags FROM tasks WHERE tags IS NOT NULL AND tags != ''")).all()
+    values = [{"task_id": task_id, "tag": tag} for task_id, raw in rows for tag in normalize_tags(raw)]
+    if values:
+        conn.execute(text("INSERT INTO task_tags (task_id, tag) VALUES (:task_id, :tag)"), values)
+
+# Full-text indexes: external-content FTS5 tables over the source rows, kept
+# in sync by triggers. Update triggers fire only when an indexed column changes.
+def _create_fts_table(conn: Connection, fts: str, table: str, columns: List[str], options: str = "") -> None:
+    cols = ", ".join(columns)
+    new_vals = ", ".join(f"new.{c}" for c in columns)
+    old_vals = ", ".join(f"old.{c}" for c in columns)
+    conn.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='id'{options})"
+    )
+    conn.exec_driver_sql(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new_vals});
+        END
+    """)
+    conn.exec_driver_sql(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+        END
+    """)
+    conn.exec_driver_sql(f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_vals});
+            INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new_vals});
+        END
+    """)
+    # Index rows that existed before the triggers
+    conn.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+def _full_text_search(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite":
+        return
+    _create_fts_table(conn, "tasks_fts", "tasks", ["title", "description"])
+    _create_fts_table(conn, "projects_fts", "projects", ["name", "description"])
+    _create_fts_table(conn, "team_messages_fts", "team_messages", ["message"])
+
+def _user_search_index(conn: Connection) -> None:
+    if conn.dialect.name != "sqlite":
+        return
+    # Case- and accent-folded tokens of name and code_id, with prefix indexes
+    # for the 2 and 3 character queries the invite picker starts with
+    _create_fts_table(
+        conn, "users_fts", "users", ["name", "code_id"],
+        ", tokenize='unicode61 remove_diacritics 2', prefix='2 3'",
+    )
+
+def _backfill_task_stats(conn: Connection) -> None:
+    # task_stats itself is created by create_all; count existing tasks into it
+    conn.exec_driver_sql("DELETE FROM task_stats")
+    conn.exec_driver_sql("""
+        INSERT INTO task_stats (scope, scope_id, status, due_day, count)
+        SELECT 'user', user_id, status, due_day, COUNT(*) FROM (
+            SELECT created_by AS user_id, COALESCE(status, 'todo') AS status,
+                   COALESCE(substr(due_date, 1, 10), '') AS due_day
+            FROM tasks WHERE created_by IS NOT NULL
+            UNION ALL
+            SELECT assignee_id, COALESCE(status, 'todo'), COALESCE(substr(due_date, 1, 10), '')
+            FROM tasks WHERE assignee_id IS NOT NULL AND (created_by IS NULL OR assignee_id != created_by)
+        ) AS t
+        GROUP BY user_id, status, due_day
+    """)
+    conn.exec_driver_sql("""
+        INSERT INTO task_stats (scope, scope_id, status, due_day, count)
+        SELECT 'project', project_id, COALESCE(status, 'todo'), COALESCE(substr(due_date, 1, 10), ''), COUNT(*)
+        FROM tasks WHERE project_id IS NOT NULL
+        GROUP BY project_id, COALESCE(status, 'todo'), COALESCE(substr(due_date, 1, 10), '')
+    """)
+
+def _notification_history_indexes(conn: Connection) -> None:
+    _create_index(conn, "ix_notifications_user_created_id", "notifications", "user_id, created_at, id")
+    # Partial indexes over just the rows the retention job may delete
+    _create_index(conn, "ix_notifications_read_created", "notifications", "created_at", where="is_read = 1")
+    _create_index(conn, "ix_invitations_processed_created", "invitations", "created_at", where="status != 'pending'")
+
+def _drop_reminder_watermarks(conn: Connection) -> None:
+    # Replaced by per-task task_reminders rows (created by create_all)
+    conn.exec_driver_sql("DROP TABLE IF EXISTS reminder_watermarks")
+
+# Append new steps at the end; never renumber or edit a released step
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "team_members status and left_at", _team_member_status),
+    (2, "profile picture, team details and chat attachment columns", _profile_and_attachment_columns),
+    (3, "notifications.related_id", _notification_related_id),
+    (4, "teams.active_member_count", _team_active_member_count),
+    (5, "hot-path foreign key and composite indexes", _hot_path_indexes),
+    (6, "team_messages.blob_id", _team_message_blob_id),
+    (7, "tasks (status, due_date) index", _task_status_due_index),
+    (8, "backfill task_tags from tasks.tags", _backfill_task_tags),
+    (9, "FTS5 indexes over tasks, projects and team chat", _full_text_search),
+    (10, "FTS5 prefix index over user name and code_id", _user_search_index),
+    (11, "backfill task_stats dashboard counters", _backfill_task_stats),
+    (12, "notification history and retention indexes", _notification_history_indexes),
+    (13, "drop reminder_watermarks", _drop_reminder_watermarks),
+    (14, "team_messages (blob_id, team_id) index", _team_message_blob_index),
+    (15, "move inline chat attachments into the blob store", _backfill_message_blobs),
+]
+
+def run_migrations(conn: Connection) -> List[str]:
+    """Apply pending steps in order. Returns descriptions of the steps applied."""
+    _metadata.create_all(conn)
+    applied_versions = set(conn.execute(select(schema_version.c.version)).scalars())
+
+    applied = []
+    for version, description, step in MIGRATIONS:
+        if version in applied_versions:
+            continue
+        step(conn)
+        conn.execute(insert(schema_version).values(
+            version=version, description=description, applied_at=datetime.utcnow()
+        ))
+        applied.append(f"{version:04d} {description}")
+    return applied
@@ -1,6 +1,6 @@
 # backend/app/models/models.py
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from app.db import Base
 
@@ -22,6 +22,8 @@ class Team(Base):
     description = Column(Text, nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Denormalized count of team_members with status 'active' (kept by TeamMemberRepo)
+    active_member_count = Column(Integer, nullable=False, default=0, server_default="0")
 
 class TeamMember(Base):
     __tablename__ = "team_members"
@@ -32,6 +34,10 @@ class TeamMember(Base):
     status = Column(String, default="active")  # active/left
     left_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index("ix_team_members_team_user_status", "team_id", "user_id", "status"),
+    )
+
 class Project(Base):
     __tablename__ = "projects"
     id = Column(Integer, primary_key=True, index=True)
@@ -42,19 +48,47 @@ class Project(Base):
 class Task(Base):
     __tablename__ = "tasks"
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    assignee_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     priority = Column(String, default="medium")  # low/medium/high
     status = Column(String, default="todo")      # todo/in-progress/done
     due_date = Column(DateTime, nullable=True)
     estimate_minutes = Column(Integer, nullable=True)
     tags = Column(String, nullable=True)
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Status filters with due-date ranges (task search, due/overdue scans)
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+    )
+
+class TaskTag(Base):
+    """One row per (task, tag); Task.tags keeps the text as entered"""
+    __tablename__ = "task_tags"
+    task_id = Column(Integer, ForeignKey("tasks.id"), primary_key=True)
+    tag = Column(String, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_task_tags_tag_task_id", "tag", "task_id"),
+    )
+
+class TaskStat(Base):
+    """
+    Task counts per scope (a user or a project), status and due day.
+    Maintained by TaskService on every task write so dashboards read a
+    handful of rows; due_day is YYYY-MM-DD, or "" for tasks without one.
+    """
+    __tablename__ = "task_stats"
+    scope = Column(String, primary_key=True)  # user/project
+    scope_id = Column(Integer, primary_key=True)
+    status = Column(String, primary_key=True)
+    due_day = Column(String, primary_key=True, default="")
+    count = Column(Integer, nullable=False, default=0)
+
 class Invitation(Base):
     __tablename__ = "invitations"
     id = Column(Integer, primary_key=True, index=True)
@@ -64,6 +98,13 @@ class Invitation(Base):
     status = Column(String, default="pending")  # pending/accepted/rejected
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_invitations_receiver_status", "receiver_id", "status"),
+        # Retention: answered invitations by age
+        Index("ix_invitations_processed_created", "created_at",
+              sqlite_where=text("status != 'pending'"), postgresql_where=text("status != 'pending'")),
+    )
+
 class Notification(Base):
     __tablename__ = "notifications"
     id = Column(Integer, primary_key=True, index=True)
@@ -71,9 +112,45 @@ class Notification(Base):
     title = Column(String, nullable=False)
     message = Column(Text, nullable=False)
     type = Column(String, default="info")  # info/success/warning/error
+    related_id = Column(Integer, nullable=True)
     is_read = Column(Integer, default=0)  # 0 = unread, 1 = read
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Notification list, unread counters and mark-all-read
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+        # Keyset pages of a user's history, newest first
+        Index("ix_notifications_user_created_id", "user_id", "created_at", "id"),
+        # Retention: read notifications by age
+        Index("ix_notifications_read_created", "created_at",
+              sqlite_where=text("is_read = 1"), postgresql_where=text("is_read = 1")),
+    )
+
+class TaskReminder(Base):
+    """
+    Which reminder each task has been sent, and for which due date. A task
+    is due a reminder again only when it is rescheduled. Written in the same
+    transaction as the notifications, so a reminder goes out once per task
+    and job even across restarts.
+    """
+    __tablename__ = "task_reminders"
+    task_id = Column(Integer, ForeignKey("tasks.id"), primary_key=True)
+    job = Column(String, primary_key=True)  # due_soon/overdue
+    due_date = Column(DateTime, nullable=False)
+    sent_at = Column(DateTime, default=datetime.utcnow)
+
+class OutboxEvent(Base):
+    """
+    Notification events appended by writers in the same transaction as the
+    change they describe. The fan-out job expands them into per-user
+    notifications and deletes them.
+    """
+    __tablename__ = "outbox_events"
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)  # task_assigned/task_updated/project_created
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 class Message(Base):
     __tablename__ = "messages"
     id = Column(Integer, primary_key=True, index=True)
@@ -89,7 +166,23 @@ class TeamMessage(Base):
     team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     message = Column(Text, nullable=True)
-    file_url = Column(String, nullable=True)
+    file_url = Column(String, nullable=True)  # legacy inline attachment the backfill couldn't move to blobs
+    blob_id = Column(String, ForeignKey("blobs.id"), nullable=True)
     file_name = Column(String, nullable=True)
     file_type = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # Keyset pagination of chat history (MessageRepo.get_by_team)
+        Index("ix_team_messages_team_id_id", "team_id", "id"),
+        # Which teams an attachment was posted to (download access check)
+        Index("ix_team_messages_blob_team", "blob_id", "team_id",
+              sqlite_where=text("blob_id IS NOT NULL"), postgresql_where=text("blob_id IS NOT NULL")),
+    )
+
+class Blob(Base):
+    __tablename__ = "blobs"
+    id = Column(String, primary_key=True)  # SHA-256 of the content
+    size = Column(Integer, nullable=False)
+    content_type = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,30 @@
+# backend/app/repositories/blob_repo.py
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.models import Blob
+
+class BlobRepo:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_id(self, blob_id: str) -> Optional[Blob]:
+        q = select(Blob).where(Blob.id == blob_id)
+        res = await self.session.execute(q)
+        return res.scalars().first()
+
+    async def get_or_create(self, blob_id: str, size: int, content_type: Optional[str]) -> Blob:
+        """
+        Content-addressed: an existing row for the same bytes is reused.
+        Concurrent identical uploads both reach the insert, so it is a no-op
+        on conflict and the row is read back either way.
+        """
+        blob = await self.get_by_id(blob_id)
+        if blob:
+            return blob
+        dialect = postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(Blob).values(id=blob_id, size=size, content_type=content_type)
+        await self.session.execute(stmt.on_conflict_do_nothing(index_elements=[Blob.id]))
+        await self.session.commit()
+        return await self.get_by_id(blob_id)
@@ -1,7 +1,10 @@
 # backend/app/repositories/invitation_repo.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func, delete
 from app.models.models import Invitation
+from app.core.counter_cache import user_counters
+from app.core.notification_hub import notification_hub
+from datetime import datetime
 from typing import List, Optional
 
 class InvitationRepo:
@@ -10,8 +13,10 @@ class InvitationRepo:
 
     async def create(self, invitation: Invitation) -> Invitation:
         self.db.add(invitation)
+        notification_hub.touch(self.db, invitation.receiver_id, "counts")
         await self.db.commit()
         await self.db.refresh(invitation)
+        user_counters.invalidate(invitation.receiver_id)
         return invitation
 
     async def get_by_id(self, invitation_id: int) -> Optional[Invitation]:
@@ -49,10 +54,33 @@ class InvitationRepo:
         return result.scalar_one_or_none()
 
     async def update(self, invitation: Invitation) -> Invitation:
+        notification_hub.touch(self.db, invitation.receiver_id, "counts")
         await self.db.commit()
         await self.db.refresh(invitation)
+        user_counters.invalidate(invitation.receiver_id)
         return invitation
 
     async def delete(self, invitation: Invitation) -> None:
+        notification_hub.touch(self.db, invitation.receiver_id, "counts")
         await self.db.delete(invitation)
         await self.db.commit()
+        user_counters.invalidate(invitation.receiver_id)
+
+    async def delete_processed_before(self, cutoff: datetime, limit: int) -> int:
+        """Delete up to `limit` accepted/rejected invitations created before cutoff (no commit)"""
+        oldest = (
+            select(Invitation.id)
+            .where(Invitation.status != "pending", Invitation.created_at < cutoff)
+            .order_by(Invitation.created_at)
+            .limit(limit)
+        )
+        result = await self.db.execute(delete(Invitation).where(Invitation.id.in_(oldest.scalar_subquery())))
+        return result.rowcount
+
+    async def count_pending_for_receiver(self, receiver_id: int) -> int:
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(Invitation)
+            .where(Invitation.receiver_id == receiver_id, Invitation.status == "pending")
+        )
+        return result.scalar_one()
@@ -0,0 +1,52 @@
+# backend/app/repositories/loader.py
+from typing import Dict, Iterable, Optional, Type
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.models.models import User, Team
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_CHUNK_SIZE = 500
+
+class EntityLoader:
+    """
+    Request-scoped batch loader for users and teams.
+    List endpoints collect the IDs they need and resolve them with one
+    WHERE id IN (...) query per entity type instead of one SELECT per row.
+    Results (including misses) are memoized for the rest of the request.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._cache: Dict[type, Dict[int, Optional[object]]] = {User: {}, Team: {}}
+
+    async def _load(self, model: Type, ids: Iterable[int]) -> Dict[int, object]:
+        cache = self._cache[model]
+        wanted = {i for i in ids if i is not None}
+        missing = [i for i in wanted if i not in cache]
+        for start in range(0, len(missing), _CHUNK_SIZE):
+            chunk = missing[start:start + _CHUNK_SIZE]
+            res = await self.session.execute(select(model).where(model.id.in_(chunk)))
+            for row in res.scalars().all():
+                cache[row.id] = row
+            for i in chunk:
+                cache.setdefault(i, None)
+        return {i: cache[i] for i in wanted if cache[i] is not None}
+
+    async def load_users(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        return await self._load(User, user_ids)
+
+    async def load_teams(self, team_ids: Iterable[int]) -> Dict[int, Team]:
+        return await self._load(Team, team_ids)
+
+    async def get_user(self, user_id: int) -> Optional[User]:
+        return (await self.load_users([user_id])).get(user_id)
+
+    async def get_team(self, team_id: int) -> Optional[Team]:
+        return (await self.load_teams([team_id])).get(team_id)
+
+def get_loader(session: AsyncSession) -> EntityLoader:
+    """Return the loader bound to this session (one session per request)"""
+    loader = session.info.get("entity_loader")
+    if loader is None:
+        loader = EntityLoader(session)
+        session.info["entity_loader"] = loader
+    return loader
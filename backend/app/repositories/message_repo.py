@@ -1,8 +1,9 @@
 # backend/app/repositories/message_repo.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.models import TeamMessage
+from sqlalchemy import select, exists
+from app.models.models import TeamMessage, TeamMember
 from typing import List, Optional
+from app.core.versions import versions
 
 class MessageRepo:
     def __init__(self, db: AsyncSession):
@@ -10,6 +11,7 @@ class MessageRepo:
 
     async def create(self, message: TeamMessage) -> TeamMessage:
         self.db.add(message)
+        versions.touch(self.db, ("team_messages", message.team_id))
         await self.db.commit()
         await self.db.refresh(message)
         return message
@@ -20,17 +22,43 @@ class MessageRepo:
         )
         return result.scalar_one_or_none()
 
-    async def get_by_team(self, team_id: int, limit: int = 100) -> List[TeamMessage]:
-        """Get messages for a team, ordered by creation time (newest first)"""
-        result = await self.db.execute(
-            select(TeamMessage)
-            .where(TeamMessage.team_id == team_id)
-            .order_by(TeamMessage.created_at.desc())
-            .limit(limit)
-        )
+    async def blob_visible_to(self, blob_id: str, user_id: int) -> bool:
+        """Whether the blob is attached to a message in a team the user is an active member of"""
+        q = select(exists().where(
+            TeamMessage.blob_id == blob_id,
+            TeamMember.team_id == TeamMessage.team_id,
+            TeamMember.user_id == user_id,
+            TeamMember.status == "active",
+        ))
+        result = await self.db.execute(q)
+        return bool(result.scalar())
+
+    async def get_by_team(
+        self,
+        team_id: int,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None
+    ) -> List[TeamMessage]:
+        """
+        Get messages for a team, oldest first for chat display.
+        Pages are keyed on message id (served by the (team_id, id) index):
+        after_id returns the next messages newer than that id, before_id the
+        page just older than it, and neither returns the latest messages.
+        """
+        q = select(TeamMessage).where(TeamMessage.team_id == team_id)
+        if before_id is not None:
+            q = q.where(TeamMessage.id < before_id)
+        if after_id is not None:
+            q = q.where(TeamMessage.id > after_id)
+            result = await self.db.execute(q.order_by(TeamMessage.id.asc()).limit(limit))
+            return list(result.scalars().all())
+
+        result = await self.db.execute(q.order_by(TeamMessage.id.desc()).limit(limit))
         messages = list(result.scalars().all())
         return list(reversed(messages))  # Return oldest first for chat display
 
     async def delete(self, message: TeamMessage) -> None:
+        versions.touch(self.db, ("team_messages", message.team_id))
         await self.db.delete(message)
         await self.db.commit()
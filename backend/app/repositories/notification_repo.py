@@ -1,8 +1,12 @@
 # backend/app/repositories/notification_repo.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, insert, delete, or_, and_
 from app.models.models import Notification
-from typing import List, Optional
+from app.core.counter_cache import user_counters
+from app.core.versions import versions
+from app.core.notification_hub import notification_hub
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 class NotificationRepo:
     def __init__(self, db: AsyncSession):
@@ -10,44 +14,122 @@ class NotificationRepo:
 
     async def create(self, notification: Notification) -> Notification:
         self.db.add(notification)
+        versions.touch(self.db, ("notifications", notification.user_id))
+        notification_hub.touch(self.db, notification.user_id, "notifications", "counts")
         await self.db.commit()
         await self.db.refresh(notification)
+        user_counters.invalidate(notification.user_id)
         return notification
 
+    async def add_many(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Insert many notifications with one executemany (no commit)"""
+        if not rows:
+            return
+        await self.db.execute(insert(Notification), list(rows))
+        versions.touch(self.db, *{("notifications", r["user_id"]) for r in rows})
+        for user_id in {r["user_id"] for r in rows}:
+            notification_hub.touch(self.db, user_id, "notifications", "counts")
+
     async def get_by_id(self, notification_id: int) -> Optional[Notification]:
         result = await self.db.execute(
             select(Notification).where(Notification.id == notification_id)
         )
         return result.scalar_one_or_none()
 
-    async def get_by_user(self, user_id: int, unread_only: bool = False) -> List[Notification]:
+    async def get_by_user(
+        self,
+        user_id: int,
+        unread_only: bool = False,
+        before: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+    ) -> List[Notification]:
+        """
+        A page of a user's notifications, newest first. `before` is the
+        (created_at, id) of the last row of the previous page; the seek runs
+        on ix_notifications_user_created_id (or the unread index).
+        """
         query = select(Notification).where(Notification.user_id == user_id)
         if unread_only:
             query = query.where(Notification.is_read == 0)
-        result = await self.db.execute(query.order_by(Notification.created_at.desc()))
+        if before is not None:
+            created_at, last_id = before
+            query = query.where(or_(
+                Notification.created_at < created_at,
+                and_(Notification.created_at == created_at, Notification.id < last_id),
+            ))
+        result = await self.db.execute(
+            query.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit)
+        )
         return list(result.scalars().all())
 
     async def mark_as_read(self, notification_id: int) -> Optional[Notification]:
         notification = await self.get_by_id(notification_id)
         if notification:
             notification.is_read = 1
+            versions.touch(self.db, ("notifications", notification.user_id))
+            notification_hub.touch(self.db, notification.user_id, "counts")
             await self.db.commit()
             await self.db.refresh(notification)
+            user_counters.invalidate(notification.user_id)
         return notification
 
     async def mark_all_as_read(self, user_id: int) -> int:
         """Mark all notifications as read for a user. Returns count of updated notifications."""
-        notifications = await self.get_by_user(user_id, unread_only=True)
-        for notif in notifications:
-            notif.is_read = 1
+        result = await self.db.execute(
+            update(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == 0)
+            .values(is_read=1)
+        )
+        versions.touch(self.db, ("notifications", user_id))
+        notification_hub.touch(self.db, user_id, "counts")
         await self.db.commit()
-        return len(notifications)
+        user_counters.invalidate(user_id)
+        return result.rowcount
 
     async def delete(self, notification: Notification) -> None:
+        versions.touch(self.db, ("notifications", notification.user_id))
+        notification_hub.touch(self.db, notification.user_id, "counts")
         await self.db.delete(notification)
         await self.db.commit()
+        user_counters.invalidate(notification.user_id)
+
+    async def list_after(self, user_id: int, after_id: int, limit: int) -> List[Notification]:
+        """A user's notifications newer than after_id, oldest first"""
+        result = await self.db.execute(
+            select(Notification)
+            .where(Notification.user_id == user_id, Notification.id > after_id)
+            .order_by(Notification.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def latest_id(self, user_id: int) -> int:
+        result = await self.db.execute(select(func.max(Notification.id)).where(Notification.user_id == user_id))
+        return result.scalar() or 0
+
+    async def delete_read_before(self, cutoff: datetime, limit: int) -> List[int]:
+        """
+        Delete up to `limit` read notifications created before cutoff (no
+        commit), oldest first. Returns the user id of each deleted row.
+        """
+        oldest = (
+            select(Notification.id)
+            .where(Notification.is_read == 1, Notification.created_at < cutoff)
+            .order_by(Notification.created_at)
+            .limit(limit)
+        )
+        result = await self.db.execute(
+            delete(Notification).where(Notification.id.in_(oldest.scalar_subquery())).returning(Notification.user_id)
+        )
+        user_ids = list(result.scalars().all())
+        versions.touch(self.db, *{("notifications", uid) for uid in user_ids})
+        return user_ids
 
     async def get_unread_count(self, user_id: int) -> int:
         """Get count of unread notifications for a user"""
-        notifications = await self.get_by_user(user_id, unread_only=True)
-        return len(notifications)
+        result = await self.db.execute(
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == 0)
+        )
+        return result.scalar_one()
@@ -0,0 +1,37 @@
+# backend/app/repositories/outbox_repo.py
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert
+from app.models.models import OutboxEvent
+
+class OutboxRepo:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def add(self, kind: str, **payload: Any) -> None:
+        """Queue one event; it is written with the caller's transaction (no commit)"""
+        self.session.add(OutboxEvent(kind=kind, payload=json.dumps(payload), created_at=datetime.utcnow()))
+
+    async def add_many(self, events: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        """Queue many events with one executemany (no commit)"""
+        if not events:
+            return
+        now = datetime.utcnow()
+        await self.session.execute(insert(OutboxEvent), [
+            {"kind": kind, "payload": json.dumps(payload), "created_at": now} for kind, payload in events
+        ])
+
+    async def next_batch(self, limit: int) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """Oldest pending events as (id, kind, payload)"""
+        result = await self.session.execute(
+            select(OutboxEvent.id, OutboxEvent.kind, OutboxEvent.payload).order_by(OutboxEvent.id).limit(limit)
+        )
+        return [(event_id, kind, json.loads(payload)) for event_id, kind, payload in result.all()]
+
+    async def remove(self, event_ids: Iterable[int]) -> int:
+        """Delete processed events (no commit). Returns how many were still there."""
+        ids = list(event_ids)
+        result = await self.session.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(ids)))
+        return result.rowcount
@@ -1,8 +1,9 @@
 # backend/app/repositories/project_repo.py
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.models import Project
+from sqlalchemy import select, and_
+from app.models.models import Project, TeamMember
+from app.core.versions import versions
 
 class ProjectRepo:
     def __init__(self, session: AsyncSession):
@@ -10,6 +11,7 @@ class ProjectRepo:
 
     async def create(self, project: Project) -> Project:
         self.session.add(project)
+        versions.touch(self.session, ("team", project.team_id))
         await self.session.commit()
         await self.session.refresh(project)
         return project
@@ -48,12 +50,35 @@ class ProjectRepo:
         res = await self.session.execute(q)
         return res.scalars().first()
 
+    async def list_by_ids(self, project_ids: Iterable[int]) -> List[Project]:
+        res = await self.session.execute(select(Project).where(Project.id.in_(list(project_ids))))
+        return res.scalars().all()
+
+    async def access_for_user(self, user_id: int, project_ids: Iterable[int]) -> Dict[int, bool]:
+        """
+        project id -> whether the user may add tasks to it (projects without a
+        team are open). Projects that don't exist are left out.
+        """
+        q = (
+            select(Project.id, Project.team_id, TeamMember.id)
+            .outerjoin(TeamMember, and_(
+                TeamMember.team_id == Project.team_id,
+                TeamMember.user_id == user_id,
+                TeamMember.status == "active",
+            ))
+            .where(Project.id.in_(list(project_ids)))
+        )
+        res = await self.session.execute(q)
+        return {pid: team_id is None or member_id is not None for pid, team_id, member_id in res.all()}
+
     async def update(self, project: Project) -> Project:
         self.session.add(project)
+        versions.touch(self.session, ("team", project.team_id), ("project", project.id))
         await self.session.commit()
         await self.session.refresh(project)
         return project
 
     async def delete(self, project: Project) -> None:
+        versions.touch(self.session, ("team", project.team_id), ("project", project.id))
         await self.session.delete(project)
         await self.session.commit()
@@ -0,0 +1,61 @@
+# backend/app/repositories/reminder_repo.py
+from datetime import datetime
+from typing import Dict, List, Sequence, Set
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, exists
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from app.models.models import Task, TaskReminder
+
+class ReminderRepo:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def tasks_due(
+        self, job: str, due_after: datetime, due_until: datetime, statuses: Sequence[str], limit: int
+    ) -> List[Row]:
+        """
+        Open tasks due in (due_after, due_until] that have not had `job`'s
+        reminder for their current due date, soonest first. A range scan of
+        ix_tasks_status_due_date per status plus a primary-key probe of
+        task_reminders per task, so the cost follows the size of the window.
+        """
+        reminded = exists().where(
+            TaskReminder.task_id == Task.id,
+            TaskReminder.job == job,
+            TaskReminder.due_date == Task.due_date,
+        )
+        result = await self.session.execute(
+            select(Task.id, Task.title, Task.due_date, Task.assignee_id, Task.created_by)
+            .where(
+                Task.status.in_(statuses),
+                Task.due_date > due_after,
+                Task.due_date <= due_until,
+                ~reminded,
+            )
+            .order_by(Task.due_date, Task.id)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def claim(self, job: str, due_dates: Dict[int, datetime]) -> Set[int]:
+        """
+        Record `job`'s reminder for each task id -> due date (no commit).
+        Returns the ids actually claimed: a task another process marked for
+        the same due date in the meantime is left out.
+        """
+        if not due_dates:
+            return set()
+        dialect = postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(TaskReminder).values([
+            {"task_id": task_id, "job": job, "due_date": due, "sent_at": datetime.utcnow()}
+            for task_id, due in due_dates.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["task_id", "job"],
+            set_={"due_date": stmt.excluded.due_date, "sent_at": stmt.excluded.sent_at},
+            # Rescheduled tasks are reminded again; same due date means already sent
+            where=TaskReminder.due_date != stmt.excluded.due_date,
+        ).returning(TaskReminder.task_id)
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
@@ -0,0 +1,76 @@
+# backend/app/repositories/search_repo.py
+import html
+import re
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Teams the user is an active member of (owners have a member row too)
+_USER_TEAMS = "SELECT team_id FROM team_members WHERE user_id = :user_id AND status = 'active'"
+
+# snippet() wraps matches in control characters that can't be confused with
+# markup; the text is HTML-escaped before they are turned into <mark> tags
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+
+def render_snippet(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escape an FTS snippet and mark its matches with <mark> tags"""
+    if snippet is None:
+        return None
+    return html.escape(snippet).replace(_MARK_OPEN, "<mark>").replace(_MARK_CLOSE, "</mark>")
+
+def to_fts_query(query: str) -> Optional[str]:
+    """
+    Turn free text into a safe FTS5 MATCH expression: every word must
+    match, as a prefix. Returns None if the text has no searchable words.
+    """
+    words = _WORD_RE.findall(query)
+    if not words:
+        return None
+    return " ".join(f'"{w}"*' for w in words)
+
+class SearchRepo:
+    """Ranked full-text search over the FTS5 tables built by the migrations"""
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _run(self, sql: str, **params) -> List[dict]:
+        res = await self.session.execute(text(sql), {**params, "mark_open": _MARK_OPEN, "mark_close": _MARK_CLOSE})
+        rows = [dict(row) for row in res.mappings().all()]
+        for row in rows:
+            row["snippet"] = render_snippet(row["snippet"])
+        return rows
+
+    async def search_tasks(self, user_id: int, match: str, limit: int) -> List[dict]:
+        return await self._run(f"""
+            SELECT t.id, t.title, t.project_id, t.status,
+                   snippet(tasks_fts, -1, :mark_open, :mark_close, '…', 12) AS snippet,
+                   bm25(tasks_fts) AS rank
+            FROM tasks_fts JOIN tasks t ON t.id = tasks_fts.rowid
+            WHERE tasks_fts MATCH :match
+              AND (t.created_by = :user_id OR t.assignee_id = :user_id
+                   OR t.project_id IN (SELECT id FROM projects WHERE team_id IN ({_USER_TEAMS})))
+            ORDER BY rank LIMIT :limit
+        """, match=match, user_id=user_id, limit=limit)
+
+    async def search_projects(self, user_id: int, match: str, limit: int) -> List[dict]:
+        return await self._run(f"""
+            SELECT p.id, p.name, p.team_id,
+                   snippet(projects_fts, -1, :mark_open, :mark_close, '…', 12) AS snippet,
+                   bm25(projects_fts) AS rank
+            FROM projects_fts JOIN projects p ON p.id = projects_fts.rowid
+            WHERE projects_fts MATCH :match AND p.team_id IN ({_USER_TEAMS})
+            ORDER BY rank LIMIT :limit
+        """, match=match, user_id=user_id, limit=limit)
+
+    async def search_messages(self, user_id: int, match: str, limit: int) -> List[dict]:
+        return await self._run(f"""
+            SELECT m.id, m.team_id, m.user_id, m.created_at,
+                   snippet(team_messages_fts, 0, :mark_open, :mark_close, '…', 12) AS snippet,
+                   bm25(team_messages_fts) AS rank
+            FROM team_messages_fts JOIN team_messages m ON m.id = team_messages_fts.rowid
+            WHERE team_messages_fts MATCH :match AND m.team_id IN ({_USER_TEAMS})
+            ORDER BY rank LIMIT :limit
+        """, match=match, user_id=user_id, limit=limit)
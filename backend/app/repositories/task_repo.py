@@ -1,15 +1,40 @@
 # backend/app/repositories/task_repo.py
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.models import Task
+from sqlalchemy import select, or_, and_, case, func, delete, insert, update, text as sql_text
+from app.models.models import Task, Project, TeamMember, TaskTag, TaskReminder
+from app.repositories.search_repo import to_fts_query
+from app.repositories.task_stats_repo import STAT_COLUMNS
+from app.core.versions import versions
+
+PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2}
+
+# Sort keys accepted by TaskRepo.search, as SQL expressions. Nullable columns
+# are coalesced so keyset comparisons never meet NULL (no due date sorts last).
+SORT_KEYS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "due_date": func.coalesce(Task.due_date, datetime(9999, 12, 31)),
+    "priority": case(PRIORITY_RANK, value=Task.priority, else_=1),
+    "title": Task.title,
+    "id": Task.id,
+}
 
 class TaskRepo:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, task: Task) -> Task:
+    def _touch_projects(self, project_ids: Iterable[Optional[int]]) -> None:
+        """Bump the task-list version of each project on commit"""
+        versions.touch(self.session, *[("project", pid) for pid in project_ids if pid is not None])
+
+    async def create(self, task: Task, tags: Optional[Sequence[str]] = None) -> Task:
         self.session.add(task)
+        self._touch_projects([task.project_id])
+        if tags:
+            await self.session.flush()  # assign task.id
+            await self.set_tags(task.id, tags)
         await self.session.commit()
         await self.session.refresh(task)
         return task
@@ -29,16 +54,90 @@ class TaskRepo:
         res = await self.session.execute(q)
         return res.scalars().all()
 
-    async def update(self, task: Task) -> Task:
+    async def update(self, task: Task, tags: Optional[Sequence[str]] = None) -> Task:
         self.session.add(task)
+        self._touch_projects([task.project_id])
+        if tags is not None:
+            await self.set_tags(task.id, tags)
         await self.session.commit()
         await self.session.refresh(task)
         return task
 
     async def delete(self, task: Task) -> None:
+        self._touch_projects([task.project_id])
+        await self.session.execute(delete(TaskTag).where(TaskTag.task_id == task.id))
+        await self.session.execute(delete(TaskReminder).where(TaskReminder.task_id == task.id))
         await self.session.delete(task)
         await self.session.commit()
 
+    async def set_tags(self, task_id: int, tags: Sequence[str]) -> None:
+        """Replace a task's task_tags rows in the caller's transaction (no commit)"""
+        await self.session.execute(delete(TaskTag).where(TaskTag.task_id == task_id))
+        if tags:
+            await self.session.execute(insert(TaskTag), [{"task_id": task_id, "tag": t} for t in tags])
+
+    async def replace_tags(self, tags_by_task: Dict[int, Sequence[str]]) -> None:
+        """set_tags for many tasks with one DELETE and one INSERT (no commit)"""
+        if not tags_by_task:
+            return
+        await self.session.execute(delete(TaskTag).where(TaskTag.task_id.in_(list(tags_by_task))))
+        rows = [{"task_id": task_id, "tag": t} for task_id, tags in tags_by_task.items() for t in tags]
+        if rows:
+            await self.session.execute(insert(TaskTag), rows)
+
+    async def get_stat_rows_visible_to(self, user_id: int, task_ids: Iterable[int]) -> Dict[int, tuple]:
+        """
+        task id -> (created_by, assignee_id, project_id, status, due_date),
+        for the given tasks that the user can see
+        """
+        q = select(Task.id, *STAT_COLUMNS).where(Task.id.in_(list(task_ids)), self.visible_to(user_id))
+        res = await self.session.execute(q)
+        return {row[0]: tuple(row[1:]) for row in res.all()}
+
+    async def list_by_ids(self, task_ids: Iterable[int]) -> List[Task]:
+        q = select(Task).where(Task.id.in_(list(task_ids))).execution_options(populate_existing=True)
+        res = await self.session.execute(q)
+        return res.scalars().all()
+
+    async def bulk_add(self, tasks: Sequence[Task]) -> None:
+        """Insert many tasks and assign their ids (no commit)"""
+        self.session.add_all(tasks)
+        self._touch_projects(t.project_id for t in tasks)
+        await self.session.flush()
+
+    async def bulk_update(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """Per-row updates keyed by "id", sent as one executemany (no commit)"""
+        if rows:
+            res = await self.session.execute(select(Task.project_id).where(Task.id.in_([r["id"] for r in rows])).distinct())
+            self._touch_projects(res.scalars().all())
+            await self.session.execute(update(Task), list(rows))
+
+    async def set_where_ids(self, task_ids: Iterable[int], **values) -> None:
+        """One UPDATE tasks SET ... WHERE id IN (...) (no commit)"""
+        q = update(Task).where(Task.id.in_(list(task_ids))).values(**values).returning(Task.project_id)
+        res = await self.session.execute(q.execution_options(synchronize_session=False))
+        self._touch_projects(set(res.scalars().all()))
+
+    async def delete_where_ids(self, task_ids: Iterable[int]) -> None:
+        """Delete tasks with their tags and reminder records (no commit)"""
+        ids = list(task_ids)
+        await self.session.execute(delete(TaskTag).where(TaskTag.task_id.in_(ids)))
+        await self.session.execute(delete(TaskReminder).where(TaskReminder.task_id.in_(ids)))
+        q = delete(Task).where(Task.id.in_(ids)).returning(Task.project_id)
+        res = await self.session.execute(q.execution_options(synchronize_session=False))
+        self._touch_projects(set(res.scalars().all()))
+
+    async def tag_counts(self, project_id: Optional[int] = None, team_id: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Per-tag task counts for a project or for all of a team's projects"""
+        q = select(TaskTag.tag, func.count().label("count")).join(Task, Task.id == TaskTag.task_id)
+        if project_id is not None:
+            q = q.where(Task.project_id == project_id)
+        if team_id is not None:
+            q = q.join(Project, Project.id == Task.project_id).where(Project.team_id == team_id)
+        q = q.group_by(TaskTag.tag).order_by(func.count().desc(), TaskTag.tag)
+        res = await self.session.execute(q)
+        return [(tag, count) for tag, count in res.all()]
+
     async def list_all_by_user(self, user_id: int) -> List[Task]:
         """Get all tasks created by or assigned to user"""
         q = select(Task).where(
@@ -46,3 +145,76 @@ class TaskRepo:
         )
         res = await self.session.execute(q)
         return res.scalars().all()
+
+    def visible_to(self, user_id: int):
+        """Tasks a user created, is assigned, or that belong to one of their teams' projects"""
+        team_projects = (
+            select(Project.id)
+            .join(TeamMember, TeamMember.team_id == Project.team_id)
+            .where(TeamMember.user_id == user_id, TeamMember.status == "active")
+        )
+        return or_(
+            Task.created_by == user_id,
+            Task.assignee_id == user_id,
+            Task.project_id.in_(team_projects),
+        )
+
+    async def search(
+        self,
+        user_id: int,
+        statuses: Optional[Sequence[str]] = None,
+        priorities: Optional[Sequence[str]] = None,
+        assignee_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+        due_from: Optional[datetime] = None,
+        due_to: Optional[datetime] = None,
+        tags: Optional[Sequence[str]] = None,
+        text: Optional[str] = None,
+        sort: str = "created_at",
+        descending: bool = True,
+        after: Optional[Tuple[Any, int]] = None,
+        limit: int = 50,
+    ) -> List[Task]:
+        """
+        Filter, sort and keyset-paginate the tasks visible to a user in one query.
+        `after` is the (sort value, id) of the last row of the previous page.
+        """
+        sort_expr = SORT_KEYS[sort]
+        q = select(Task).where(self.visible_to(user_id))
+        if statuses:
+            q = q.where(Task.status.in_(statuses))
+        if priorities:
+            q = q.where(Task.priority.in_(priorities))
+        if assignee_id is not None:
+            q = q.where(Task.assignee_id == assignee_id)
+        if project_id is not None:
+            q = q.where(Task.project_id == project_id)
+        if due_from is not None:
+            q = q.where(Task.due_date >= due_from)
+        if due_to is not None:
+            q = q.where(Task.due_date <= due_to)
+        for tag in tags or []:
+            # Seek on the (tag, task_id) index; every tag must match
+            q = q.where(Task.id.in_(select(TaskTag.task_id).where(TaskTag.tag == tag.strip().lower())))
+        if text:
+            match = to_fts_query(text) if self.session.bind.dialect.name == "sqlite" else None
+            if match:
+                fts_ids = sql_text("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH :match").bindparams(match=match)
+                q = q.where(Task.id.in_(fts_ids))
+            else:
+                pattern = f"%{text}%"
+                q = q.where(or_(Task.title.ilike(pattern), Task.description.ilike(pattern)))
+
+        if after is not None:
+            value, last_id = after
+            if descending:
+                q = q.where(or_(sort_expr < value, and_(sort_expr == value, Task.id < last_id)))
+            else:
+                q = q.where(or_(sort_expr > value, and_(sort_expr == value, Task.id > last_id)))
+
+        if descending:
+            q = q.order_by(sort_expr.desc(), Task.id.desc())
+        else:
+            q = q.order_by(sort_expr.asc(), Task.id.asc())
+        res = await self.session.execute(q.limit(limit))
+        return list(res.scalars().all())
@@ -0,0 +1,88 @@
+# backend/app/repositories/task_stats_repo.py
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, case, func, and_, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.models import Task, TaskStat
+
+StatKey = Tuple[str, int, str, str]
+
+# The task columns that decide which task_stats rows a task is counted in
+STAT_COLUMNS = (Task.created_by, Task.assignee_id, Task.project_id, Task.status, Task.due_date)
+
+def stat_keys(created_by: Optional[int], assignee_id: Optional[int], project_id: Optional[int],
+              status: Optional[str], due_date: Optional[datetime]) -> List[StatKey]:
+    """task_stats rows a task with these values counts towards"""
+    status = status or "todo"
+    due_day = str(due_date)[:10] if due_date else ""
+    keys = []
+    # A user's dashboard covers tasks they created or are assigned (counted once)
+    for user_id in {created_by, assignee_id} - {None}:
+        keys.append(("user", user_id, status, due_day))
+    if project_id is not None:
+        keys.append(("project", project_id, status, due_day))
+    return keys
+
+def stat_deltas(before: Iterable[tuple], after: Iterable[tuple]) -> Dict[StatKey, int]:
+    """Count changes for tasks moving from the `before` to the `after` column values"""
+    deltas: Counter = Counter()
+    for row in before:
+        for key in stat_keys(*row):
+            deltas[key] -= 1
+    for row in after:
+        for key in stat_keys(*row):
+            deltas[key] += 1
+    return {key: n for key, n in deltas.items() if n}
+
+class TaskStatsRepo:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply(self, deltas: Dict[StatKey, int]) -> None:
+        """Add count deltas with one upsert (no commit; runs in the caller's transaction)"""
+        if not deltas:
+            return
+        rows = [
+            {"scope": scope, "scope_id": scope_id, "status": status, "due_day": due_day, "count": n}
+            for (scope, scope_id, status, due_day), n in deltas.items()
+        ]
+        dialect = postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(TaskStat)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope", "scope_id", "status", "due_day"],
+            set_={"count": TaskStat.count + stmt.excluded.count},
+        )
+        await self.session.execute(stmt, rows)
+        if any(n < 0 for n in deltas.values()):
+            # Drop rows that reached zero so old due days don't pile up
+            ids_by_scope: Dict[str, set] = {}
+            for scope, scope_id, _, _ in deltas:
+                ids_by_scope.setdefault(scope, set()).add(scope_id)
+            await self.session.execute(delete(TaskStat).where(
+                TaskStat.count <= 0,
+                or_(*[and_(TaskStat.scope == scope, TaskStat.scope_id.in_(ids)) for scope, ids in ids_by_scope.items()]),
+            ))
+
+    async def summarize(self, scope: str, scope_ids: Iterable[int], today: date, week_end: date) -> List[tuple]:
+        """
+        (scope_id, status, total, overdue, due_this_week) per scope and status,
+        from one grouped query. Done tasks are never overdue or due.
+        """
+        today_s, week_end_s = today.isoformat(), week_end.isoformat()
+        open_task = TaskStat.status != "done"
+        has_due = TaskStat.due_day != ""
+        q = (
+            select(
+                TaskStat.scope_id,
+                TaskStat.status,
+                func.sum(TaskStat.count),
+                func.sum(case((and_(open_task, has_due, TaskStat.due_day < today_s), TaskStat.count), else_=0)),
+                func.sum(case((and_(open_task, TaskStat.due_day >= today_s, TaskStat.due_day < week_end_s), TaskStat.count), else_=0)),
+            )
+            .where(TaskStat.scope == scope, TaskStat.scope_id.in_(list(scope_ids)))
+            .group_by(TaskStat.scope_id, TaskStat.status)
+        )
+        res = await self.session.execute(q)
+        return [tuple(row) for row in res.all()]
@@ -1,8 +1,21 @@
 # backend/app/repositories/team_repo.py
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.models import Team, TeamMember, User
+from sqlalchemy import select, update
+from app.models.models import Team, TeamMember
+from app.repositories.loader import get_loader
+from app.core.versions import versions
+from app.core.chat_hub import chat_hub
+
+async def touch_team(session: AsyncSession, team_id: int) -> None:
+    """
+    Mark a team's version, and the team list of each active member, as
+    changed when the caller's transaction commits.
+    """
+    res = await session.execute(
+        select(TeamMember.user_id).where(TeamMember.team_id == team_id, TeamMember.status == "active")
+    )
+    versions.touch(session, ("team", team_id), *[("user", uid) for uid in res.scalars().all()])
 
 class TeamRepo:
     def __init__(self, session: AsyncSession):
@@ -21,38 +34,37 @@ class TeamRepo:
 
     async def list_for_user(self, user_id: int) -> List[dict]:
         """Get teams for user with member count - only active members"""
-        q = select(Team).join(TeamMember, Team.id == TeamMember.team_id).where(
-            TeamMember.user_id == user_id,
-            TeamMember.status == "active"
+        q = (
+            select(Team)
+            .join(TeamMember, Team.id == TeamMember.team_id)
+            .where(TeamMember.user_id == user_id, TeamMember.status == "active")
+            .group_by(Team.id)
         )
         res = await self.session.execute(q)
         teams = res.scalars().all()
         
-        result = []
-        for team in teams:
-            # Count members for this team
-            member_q = select(TeamMember).where(TeamMember.team_id == team.id)
-            member_res = await self.session.execute(member_q)
-            member_count = len(member_res.scalars().all())
-            
-            result.append({
+        return [
+            {
                 "id": team.id,
                 "name": team.name,
                 "owner_id": team.owner_id,
                 "team_code": team.team_code,
                 "description": team.description,
                 "created_at": team.created_at.isoformat() if team.created_at else None,
-                "member_count": member_count
-            })
-        return result
+                "member_count": team.active_member_count
+            }
+            for team in teams
+        ]
 
     async def update(self, team: Team) -> Team:
         self.session.add(team)
+        await touch_team(self.session, team.id)
         await self.session.commit()
         await self.session.refresh(team)
         return team
 
     async def delete(self, team: Team) -> None:
+        await touch_team(self.session, team.id)
         await self.session.delete(team)
         await self.session.commit()
 
@@ -68,21 +80,30 @@ class TeamRepo:
         res = await self.session.execute(q)
         return res.scalars().all()
 
+    async def active_member_ids(self, team_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """team id -> user ids of its active members, for many teams in one query"""
+        res = await self.session.execute(
+            select(TeamMember.team_id, TeamMember.user_id)
+            .where(TeamMember.team_id.in_(list(team_ids)), TeamMember.status == "active")
+        )
+        members: Dict[int, List[int]] = {}
+        for team_id, user_id in res.all():
+            members.setdefault(team_id, []).append(user_id)
+        return members
+
     async def get_team_members_with_user_details(self, team_id: int, include_left: bool = True) -> dict:
         """Get team members with user information, grouped by status"""
-        from sqlalchemy.orm import selectinload
         q = select(TeamMember).where(TeamMember.team_id == team_id)
         res = await self.session.execute(q)
         members = res.scalars().all()
         
-        # Get user details for each member
+        # Get user details for all members in one batch
+        users = await get_loader(self.session).load_users(m.user_id for m in members)
         active_members = []
         past_members = []
         
         for member in members:
-            user_q = select(User).where(User.id == member.user_id)
-            user_res = await self.session.execute(user_q)
-            user = user_res.scalars().first()
+            user = users.get(member.user_id)
             if user:
                 member_data = {
                     "id": member.id,
@@ -112,6 +133,8 @@ class TeamMemberRepo:
 
     async def add(self, member: TeamMember):
         self.session.add(member)
+        if member.status in (None, "active"):
+            await self.adjust_active_count(member.team_id, 1)
         await self.session.commit()
         await self.session.refresh(member)
         return member
@@ -126,13 +149,28 @@ class TeamMemberRepo:
         return res.scalars().first() is not None
 
     async def remove_member(self, team_id: int, user_id: int) -> None:
-        """Mark a member as left instead of deleting"""
+        """Mark a member as left instead of deleting, and close their chat sockets"""
         from datetime import datetime
         q = select(TeamMember).where(TeamMember.team_id == team_id, TeamMember.user_id == user_id)
         res = await self.session.execute(q)
         member = res.scalars().first()
         if member:
+            if member.status == "active":
+                await self.adjust_active_count(team_id, -1)
             member.status = "left"
             member.left_at = datetime.utcnow()
             self.session.add(member)
             await self.session.commit()
+        # Sockets only check membership on connect, so drop any still open
+        await chat_hub.disconnect_user(team_id, user_id)
+
+    async def adjust_active_count(self, team_id: int, delta: int) -> None:
+        """Shift teams.active_member_count in the caller's transaction (no commit)"""
+        # Runs before a leaving member's status changes and after a joining
+        # member is added (autoflush), so either way they get the new version
+        await touch_team(self.session, team_id)
+        await self.session.execute(
+            update(Team)
+            .where(Team.id == team_id)
+            .values(active_member_count=Team.active_member_count + delta)
+        )
@@ -1,8 +1,11 @@
 # backend/app/repositories/user_repo.py
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, case, Integer, Float, text
 from app.models.models import User
+from app.core.auth_cache import user_cache, user_search_cache
+from app.core.versions import versions
+from app.repositories.search_repo import to_fts_query
 
 class UserRepo:
     def __init__(self, session: AsyncSession):
@@ -12,6 +15,7 @@ class UserRepo:
         self.session.add(user)
         await self.session.commit()
         await self.session.refresh(user)
+        user_search_cache.clear()
         return user
 
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -30,17 +34,37 @@ class UserRepo:
         return res.scalars().first()
 
     async def update(self, user: User) -> User:
+        # Names and pictures are embedded in member and chat listings
+        versions.touch(self.session, ("users",))
         await self.session.commit()
         await self.session.refresh(user)
+        user_cache.invalidate(user.id)
+        user_search_cache.clear()
         return user
 
-    async def search_users(self, query: str) -> List[User]:
-        """Search users by name or code_id"""
-        q = select(User).where(
-            or_(
-                User.name.ilike(f"%{query}%"),
-                User.code_id.ilike(f"%{query}%")
+    async def search_users(self, query: str, exclude_user_id: Optional[int] = None, limit: int = 20, offset: int = 0) -> List[User]:
+        """
+        Search users by word prefix of name or code_id.
+        An exact code_id match ranks first, then the best text matches.
+        """
+        exact_code = case((User.code_id == query.strip().upper(), 0), else_=1)
+        match = to_fts_query(query) if self.session.bind.dialect.name == "sqlite" else None
+        if match:
+            fts = (
+                text("SELECT rowid AS id, bm25(users_fts) AS rank FROM users_fts WHERE users_fts MATCH :match")
+                .bindparams(match=match)
+                .columns(id=Integer, rank=Float)
+                .subquery("users_fts_hits")
             )
-        )
-        res = await self.session.execute(q)
+            q = select(User).join(fts, fts.c.id == User.id).order_by(exact_code, fts.c.rank, User.id)
+        else:
+            q = select(User).where(
+                or_(
+                    User.name.ilike(f"%{query}%"),
+                    User.code_id.ilike(f"%{query}%")
+                )
+            ).order_by(exact_code, User.name, User.id)
+        if exclude_user_id is not None:
+            q = q.where(User.id != exclude_user_id)
+        res = await self.session.execute(q.limit(limit).offset(offset))
         return list(res.scalars().all())
@@ -0,0 +1,73 @@
+# backend/app/scheduler.py
+"""
+In-process background jobs, run by APScheduler on the app's event loop.
+Each job opens its own session; a failing run is logged and retried at the
+next interval. With several app processes every one runs the jobs, which
+is safe because reminders are claimed with a conditional upsert,
+outbox events are claimed by deleting them, and retention deletes are
+idempotent.
+"""
+from datetime import datetime, timezone
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from app.db import AsyncSessionLocal
+from app.services.reminder_service import ReminderService
+from app.services.notification_service import NotificationService
+from app.services.retention_service import RetentionService
+from app.core.config import (
+    REMINDERS_ENABLED, REMINDER_SCAN_INTERVAL_SECONDS, OUTBOX_POLL_SECONDS, RETENTION_INTERVAL_HOURS,
+)
+
+scheduler = AsyncIOScheduler(timezone=timezone.utc)
+
+async def send_task_reminders() -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            service = ReminderService(session)
+            due_soon = await service.send_due_soon()
+            overdue = await service.send_overdue()
+        if due_soon or overdue:
+            print(f"⏰ Sent {due_soon} due-soon and {overdue} overdue task reminders")
+    except Exception as e:
+        print(f"❌ Task reminder scan failed: {e}")
+
+async def fan_out_notifications() -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            await NotificationService(session).fan_out_pending()
+    except Exception as e:
+        print(f"❌ Notification fan-out failed: {e}")
+
+async def purge_old_history() -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            deleted = await RetentionService(session).purge()
+        if any(deleted.values()):
+            print(f"🧹 Deleted {deleted['notifications']} old notifications and {deleted['invitations']} old invitations")
+    except Exception as e:
+        print(f"❌ Retention purge failed: {e}")
+
+def start_scheduler() -> None:
+    scheduler.add_job(
+        fan_out_notifications, "interval",
+        seconds=OUTBOX_POLL_SECONDS,
+        id="notification_fan_out", replace_existing=True, max_instances=1, coalesce=True,
+    )
+    if REMINDERS_ENABLED:
+        scheduler.add_job(
+            send_task_reminders, "interval",
+            seconds=REMINDER_SCAN_INTERVAL_SECONDS,
+            id="task_reminders", replace_existing=True, max_instances=1, coalesce=True,
+            next_run_time=datetime.now(timezone.utc),
+        )
+    if RETENTION_INTERVAL_HOURS > 0:
+        scheduler.add_job(
+            purge_old_history, "interval",
+            hours=RETENTION_INTERVAL_HOURS,
+            id="retention_purge", replace_existing=True, max_instances=1, coalesce=True,
+            next_run_time=datetime.now(timezone.utc),
+        )
+    scheduler.start()
+
+def stop_scheduler() -> None:
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
@@ -1,5 +1,5 @@
 # backend/app/schemas/schemas.py
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -75,6 +75,8 @@ class TaskCreate(BaseModel):
     assignee_id: Optional[int] = None
     priority: Optional[str] = "medium"
     due_date: Optional[datetime] = None
+    estimate_minutes: Optional[int] = None
+    tags: Optional[str] = None
 
 class TaskOut(BaseModel):
     id: int
@@ -85,8 +87,49 @@ class TaskOut(BaseModel):
     priority: str
     status: str
     due_date: Optional[datetime]
+    estimate_minutes: Optional[int] = None
+    tags: Optional[str] = None
     created_by: Optional[int]
     created_at: datetime
     updated_at: Optional[datetime]
 
     model_config = {"from_attributes": True}
+
+class TaskPage(BaseModel):
+    items: List[TaskOut]
+    next_cursor: Optional[str] = None
+
+class TaskChanges(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    assignee_id: Optional[int] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+    due_date: Optional[datetime] = None
+    estimate_minutes: Optional[int] = None
+    tags: Optional[str] = None
+
+class BulkTaskOperation(BaseModel):
+    op: Literal["create", "update", "status", "assign", "delete"]
+    task_id: Optional[int] = None          # every op except create
+    task: Optional[TaskCreate] = None      # create
+    changes: Optional[TaskChanges] = None  # update
+    status: Optional[str] = None           # status
+    assignee_id: Optional[int] = None      # assign (null unassigns)
+
+class BulkTaskRequest(BaseModel):
+    operations: List[BulkTaskOperation] = Field(..., min_length=1, max_length=500)
+    # Apply nothing if any operation is rejected
+    atomic: bool = False
+
+class BulkTaskResult(BaseModel):
+    index: int
+    op: str
+    ok: bool
+    task_id: Optional[int] = None
+    error: Optional[str] = None
+    task: Optional[TaskOut] = None
+
+class BulkTaskResponse(BaseModel):
+    applied: int
+    results: List[BulkTaskResult]
@@ -0,0 +1,59 @@
+# backend/app/services/dashboard_service.py
+from datetime import datetime, timedelta
+from typing import Any, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, and_
+from app.models.models import Project, TeamMember
+from app.repositories.task_stats_repo import TaskStatsRepo
+
+STATUSES = ("todo", "in-progress", "done")
+
+def _empty_counts() -> Dict[str, Any]:
+    return {"total": 0, "by_status": {s: 0 for s in STATUSES}, "overdue": 0, "due_this_week": 0}
+
+class DashboardService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.stats_repo = TaskStatsRepo(session)
+
+    async def get_stats(self, user_id: int) -> Dict[str, Any]:
+        """
+        Task counts for the user (created or assigned) and completion per
+        project of the user's teams, read from the task_stats counters.
+        Overdue and due-this-week are by UTC day.
+        """
+        today = datetime.utcnow().date()
+        week_end = today + timedelta(days=7)
+
+        # Active teams with their projects (teams without projects come back with a NULL project)
+        res = await self.session.execute(
+            select(TeamMember.team_id, Project.id, Project.name)
+            .outerjoin(Project, Project.team_id == TeamMember.team_id)
+            .where(and_(TeamMember.user_id == user_id, TeamMember.status == "active"))
+            .order_by(Project.id)
+        )
+        rows = res.all()
+        team_ids = {team_id for team_id, _, _ in rows}
+        projects = {
+            project_id: {"id": project_id, "name": name, "team_id": team_id, **_empty_counts()}
+            for team_id, project_id, name in rows if project_id is not None
+        }
+
+        mine = _empty_counts()
+        for _, status, total, overdue, due_soon in await self.stats_repo.summarize("user", [user_id], today, week_end):
+            self._add(mine, status, total, overdue, due_soon)
+        if projects:
+            for project_id, status, total, overdue, due_soon in await self.stats_repo.summarize("project", projects, today, week_end):
+                self._add(projects[project_id], status, total, overdue, due_soon)
+        for p in projects.values():
+            p["completion"] = round(p["by_status"]["done"] / p["total"], 4) if p["total"] else 0.0
+
+        mine["completed"] = mine["by_status"]["done"]
+        return {"teams": len(team_ids), "tasks": mine, "projects": list(projects.values())}
+
+    @staticmethod
+    def _add(counts: Dict[str, Any], status: str, total: int, overdue: int, due_soon: int) -> None:
+        counts["total"] += total
+        counts["by_status"][status] = counts["by_status"].get(status, 0) + total
+        counts["overdue"] += overdue
+        counts["due_this_week"] += due_soon
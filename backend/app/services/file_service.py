@@ -0,0 +1,113 @@
+# backend/app/services/file_service.py
+import base64
+import io
+from typing import BinaryIO, Optional, Tuple
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.blob_store import blob_store, BlobTooLarge
+from app.core.config import MAX_UPLOAD_BYTES
+from app.repositories.blob_repo import BlobRepo
+from app.repositories.message_repo import MessageRepo
+from app.models.models import Blob
+
+# Images a browser may render inline, recognised by their leading bytes.
+# SVG is deliberately absent: it can carry script.
+_IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+INLINE_IMAGE_TYPES = frozenset(t for _, t in _IMAGE_SIGNATURES) | {"image/webp"}
+
+# Declared types kept as-is; they are only ever served as downloads
+ATTACHMENT_TYPES = frozenset({
+    "application/pdf",
+    "application/zip",
+    "application/msword",
+    "application/vnd.ms-excel",
+    "application/vnd.ms-powerpoint",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "text/plain",
+    "text/csv",
+    "audio/mpeg",
+    "video/mp4",
+})
+
+def sniff_content_type(head: bytes, declared: Optional[str]) -> str:
+    """
+    Content type recorded for an upload. The client's type is never trusted
+    for images: they are detected from the leading bytes. Anything else keeps
+    its declared type only if it is allow-listed, else octet-stream.
+    """
+    for signature, content_type in _IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    declared = (declared or "").split(";", 1)[0].strip().lower()
+    return declared if declared in ATTACHMENT_TYPES else "application/octet-stream"
+
+def decode_data_url(data: str, content_type: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """
+    Decode a legacy inline attachment (base64, optionally as a data: URL).
+    Returns (bytes, content type); raises ValueError if it isn't base64.
+    """
+    if data.startswith("data:") and "," in data:
+        header, data = data.split(",", 1)
+        content_type = content_type or header[5:].split(";", 1)[0] or None
+    return base64.b64decode(data, validate=True), content_type
+
+def served_content_type(content_type: Optional[str]) -> str:
+    """Type to send for a stored blob (rows from before sniffing may hold anything)"""
+    if content_type in INLINE_IMAGE_TYPES or content_type in ATTACHMENT_TYPES:
+        return content_type
+    return "application/octet-stream"
+
+def blob_url(blob_id: str) -> str:
+    """API path a client downloads an attachment from"""
+    return f"/files/{blob_id}"
+
+class FileService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = BlobRepo(session)
+        self.message_repo = MessageRepo(session)
+
+    async def store(self, fileobj: BinaryIO, content_type: Optional[str]) -> Blob:
+        """Stream a file into the blob store (off the event loop) and record it"""
+        try:
+            blob_id, size = await run_in_threadpool(blob_store.write_stream, fileobj, MAX_UPLOAD_BYTES)
+        except BlobTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        head = await run_in_threadpool(blob_store.read_head, blob_id)
+        return await self.repo.get_or_create(blob_id, size, sniff_content_type(head, content_type))
+
+    async def store_data_url(self, data: str, content_type: Optional[str]) -> Blob:
+        """Accept the legacy base64 / data: URL payload and store it as a blob"""
+        try:
+            raw, content_type = decode_data_url(data, content_type)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid file data")
+        return await self.store(io.BytesIO(raw), content_type)
+
+    async def get(self, blob_id: str) -> Blob:
+        if not blob_store.is_valid_digest(blob_id):
+            raise HTTPException(status_code=404, detail="File not found")
+        blob = await self.repo.get_by_id(blob_id)
+        if not blob or not blob_store.exists(blob_id):
+            raise HTTPException(status_code=404, detail="File not found")
+        return blob
+
+    async def get_for_user(self, blob_id: str, user_id: int) -> Blob:
+        """
+        A blob the user may download: one posted in a team they are an active
+        member of. Otherwise 404, so ids can't be probed for existence.
+        """
+        blob = await self.get(blob_id)
+        if not await self.message_repo.blob_visible_to(blob_id, user_id):
+            raise HTTPException(status_code=404, detail="File not found")
+        return blob
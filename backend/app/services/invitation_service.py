@@ -2,8 +2,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.invitation_repo import InvitationRepo
 from app.repositories.user_repo import UserRepo
-from app.repositories.team_repo import TeamRepo
+from app.repositories.team_repo import TeamRepo, TeamMemberRepo
+from app.repositories.loader import get_loader
 from app.models.models import Invitation, TeamMember
+from app.core.auth_cache import user_search_cache
+from app.core.config import USER_SEARCH_MAX_RESULTS
 from typing import List, Dict, Any
 from fastapi import HTTPException
 
@@ -13,6 +16,8 @@ class InvitationService:
         self.invitation_repo = InvitationRepo(db)
         self.user_repo = UserRepo(db)
         self.team_repo = TeamRepo(db)
+        self.member_repo = TeamMemberRepo(db)
+        self.loader = get_loader(db)
 
     async def create_invitation(
         self, sender_id: int, receiver_id: int, team_id: int
@@ -53,11 +58,15 @@ class InvitationService:
         self, user_id: int, status: str = None
     ) -> List[Dict[str, Any]]:
         invitations = await self.invitation_repo.get_by_receiver(user_id, status)
+        senders = await self.loader.load_users(inv.sender_id for inv in invitations)
+        teams = await self.loader.load_teams(inv.team_id for inv in invitations)
         
         result = []
         for inv in invitations:
-            sender = await self.user_repo.get_by_id(inv.sender_id)
-            team = await self.team_repo.get_by_id(inv.team_id)
+            sender = senders.get(inv.sender_id)
+            team = teams.get(inv.team_id)
+            if not sender or not team:
+                continue
             result.append({
                 "id": inv.id,
                 "sender": {"id": sender.id, "name": sender.name, "email": sender.email},
@@ -85,6 +94,7 @@ class InvitationService:
             role="member"
         )
         self.db.add(team_member)
+        await self.member_repo.adjust_active_count(invitation.team_id, 1)
         
         # Update invitation status
         invitation.status = "accepted"
@@ -110,11 +120,15 @@ class InvitationService:
 
     async def get_sent_invitations(self, sender_id: int) -> List[Dict[str, Any]]:
         invitations = await self.invitation_repo.get_by_sender(sender_id)
+        receivers = await self.loader.load_users(inv.receiver_id for inv in invitations)
+        teams = await self.loader.load_teams(inv.team_id for inv in invitations)
         
         result = []
         for inv in invitations:
-            receiver = await self.user_repo.get_by_id(inv.receiver_id)
-            team = await self.team_repo.get_by_id(inv.team_id)
+            receiver = receivers.get(inv.receiver_id)
+            team = teams.get(inv.team_id)
+            if not receiver or not team:
+                continue
             result.append({
                 "id": inv.id,
                 "receiver": {"id": receiver.id, "name": receiver.name, "email": receiver.email},
@@ -124,10 +138,17 @@ class InvitationService:
             })
         return result
 
-    async def search_users(self, query: str, current_user_id: int) -> List[Dict[str, Any]]:
+    async def search_users(self, query: str, current_user_id: int, limit: int = USER_SEARCH_MAX_RESULTS, offset: int = 0) -> List[Dict[str, Any]]:
         """Search users by name or code_id (excluding current user)"""
-        users = await self.user_repo.search_users(query)
-        return [
+        limit = min(limit, USER_SEARCH_MAX_RESULTS)
+        # The picker re-sends the same prefixes as the user types and backspaces
+        key = (" ".join(query.lower().split()), current_user_id, limit, offset)
+        cached = user_search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        users = await self.user_repo.search_users(query, current_user_id, limit, offset)
+        results = [
             {
                 "id": u.id,
                 "name": u.name,
@@ -135,5 +156,7 @@ class InvitationService:
                 "code_id": u.code_id,
                 "profile_picture": u.profile_picture
             }
-            for u in users if u.id != current_user_id
+            for u in users
         ]
+        user_search_cache.set(key, results)
+        return results
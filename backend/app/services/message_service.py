@@ -3,8 +3,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.message_repo import MessageRepo
 from app.repositories.team_repo import TeamRepo
 from app.repositories.user_repo import UserRepo
+from app.repositories.loader import get_loader
+from app.services.file_service import FileService, blob_url
 from app.models.models import TeamMessage
-from typing import List, Dict, Any
+from app.core.chat_hub import chat_hub
+from typing import List, Dict, Any, Optional
 from fastapi import HTTPException
 
 class MessageService:
@@ -13,17 +16,11 @@ class MessageService:
         self.message_repo = MessageRepo(db)
         self.team_repo = TeamRepo(db)
         self.user_repo = UserRepo(db)
+        self.loader = get_loader(db)
+        self.file_service = FileService(db)
 
-    async def send_message(
-        self, 
-        team_id: int, 
-        user_id: int, 
-        message_text: str,
-        file_data: str = None,
-        file_name: str = None,
-        file_type: str = None
-    ) -> Dict[str, Any]:
-        # Verify user is member of team
+    async def ensure_member(self, team_id: int, user_id: int) -> None:
+        """Raise unless the user is the team owner or an active member"""
         team = await self.team_repo.get_by_id(team_id)
         if not team:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -34,17 +31,38 @@ class MessageService:
         if user_id != team.owner_id and user_id not in member_ids:
             raise HTTPException(status_code=403, detail="Not a team member")
 
+    async def send_message(
+        self, 
+        team_id: int, 
+        user_id: int, 
+        message_text: str,
+        file_data: str = None,
+        file_name: str = None,
+        file_type: str = None,
+        file_id: str = None
+    ) -> Dict[str, Any]:
+        await self.ensure_member(team_id, user_id)
+
+        if file_data and not file_id:
+            # Legacy clients send the file inline; keep it out of the row
+            blob = await self.file_service.store_data_url(file_data, file_type)
+            file_id = blob.id
+        elif file_id:
+            blob = await self.file_service.get(file_id)
+        if file_id:
+            file_type = file_type or blob.content_type
+
         message = TeamMessage(
             team_id=team_id,
             user_id=user_id,
             message=message_text,
-            file_url=file_data,
+            blob_id=file_id,
             file_name=file_name,
             file_type=file_type
         )
         created_message = await self.message_repo.create(message)
         
-        user = await self.user_repo.get_by_id(user_id)
+        user = await self.loader.get_user(user_id)
         result = {
             "id": created_message.id,
             "team_id": created_message.team_id,
@@ -57,30 +75,35 @@ class MessageService:
             "created_at": created_message.created_at.isoformat()
         }
         
-        if file_data:
-            result["file_url"] = created_message.file_url
+        if created_message.blob_id:
+            result["file_url"] = blob_url(created_message.blob_id)
             result["file_name"] = created_message.file_name
             result["file_type"] = created_message.file_type
+
+        # Push to open chat sockets so connected members don't need to poll
+        await chat_hub.broadcast(team_id, {"type": "message", "data": result})
             
         return result
 
-    async def get_team_messages(self, team_id: int, user_id: int, limit: int = 100) -> List[Dict[str, Any]]:
-        # Verify user is member of team
-        team = await self.team_repo.get_by_id(team_id)
-        if not team:
-            raise HTTPException(status_code=404, detail="Team not found")
-        
-        team_members = await self.team_repo.get_team_members(team_id)
-        member_ids = [m.user_id for m in team_members]
-        
-        if user_id != team.owner_id and user_id not in member_ids:
-            raise HTTPException(status_code=403, detail="Not a team member")
+    async def get_team_messages(
+        self,
+        team_id: int,
+        user_id: int,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        await self.ensure_member(team_id, user_id)
 
-        messages = await self.message_repo.get_by_team(team_id, limit)
+        messages = await self.message_repo.get_by_team(team_id, limit, after_id=after_id, before_id=before_id)
         
+        users = await self.loader.load_users(m.user_id for m in messages)
+
         result = []
         for msg in messages:
-            user = await self.user_repo.get_by_id(msg.user_id)
+            user = users.get(msg.user_id)
+            if not user:
+                continue
             msg_data = {
                 "id": msg.id,
                 "team_id": msg.team_id,
@@ -93,8 +116,9 @@ class MessageService:
                 "created_at": msg.created_at.isoformat()
             }
             
-            if msg.file_url:
-                msg_data["file_url"] = msg.file_url
+            # file_url survives only on legacy rows the blob backfill couldn't decode
+            if msg.blob_id or msg.file_url:
+                msg_data["file_url"] = blob_url(msg.blob_id) if msg.blob_id else msg.file_url
                 msg_data["file_name"] = msg.file_name
                 msg_data["file_type"] = msg.file_type
                 
@@ -1,13 +1,26 @@
 # backend/app/services/notification_service.py
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.notification_repo import NotificationRepo
+from app.repositories.invitation_repo import InvitationRepo
+from app.repositories.outbox_repo import OutboxRepo
+from app.repositories.task_repo import TaskRepo
+from app.repositories.project_repo import ProjectRepo
+from app.repositories.team_repo import TeamRepo
+from app.repositories.loader import get_loader
+from app.core.counter_cache import user_counters
+from app.core.config import OUTBOX_BATCH_SIZE
 from app.models.models import Notification
-from typing import List, Dict, Any
+import base64
+import json
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 
 class NotificationService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.notification_repo = NotificationRepo(db)
+        self.invitation_repo = InvitationRepo(db)
+        self.outbox_repo = OutboxRepo(db)
 
     async def create_notification(
         self, user_id: int, type: str, title: str, message: str, related_id: int = None
@@ -22,20 +35,51 @@ class NotificationService:
         )
         return await self.notification_repo.create(notification)
 
-    async def get_notifications(self, user_id: int, unread_only: bool = False) -> List[Dict[str, Any]]:
-        notifications = await self.notification_repo.get_by_user(user_id, unread_only)
-        return [
-            {
-                "id": n.id,
-                "type": n.type,
-                "title": n.title,
-                "message": n.message,
-                "related_id": n.related_id,
-                "is_read": bool(n.is_read),
-                "created_at": n.created_at.isoformat()
-            }
-            for n in notifications
-        ]
+    @staticmethod
+    def _to_dict(n: Notification) -> Dict[str, Any]:
+        return {
+            "id": n.id,
+            "type": n.type,
+            "title": n.title,
+            "message": n.message,
+            "related_id": n.related_id,
+            "is_read": bool(n.is_read),
+            "created_at": n.created_at.isoformat()
+        }
+
+    async def get_notifications(
+        self, user_id: int, unread_only: bool = False, cursor: Optional[str] = None, limit: int = 50
+    ) -> Dict[str, Any]:
+        """A page of the user's notifications, newest first, plus the cursor for the next page"""
+        before = self._decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to learn whether another page exists
+        notifications = await self.notification_repo.get_by_user(user_id, unread_only, before=before, limit=limit + 1)
+        next_cursor = None
+        if len(notifications) > limit:
+            notifications = notifications[:limit]
+            next_cursor = self._encode_cursor(notifications[-1])
+        return {"items": [self._to_dict(n) for n in notifications], "next_cursor": next_cursor}
+
+    @staticmethod
+    def _encode_cursor(n: Notification) -> str:
+        raw = json.dumps([n.created_at.isoformat(), n.id])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            created_at, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(created_at), int(last_id)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+
+    async def get_new_notifications(self, user_id: int, after_id: int, limit: int = 20) -> List[Dict[str, Any]]:
+        """Notifications created after after_id, oldest first (for the live stream)"""
+        notifications = await self.notification_repo.list_after(user_id, after_id, limit)
+        return [self._to_dict(n) for n in notifications]
+
+    async def get_latest_id(self, user_id: int) -> int:
+        return await self.notification_repo.latest_id(user_id)
 
     async def mark_as_read(self, notification_id: int, user_id: int) -> Dict[str, Any]:
         notification = await self.notification_repo.get_by_id(notification_id)
@@ -50,34 +94,107 @@ class NotificationService:
         return {"success": True, "count": count, "message": f"{count} notifications marked as read"}
 
     async def get_unread_count(self, user_id: int) -> int:
-        return await self.notification_repo.get_unread_count(user_id)
-
-    async def notify_task_assigned(self, assignee_id: int, task_id: int, task_title: str, assigner_name: str):
-        """Create notification when a task is assigned"""
-        await self.create_notification(
-            user_id=assignee_id,
-            type="task_assigned",
-            title="New Task Assigned",
-            message=f"{assigner_name} assigned you to task: {task_title}",
-            related_id=task_id
-        )
+        summary = await self.get_summary(user_id)
+        return summary["unread_notifications"]
 
-    async def notify_task_updated(self, user_id: int, task_id: int, task_title: str, updater_name: str):
-        """Create notification when a task is updated"""
-        await self.create_notification(
-            user_id=user_id,
-            type="task_updated",
-            title="Task Updated",
-            message=f"{updater_name} updated task: {task_title}",
-            related_id=task_id
-        )
+    async def get_summary(self, user_id: int, fresh: bool = False) -> Dict[str, int]:
+        """
+        Badge counters for the header, cached per user until a write invalidates
+        them. fresh re-counts, for callers woken by a commit before the writer
+        has invalidated the cache.
+        """
+        counts = None if fresh else user_counters.get(user_id)
+        if counts is None:
+            counts = {
+                "unread_notifications": await self.notification_repo.get_unread_count(user_id),
+                "pending_invitations": await self.invitation_repo.count_pending_for_receiver(user_id),
+            }
+            user_counters.set(user_id, counts)
+        return counts
 
-    async def notify_project_created(self, user_id: int, project_id: int, project_name: str, creator_name: str):
-        """Create notification when a new project is created"""
-        await self.create_notification(
-            user_id=user_id,
-            type="project_created",
-            title="New Project Created",
-            message=f"{creator_name} created project: {project_name}",
-            related_id=project_id
+    # Writers call the notify_* helpers inside their own transaction: each
+    # queues one outbox event (no commit), and fan_out_pending later turns
+    # the events into notifications in bulk.
+    async def notify_task_assigned(self, assignee_id: int, task_id: int, actor_id: Optional[int] = None):
+        """Queue a notification for the new assignee of a task"""
+        self.outbox_repo.add("task_assigned", task_id=task_id, user_id=assignee_id, actor_id=actor_id)
+
+    async def notify_task_updated(self, task_id: int, user_ids: List[Optional[int]], actor_id: Optional[int] = None):
+        """Queue notifications for the users following a task (its assignee and creator)"""
+        self.outbox_repo.add("task_updated", task_id=task_id, user_ids=user_ids, actor_id=actor_id)
+
+    async def notify_project_created(self, project_id: int, team_id: int, actor_id: Optional[int] = None):
+        """Queue notifications for every active member of the project's team"""
+        self.outbox_repo.add("project_created", project_id=project_id, team_id=team_id, actor_id=actor_id)
+
+    async def notify_many(self, events: List[Tuple[str, Dict[str, Any]]]):
+        """Queue many (kind, payload) events with one insert, for bulk writers"""
+        await self.outbox_repo.add_many(events)
+
+    async def fan_out_pending(self, batch_size: int = OUTBOX_BATCH_SIZE) -> int:
+        """
+        Expand queued outbox events into per-user notifications. Each batch
+        resolves its tasks, projects, team members and actor names with one
+        query per kind and inserts all its notifications with one executemany,
+        in the same transaction that deletes the events. Returns the number
+        of notifications created.
+        """
+        created = 0
+        while True:
+            events = await self.outbox_repo.next_batch(batch_size)
+            if not events:
+                return created
+            rows = await self._expand(events)
+            if await self.outbox_repo.remove(e[0] for e in events) != len(events):
+                # Another worker claimed part of this batch; let it finish
+                await self.db.rollback()
+                return created
+            await self.notification_repo.add_many(rows)
+            await self.db.commit()
+            for user_id in {r["user_id"] for r in rows}:
+                user_counters.invalidate(user_id)
+            created += len(rows)
+            if len(events) < batch_size:
+                return created
+
+    async def _expand(self, events: List[Tuple[int, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        payloads = [(kind, p) for _, kind, p in events]
+        tasks = {t.id: t for t in await TaskRepo(self.db).list_by_ids(
+            {p["task_id"] for kind, p in payloads if kind in ("task_assigned", "task_updated")}
+        )}
+        projects = {p.id: p for p in await ProjectRepo(self.db).list_by_ids(
+            {p["project_id"] for kind, p in payloads if kind == "project_created"}
+        )}
+        members = await TeamRepo(self.db).active_member_ids(
+            {p.team_id for p in projects.values() if p.team_id is not None}
         )
+        actors = await get_loader(self.db).load_users({p.get("actor_id") for _, p in payloads})
+
+        now = datetime.utcnow()
+        rows: List[Dict[str, Any]] = []
+
+        def add(user_id, kind, title, message, related_id):
+            rows.append({"user_id": user_id, "type": kind, "title": title, "message": message,
+                         "related_id": related_id, "is_read": 0, "created_at": now})
+
+        for kind, p in payloads:
+            actor_id = p.get("actor_id")
+            actor = actors[actor_id].name if actor_id in actors else "Someone"
+            if kind == "project_created":
+                project = projects.get(p["project_id"])
+                if not project:
+                    continue
+                for user_id in members.get(project.team_id, []):
+                    if user_id != actor_id:
+                        add(user_id, kind, "New Project Created", f"{actor} created project: {project.name}", project.id)
+                continue
+            task = tasks.get(p["task_id"])
+            if not task:
+                continue  # deleted before fan-out
+            if kind == "task_assigned":
+                if p["user_id"] != actor_id:
+                    add(p["user_id"], kind, "New Task Assigned", f"{actor} assigned you to task: {task.title}", task.id)
+            else:
+                for user_id in set(p["user_ids"]) - {None, actor_id}:
+                    add(user_id, kind, "Task Updated", f"{actor} updated task: {task.title}", task.id)
+        return rows
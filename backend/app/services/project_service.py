@@ -2,6 +2,7 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.project_repo import ProjectRepo
+from app.services.notification_service import NotificationService
 from app.models.models import Project
 
 class ProjectService:
@@ -9,8 +10,13 @@ class ProjectService:
         self.session = session
         self.repo = ProjectRepo(session)
 
-    async def create_project(self, name: str, description: Optional[str], team_id: Optional[int] = None) -> Project:
+    async def create_project(self, name: str, description: Optional[str], team_id: Optional[int] = None,
+                             created_by: Optional[int] = None) -> Project:
         project = Project(name=name, description=description, team_id=team_id)
+        if team_id is not None:
+            self.session.add(project)
+            await self.session.flush()  # assign project.id for the event
+            await NotificationService(self.session).notify_project_created(project.id, team_id, actor_id=created_by)
         return await self.repo.create(project)
 
     async def list_projects_for_team(self, team_id: int) -> List[dict]:
@@ -0,0 +1,73 @@
+# backend/app/services/reminder_service.py
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.reminder_repo import ReminderRepo
+from app.repositories.notification_repo import NotificationRepo
+from app.core.counter_cache import user_counters
+from app.core.config import REMINDER_LEAD_HOURS, REMINDER_OVERDUE_LOOKBACK_DAYS, REMINDER_BATCH_SIZE
+
+# Statuses that still need a reminder; done tasks are skipped
+OPEN_TASK_STATUSES = ("todo", "in-progress")
+
+class ReminderService:
+    """
+    Scans for tasks that are due soon or overdue and notifies their
+    assignee (or creator when unassigned). Each job looks only at open tasks
+    due inside its window and skips those already reminded for their current
+    due date, so a scan reads the tasks in the window and nothing else.
+    Tasks created or rescheduled into a window are picked up on the next scan.
+    """
+    def __init__(self, db: AsyncSession, batch_size: int = REMINDER_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.reminder_repo = ReminderRepo(db)
+        self.notification_repo = NotificationRepo(db)
+
+    async def send_due_soon(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.utcnow()
+        return await self._scan("due_soon", now, now, now + timedelta(hours=REMINDER_LEAD_HOURS))
+
+    async def send_overdue(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.utcnow()
+        # Tasks overdue for longer than the lookback are left alone
+        return await self._scan("overdue", now, now - timedelta(days=REMINDER_OVERDUE_LOOKBACK_DAYS), now)
+
+    async def _scan(self, job: str, now: datetime, due_after: datetime, due_until: datetime) -> int:
+        sent = 0
+        while True:
+            tasks = await self.reminder_repo.tasks_due(job, due_after, due_until, OPEN_TASK_STATUSES, self.batch_size)
+            if not tasks:
+                break
+            claimed = await self.reminder_repo.claim(job, {task.id: task.due_date for task in tasks})
+            rows = [
+                self._notification(job, task, now) for task in tasks
+                if task.id in claimed and (task.assignee_id or task.created_by)
+            ]
+            await self.notification_repo.add_many(rows)
+            await self.db.commit()
+            for user_id in {r["user_id"] for r in rows}:
+                user_counters.invalidate(user_id)
+
+            sent += len(rows)
+            if not claimed or len(tasks) < self.batch_size:
+                # Nothing claimed means another worker is sending this batch
+                break
+        return sent
+
+    @staticmethod
+    def _notification(job: str, task, now: datetime) -> dict:
+        due = task.due_date.strftime("%b %d, %H:%M UTC")
+        if job == "overdue":
+            kind, title, message = "task_overdue", "Task Overdue", f"{task.title} was due {due}"
+        else:
+            kind, title, message = "task_due_soon", "Task Due Soon", f"{task.title} is due {due}"
+        return {
+            "user_id": task.assignee_id or task.created_by,
+            "type": kind,
+            "title": title,
+            "message": message,
+            "related_id": task.id,
+            "is_read": 0,
+            "created_at": now,
+        }
@@ -0,0 +1,50 @@
+# backend/app/services/retention_service.py
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.notification_repo import NotificationRepo
+from app.repositories.invitation_repo import InvitationRepo
+from app.core.config import (
+    NOTIFICATION_RETENTION_DAYS, INVITATION_RETENTION_DAYS, RETENTION_BATCH_SIZE,
+)
+
+class RetentionService:
+    """
+    Deletes history nobody needs any more: read notifications older than
+    NOTIFICATION_RETENTION_DAYS and answered invitations older than
+    INVITATION_RETENTION_DAYS. Rows go in chunks of RETENTION_BATCH_SIZE,
+    each its own short transaction, with a pause in between so request
+    writes are never stuck behind one long delete.
+    """
+    def __init__(self, db: AsyncSession, batch_size: int = RETENTION_BATCH_SIZE, pause_seconds: float = 0.05):
+        self.db = db
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+        self.notification_repo = NotificationRepo(db)
+        self.invitation_repo = InvitationRepo(db)
+
+    async def purge(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        now = now or datetime.utcnow()
+        deleted = {"notifications": 0, "invitations": 0}
+        if NOTIFICATION_RETENTION_DAYS > 0:
+            cutoff = now - timedelta(days=NOTIFICATION_RETENTION_DAYS)
+            while True:
+                count = len(await self.notification_repo.delete_read_before(cutoff, self.batch_size))
+                await self._end_chunk()
+                deleted["notifications"] += count
+                if count < self.batch_size:
+                    break
+        if INVITATION_RETENTION_DAYS > 0:
+            cutoff = now - timedelta(days=INVITATION_RETENTION_DAYS)
+            while True:
+                count = await self.invitation_repo.delete_processed_before(cutoff, self.batch_size)
+                await self._end_chunk()
+                deleted["invitations"] += count
+                if count < self.batch_size:
+                    break
+        return deleted
+
+    async def _end_chunk(self) -> None:
+        await self.db.commit()
+        await asyncio.sleep(self.pause_seconds)
@@ -0,0 +1,32 @@
+# backend/app/services/search_service.py
+from typing import Any, Dict, Iterable, List
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.search_repo import SearchRepo, to_fts_query
+
+SEARCH_TYPES = ("tasks", "projects", "messages")
+
+class SearchService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repo = SearchRepo(session)
+
+    async def search(self, user_id: int, query: str, types: Iterable[str] = SEARCH_TYPES, limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """Best-ranked hits per type, restricted to what the user can see"""
+        if self.session.bind.dialect.name != "sqlite":
+            raise HTTPException(status_code=501, detail="Full-text search requires SQLite FTS5")
+        unknown = set(types) - set(SEARCH_TYPES)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown search types: {', '.join(sorted(unknown))}")
+
+        results: Dict[str, List[Dict[str, Any]]] = {t: [] for t in types}
+        match = to_fts_query(query)
+        if match is None:
+            return results
+        if "tasks" in results:
+            results["tasks"] = await self.repo.search_tasks(user_id, match, limit)
+        if "projects" in results:
+            results["projects"] = await self.repo.search_projects(user_id, match, limit)
+        if "messages" in results:
+            results["messages"] = await self.repo.search_messages(user_id, match, limit)
+        return results
@@ -1,16 +1,29 @@
 # backend/app/services/task_service.py
-from typing import List, Optional
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.repositories.task_repo import TaskRepo
+from app.repositories.task_repo import TaskRepo, SORT_KEYS, PRIORITY_RANK
 from app.models.models import Task
 from app.repositories.project_repo import ProjectRepo
+from app.repositories.task_stats_repo import TaskStatsRepo, stat_deltas
+from app.services.notification_service import NotificationService
+from app.core.tags import normalize_tags
+
+TASK_STATUSES = {"todo", "in-progress", "done"}
 
 class TaskService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.repo = TaskRepo(session)
         self.project_repo = ProjectRepo(session)
+        self.stats_repo = TaskStatsRepo(session)
+        self.notifications = NotificationService(session)
+
+    @staticmethod
+    def _stat_row(task: Task) -> tuple:
+        return (task.created_by, task.assignee_id, task.project_id, task.status, task.due_date)
 
     async def create_task(self, title: str, created_by: int, project_id: Optional[int] = None, **kwargs) -> Task:
         # validate project if provided
@@ -33,7 +46,12 @@ class TaskService:
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow()
         )
-        return await self.repo.create(task)
+        await self.stats_repo.apply(stat_deltas([], [self._stat_row(task)]))
+        if task.assignee_id is not None:
+            self.session.add(task)
+            await self.session.flush()  # assign task.id for the event
+            await self.notifications.notify_task_assigned(task.assignee_id, task.id, actor_id=created_by)
+        return await self.repo.create(task, tags=normalize_tags(task.tags))
 
     async def list_tasks_for_project(self, project_id: int) -> List[Task]:
         return await self.repo.list_by_project(project_id)
@@ -44,24 +62,34 @@ class TaskService:
     async def get_task(self, task_id: int) -> Optional[Task]:
         return await self.repo.get_by_id(task_id)
 
-    async def update_task(self, task_id: int, **changes) -> Task:
+    async def update_task(self, task_id: int, actor_id: Optional[int] = None, **changes) -> Task:
         task = await self.repo.get_by_id(task_id)
         if not task:
             raise ValueError("Task not found")
         allowed = {"title", "description", "assignee_id", "priority", "status", "due_date", "estimate_minutes", "tags"}
+        before = self._stat_row(task)
+        changed = set()
         for k, v in changes.items():
             if k in allowed and v is not None:
+                if getattr(task, k) != v:
+                    changed.add(k)
                 setattr(task, k, v)
         task.updated_at = datetime.utcnow()
-        return await self.repo.update(task)
+        tags = normalize_tags(task.tags) if changes.get("tags") is not None else None
+        await self.stats_repo.apply(stat_deltas([before], [self._stat_row(task)]))
+        if "assignee_id" in changed:
+            await self.notifications.notify_task_assigned(task.assignee_id, task.id, actor_id=actor_id)
+        if changed - {"assignee_id"}:
+            await self.notifications.notify_task_updated(task.id, [task.assignee_id, task.created_by], actor_id=actor_id)
+        return await self.repo.update(task, tags=tags)
 
-    async def change_status(self, task_id: int, new_status: str) -> Task:
-        if new_status not in {"todo", "in-progress", "done"}:
+    async def change_status(self, task_id: int, new_status: str, actor_id: Optional[int] = None) -> Task:
+        if new_status not in TASK_STATUSES:
             raise ValueError("Invalid status")
-        return await self.update_task(task_id, status=new_status)
+        return await self.update_task(task_id, actor_id=actor_id, status=new_status)
 
-    async def assign(self, task_id: int, user_id: int) -> Task:
-        return await self.update_task(task_id, assignee_id=user_id)
+    async def assign(self, task_id: int, user_id: int, actor_id: Optional[int] = None) -> Task:
+        return await self.update_task(task_id, actor_id=actor_id, assignee_id=user_id)
 
     async def delete_task(self, task_id: int, user_id: int) -> None:
         """Delete a task - only creator or assignee can delete"""
@@ -71,8 +99,254 @@ class TaskService:
         # Check permission: only creator or admin can delete
         if task.created_by != user_id:
             raise PermissionError("You don't have permission to delete this task")
+        await self.stats_repo.apply(stat_deltas([self._stat_row(task)], []))
         await self.repo.delete(task)
 
+    async def bulk_apply(self, user_id: int, operations: Sequence[Any], atomic: bool = False) -> Dict[str, Any]:
+        """
+        Apply many task operations (schemas.BulkTaskOperation) in one transaction.
+        Permissions are checked for the whole batch with one query per entity
+        type; rejected operations get an error in their result and the rest are
+        applied (or nothing is, when atomic). Returns per-operation results in
+        request order.
+
+        Operations are grouped by kind and written as a few set-based
+        statements, so their order within the batch is not an order of
+        execution. A batch may therefore touch each existing task at most
+        once: any later operation on a task already changed by an earlier
+        accepted one is rejected. Each result's task is the row after the
+        whole batch, which is also the state after that operation.
+        """
+        results: List[Dict[str, Any]] = [
+            {"index": i, "op": op.op, "ok": False, "task_id": op.task_id, "error": None, "task": None}
+            for i, op in enumerate(operations)
+        ]
+        current = await self.repo.get_stat_rows_visible_to(
+            user_id, {op.task_id for op in operations if op.op != "create" and op.task_id is not None}
+        )
+        owners = {task_id: row[0] for task_id, row in current.items()}
+        project_ids = {op.task.project_id for op in operations if op.op == "create" and op.task and op.task.project_id is not None}
+        project_access = await self.project_repo.access_for_user(user_id, project_ids) if project_ids else {}
+
+        claimed = set()
+        for op, result in zip(operations, results):
+            result["error"] = self._bulk_error(op, user_id, owners, project_access)
+            if result["error"] or op.op == "create":
+                continue
+            if op.task_id in claimed:
+                result["error"] = "Task already changed by an earlier operation in this batch"
+            claimed.add(op.task_id)
+        rejected = any(r["error"] for r in results)
+        if atomic and rejected:
+            for r in results:
+                r["error"] = r["error"] or "Not applied: another operation in the batch was rejected"
+            return {"applied": 0, "results": results}
+
+        now = datetime.utcnow()
+        created: List[tuple] = []
+        updates: List[Dict[str, Any]] = []
+        by_status: Dict[str, List[int]] = {}
+        by_assignee: Dict[Optional[int], List[int]] = {}
+        deletes: List[int] = []
+        tags_by_task: Dict[int, List[str]] = {}
+        for op, result in zip(operations, results):
+            if result["error"]:
+                continue
+            if op.op == "create":
+                data = op.task
+                created.append((result, Task(
+                    project_id=data.project_id,
+                    title=data.title,
+                    description=data.description,
+                    assignee_id=data.assignee_id,
+                    priority=data.priority or "medium",
+                    status="todo",
+                    due_date=data.due_date,
+                    estimate_minutes=data.estimate_minutes,
+                    tags=data.tags,
+                    created_by=user_id,
+                    created_at=now,
+                    updated_at=now
+                )))
+            elif op.op == "update":
+                changes = op.changes.model_dump(exclude_none=True)
+                if changes:
+                    updates.append({"id": op.task_id, **changes, "updated_at": now})
+                if "tags" in changes:
+                    tags_by_task[op.task_id] = normalize_tags(changes["tags"])
+            elif op.op == "status":
+                by_status.setdefault(op.status, []).append(op.task_id)
+            elif op.op == "assign":
+                by_assignee.setdefault(op.assignee_id, []).append(op.task_id)
+            else:
+                deletes.append(op.task_id)
+            result["ok"] = True
+
+        if created:
+            await self.repo.bulk_add([task for _, task in created])
+            for result, task in created:
+                result["task_id"] = task.id
+                tags_by_task[task.id] = normalize_tags(task.tags)
+        await self.repo.bulk_update(updates)
+        for status, ids in by_status.items():
+            await self.repo.set_where_ids(ids, status=status, updated_at=now)
+        for assignee_id, ids in by_assignee.items():
+            await self.repo.set_where_ids(ids, assignee_id=assignee_id, updated_at=now)
+        deleted = set(deletes)
+        await self.repo.replace_tags({k: v for k, v in tags_by_task.items() if k not in deleted})
+        if deleted:
+            await self.repo.delete_where_ids(deleted)
+        await self.stats_repo.apply(self._bulk_stat_deltas(current, created, updates, by_status, by_assignee, deleted))
+        await self.notifications.notify_many(self._bulk_events(user_id, current, created, updates, by_status, by_assignee, deleted))
+        await self.session.commit()
+
+        touched = {r["task_id"] for r in results if r["ok"]} - deleted
+        tasks = {t.id: t for t in await self.repo.list_by_ids(touched)} if touched else {}
+        for r in results:
+            if r["ok"]:
+                r["task"] = tasks.get(r["task_id"])
+        return {"applied": sum(1 for r in results if r["ok"]), "results": results}
+
+    def _bulk_stat_deltas(self, current, created, updates, by_status, by_assignee, deleted) -> Dict[tuple, int]:
+        """Replay the batch over the tasks' stat columns, in the order bulk_apply writes them"""
+        fields = ("created_by", "assignee_id", "project_id", "status", "due_date")
+        rows = {task_id: dict(zip(fields, row)) for task_id, row in current.items()}
+        touched = set()
+        for change in updates:
+            rows[change["id"]].update({k: v for k, v in change.items() if k in fields})
+            touched.add(change["id"])
+        for status, ids in by_status.items():
+            for task_id in ids:
+                rows[task_id]["status"] = status
+            touched.update(ids)
+        for assignee_id, ids in by_assignee.items():
+            for task_id in ids:
+                rows[task_id]["assignee_id"] = assignee_id
+            touched.update(ids)
+        touched |= deleted
+        before = [current[task_id] for task_id in touched]
+        after = [tuple(rows[task_id][f] for f in fields) for task_id in touched - deleted]
+        after += [self._stat_row(task) for _, task in created]
+        return stat_deltas(before, after)
+
+    @staticmethod
+    def _bulk_events(user_id, current, created, updates, by_status, by_assignee, deleted) -> List[tuple]:
+        """Outbox events for the batch: one per new assignee and one per otherwise changed task"""
+        assignees = {task_id: row[1] for task_id, row in current.items()}
+        updated = set()
+        for change in updates:
+            if change.get("assignee_id") is not None:
+                assignees[change["id"]] = change["assignee_id"]
+            if set(change) - {"id", "updated_at", "assignee_id"}:
+                updated.add(change["id"])
+        for ids in by_status.values():
+            updated.update(ids)
+        for assignee_id, ids in by_assignee.items():
+            assignees.update((task_id, assignee_id) for task_id in ids)
+
+        events = [("task_assigned", {"task_id": task.id, "user_id": task.assignee_id, "actor_id": user_id})
+                  for _, task in created if task.assignee_id is not None]
+        events += [("task_assigned", {"task_id": task_id, "user_id": assignee_id, "actor_id": user_id})
+                   for task_id, assignee_id in assignees.items()
+                   if assignee_id is not None and assignee_id != current[task_id][1] and task_id not in deleted]
+        events += [("task_updated", {"task_id": task_id, "user_ids": [assignees[task_id], current[task_id][0]], "actor_id": user_id})
+                   for task_id in updated - deleted]
+        return events
+
+    @staticmethod
+    def _bulk_error(op: Any, user_id: int, owners: Dict[int, Optional[int]], project_access: Dict[int, bool]) -> Optional[str]:
+        """Why a bulk operation is rejected, or None if it can be applied"""
+        if op.op == "create":
+            if op.task is None:
+                return "create needs task"
+            if op.task.project_id is not None:
+                if op.task.project_id not in project_access:
+                    return "Project not found"
+                if not project_access[op.task.project_id]:
+                    return "Not a team member"
+            return None
+        if op.task_id is None:
+            return f"{op.op} needs task_id"
+        if op.task_id not in owners:
+            return "Task not found"
+        if op.op == "delete" and owners[op.task_id] != user_id:
+            return "You don't have permission to delete this task"
+        if op.op == "update":
+            if op.changes is None:
+                return "update needs changes"
+            if op.changes.status is not None and op.changes.status not in TASK_STATUSES:
+                return "Invalid status"
+        if op.op == "status" and op.status not in TASK_STATUSES:
+            return "Invalid status"
+        return None
+
     async def list_all_user_tasks(self, user_id: int) -> List[Task]:
         """Get all tasks created by or assigned to user, including tasks without projects"""
         return await self.repo.list_all_by_user(user_id)
+
+    async def tag_counts(self, user_id: int, project_id: Optional[int] = None, team_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Tag facets for a project or team the user belongs to"""
+        if (project_id is None) == (team_id is None):
+            raise ValueError("Pass exactly one of project_id or team_id")
+        if project_id is not None:
+            project = await self.project_repo.get_by_id(project_id)
+            if not project:
+                raise LookupError("Project not found")
+            team_id_to_check = project.team_id
+        else:
+            team_id_to_check = team_id
+        if team_id_to_check is not None:
+            from app.services.team_service import TeamService
+            if not await TeamService(self.session).is_member(team_id_to_check, user_id):
+                raise PermissionError("Not a team member")
+        counts = await self.repo.tag_counts(project_id=project_id, team_id=team_id)
+        return [{"tag": tag, "count": count} for tag, count in counts]
+
+    async def search_tasks(
+        self,
+        user_id: int,
+        sort: str = "created_at",
+        order: str = "desc",
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        **filters
+    ) -> Dict[str, Any]:
+        """Filtered, sorted page of the tasks visible to the user, plus the cursor for the next page"""
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Invalid sort key, expected one of: {', '.join(SORT_KEYS)}")
+        if order not in {"asc", "desc"}:
+            raise ValueError("Invalid order, expected asc or desc")
+
+        after = self._decode_cursor(cursor, sort) if cursor else None
+        # Fetch one extra row to learn whether another page exists
+        tasks = await self.repo.search(
+            user_id, sort=sort, descending=order == "desc", after=after, limit=limit + 1, **filters
+        )
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = self._encode_cursor(tasks[-1], sort)
+        return {"items": tasks, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _sort_value(task: Task, sort: str) -> Any:
+        if sort == "priority":
+            return PRIORITY_RANK.get(task.priority, 1)
+        if sort == "due_date":
+            return (task.due_date or datetime(9999, 12, 31)).isoformat()
+        value = getattr(task, sort)
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    def _encode_cursor(self, task: Task, sort: str) -> str:
+        raw = json.dumps([self._sort_value(task, sort), task.id])
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort: str):
+        try:
+            value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if sort in {"created_at", "updated_at", "due_date"}:
+                value = datetime.fromisoformat(value)
+            return value, int(last_id)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
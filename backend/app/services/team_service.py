@@ -3,6 +3,7 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.team_repo import TeamRepo, TeamMemberRepo
 from app.models.models import Team, TeamMember
+from app.core.chat_hub import chat_hub
 import random
 import string
 
@@ -64,6 +65,7 @@ class TeamService:
             raise PermissionError("Only team owner can delete the team")
         
         await self.team_repo.delete(team)
+        await chat_hub.disconnect_team(team_id)
 
     async def leave_team(self, team_id: int, user_id: int) -> None:
         """Leave team - members can leave, but not the owner"""
@@ -3,6 +3,7 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.user_repo import UserRepo
 from app.models.models import User
+from app.core.security import hash_password, verify_password
 
 class UserService:
     def __init__(self, session: AsyncSession):
@@ -10,17 +11,29 @@ class UserService:
         self.repo = UserRepo(session)
 
     async def create_user(self, name: str, email: str, password: str, code_id: Optional[str] = None) -> User:
-        user = User(name=name, email=email, password=password, code_id=code_id)
+        user = User(name=name, email=email, password=await hash_password(password), code_id=code_id)
         return await self.repo.create(user)
 
     async def authenticate(self, email: str, password: str) -> Optional[User]:
         user = await self.repo.get_by_email(email)
         if not user:
             return None
-        if password != user.password:
+        if not await self.check_password(user, password):
             return None
         return user
 
+    async def check_password(self, user: User, password: str) -> bool:
+        """Verify a password, upgrading plaintext or outdated hashes in place"""
+        matches, new_hash = await verify_password(password, user.password)
+        if matches and new_hash:
+            user.password = new_hash
+            await self.repo.update(user)
+        return matches
+
+    async def set_password(self, user: User, password: str) -> User:
+        user.password = await hash_password(password)
+        return await self.repo.update(user)
+
     async def get_by_id(self, user_id: int) -> Optional[User]:
         return await self.repo.get_by_id(user_id)
 
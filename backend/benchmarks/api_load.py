@@ -0,0 +1,290 @@
+# Latency and throughput of the real app under a mixed workload
+# Run from the backend folder: python -m benchmarks.api_load --requests 2000 --concurrency 20 --output results.json
+# Compare two runs:            python -m benchmarks.api_load --compare before.json after.json
+#
+# Drives app.main:app in-process through httpx's ASGI transport against a
+# fresh SQLite file seeded through the API, so every request takes the same
+# path as in production minus the network. Reports p50/p95/p99 latency,
+# requests per second and SQL statements per request for each endpoint.
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+PASSWORD = "benchmark-password"
+DEFAULT_MIX = {"login": 5, "dashboard": 25, "chat": 40, "tasks": 20, "invitations": 10}
+
+# Statement counter of the request being timed (None outside a request)
+_statements: contextvars.ContextVar = contextvars.ContextVar("statements", default=None)
+
+class Recorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.statements: Dict[str, List[int]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def add(self, name: str, seconds: float, statements: int, ok: bool) -> None:
+        self.samples.setdefault(name, []).append(seconds)
+        self.statements.setdefault(name, []).append(statements)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def report(self, elapsed: float) -> dict:
+        def pct(sorted_values, p):
+            return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))] * 1000
+
+        endpoints = {}
+        for name in sorted(self.samples):
+            values = sorted(self.samples[name])
+            endpoints[name] = {
+                "requests": len(values),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(values) / elapsed, 1),
+                "mean_ms": round(statistics.fmean(values) * 1000, 2),
+                "p50_ms": round(pct(values, 0.50), 2),
+                "p95_ms": round(pct(values, 0.95), 2),
+                "p99_ms": round(pct(values, 0.99), 2),
+                "statements_per_request": round(statistics.fmean(self.statements[name]), 2),
+            }
+        everything = sorted(v for values in self.samples.values() for v in values)
+        total = {
+            "requests": len(everything),
+            "errors": sum(self.errors.values()),
+            "rps": round(len(everything) / elapsed, 1),
+            "p50_ms": round(pct(everything, 0.50), 2),
+            "p95_ms": round(pct(everything, 0.95), 2),
+            "p99_ms": round(pct(everything, 0.99), 2),
+            "elapsed_s": round(elapsed, 2),
+        }
+        return {"endpoints": endpoints, "total": total}
+
+class VirtualUser:
+    """One signed-in user and the ids their scenarios work with"""
+    def __init__(self, client, recorder: Recorder, rng: random.Random, user: dict):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.user = user
+        self.headers = {"Authorization": f"Bearer {user['token']}"}
+        self.last_message_id = 0
+        self.messages_etag: Optional[str] = None
+
+    async def call(self, name: str, method: str, url: str, **kwargs):
+        counter = [0]
+        token = _statements.set(counter)
+        start = time.perf_counter()
+        try:
+            r = await self.client.request(method, url, headers={**self.headers, **kwargs.pop("headers", {})}, **kwargs)
+        finally:
+            _statements.reset(token)
+        self.recorder.add(name, time.perf_counter() - start, counter[0], r.status_code < 400)
+        return r
+
+    async def login(self):
+        r = await self.call("POST /auth/login", "POST", "/auth/login",
+                            json={"email": self.user["email"], "password": PASSWORD})
+        if r.status_code == 200:
+            self.headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    async def dashboard(self):
+        await self.call("GET /dashboard/stats", "GET", "/dashboard/stats")
+        await self.call("GET /teams/my", "GET", "/teams/my")
+        await self.call("GET /notifications/summary", "GET", "/notifications/summary")
+        await self.call("GET /tasks/search", "GET", "/tasks/search", params={"limit": 5})
+
+    async def chat(self):
+        team_id = self.user["team_id"]
+        if self.rng.random() < 0.1:
+            await self.call("POST /messages/", "POST", "/messages/",
+                            json={"team_id": team_id, "message": f"status update {self.rng.random():.6f}"})
+            return
+        # Poll for new messages the way an open chat does
+        headers = {"If-None-Match": self.messages_etag} if self.messages_etag else {}
+        r = await self.call("GET /messages/{team_id}", "GET", f"/messages/{team_id}",
+                            params={"after_id": self.last_message_id}, headers=headers)
+        if r.status_code == 200:
+            self.messages_etag = r.headers.get("etag")
+            items = r.json()
+            if items:
+                self.last_message_id = items[-1]["id"]
+                self.messages_etag = None  # the next poll uses a new after_id
+
+    async def tasks(self):
+        project_id = self.user["project_id"]
+        r = await self.call("POST /tasks/", "POST", "/tasks/", json={
+            "title": "Benchmark task", "project_id": project_id, "priority": self.rng.choice(["low", "medium", "high"]),
+            "due_date": (datetime.utcnow() + timedelta(days=self.rng.randint(-5, 20))).isoformat(),
+        })
+        if r.status_code != 200:
+            return
+        task_id = r.json()["id"]
+        await self.call("GET /tasks/project/{project_id}", "GET", f"/tasks/project/{project_id}")
+        await self.call("PATCH /tasks/{task_id}", "PATCH", f"/tasks/{task_id}", json={"description": "Updated by the benchmark"})
+        await self.call("PATCH /tasks/{task_id}/status", "PATCH", f"/tasks/{task_id}/status", params={"status": "done"})
+        await self.call("DELETE /tasks/{task_id}", "DELETE", f"/tasks/{task_id}")
+
+    async def invitations(self):
+        await self.call("GET /invitations/search-users", "GET", "/invitations/search-users",
+                        params={"q": self.rng.choice(["us", "use", "user 1", "user 2"])})
+        await self.call("GET /invitations/received", "GET", "/invitations/received")
+        await self.call("GET /invitations/sent", "GET", "/invitations/sent")
+
+async def seed(client, users: int, team_size: int, tasks_per_project: int, messages_per_team: int, rng: random.Random) -> List[dict]:
+    """Build the dataset through the API. Returns the signed-in users."""
+    async def signup(i):
+        email = f"user{i}@bench.local"
+        r = await client.post("/auth/signup", json={"name": f"User {i}", "email": email, "password": PASSWORD})
+        r.raise_for_status()
+        login = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+        return {"id": r.json()["user_id"], "email": email, "token": login.json()["access_token"]}
+
+    people = await asyncio.gather(*(signup(i) for i in range(users)))
+    for start in range(0, users, team_size):
+        members = people[start:start + team_size]
+        owner = {"Authorization": f"Bearer {members[0]['token']}"}
+        team = (await client.post("/teams/", json={"name": f"Team {start // team_size}"}, headers=owner)).json()
+        project = (await client.post("/projects/", json={"name": f"Project {start // team_size}", "team_id": team["id"]}, headers=owner)).json()
+        for m in members[1:]:
+            inv = (await client.post("/invitations/", json={"receiver_id": m["id"], "team_id": team["id"]}, headers=owner)).json()
+            await client.post("/invitations/accept", json={"invitation_id": inv["id"]}, headers={"Authorization": f"Bearer {m['token']}"})
+        for m in members:
+            m["team_id"], m["project_id"] = team["id"], project["id"]
+        for i in range(tasks_per_project):
+            await client.post("/tasks/", json={
+                "title": f"Seed task {i}", "project_id": project["id"],
+                "assignee_id": rng.choice(members)["id"],
+                "due_date": (datetime.utcnow() + timedelta(days=rng.randint(-10, 30))).isoformat(),
+            }, headers=owner)
+        for i in range(messages_per_team):
+            sender = rng.choice(members)
+            await client.post("/messages/", json={"team_id": team["id"], "message": f"Seed message {i}"},
+                              headers={"Authorization": f"Bearer {sender['token']}"})
+    return list(people)
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def run(args) -> dict:
+    # Configure the app before it's imported: throwaway database, cheap hashing
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{args.db}"
+    os.environ["BCRYPT_ROUNDS"] = str(args.bcrypt_rounds)
+    if os.path.exists(args.db):
+        os.remove(args.db)
+
+    import httpx
+    from sqlalchemy import event
+    from app.main import app
+    from app.db import engine, init_db
+
+    def count_statement(*_):
+        counter = _statements.get()
+        if counter is not None:
+            counter[0] += 1
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    await init_db()
+    rng = random.Random(args.seed)
+    mix = dict(DEFAULT_MIX)
+    for part in filter(None, args.mix.split(",")):
+        name, weight = part.split("=")
+        mix[name] = int(weight)
+    scenarios, weights = zip(*[(k, v) for k, v in mix.items() if v > 0])
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        people = await seed(client, args.users, args.team_size, args.tasks, args.messages, rng)
+        print(f"Seeded {len(people)} users in {time.perf_counter() - started:.1f}s")
+
+        recorder = Recorder()
+        remaining = [args.requests]
+
+        async def worker(i: int):
+            vu = VirtualUser(client, recorder, random.Random(args.seed * 1000 + i), people[i % len(people)])
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                await getattr(vu, vu.rng.choices(scenarios, weights)[0])()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+        result = recorder.report(time.perf_counter() - started)
+
+    await engine.dispose()
+    result["meta"] = {
+        "commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        "scenarios": args.requests,
+        "concurrency": args.concurrency,
+        "mix": mix,
+        "seed": args.seed,
+        "users": args.users,
+        "team_size": args.team_size,
+        "tasks_per_project": args.tasks,
+        "messages_per_team": args.messages,
+        "bcrypt_rounds": args.bcrypt_rounds,
+    }
+    return result
+
+def print_report(result: dict) -> None:
+    print(f"\n{'endpoint':<36} {'reqs':>6} {'err':>4} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'stmts':>6}")
+    for name, r in result["endpoints"].items():
+        print(f"{name:<36} {r['requests']:>6} {r['errors']:>4} {r['rps']:>8.1f} {r['p50_ms']:>8.2f} "
+              f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['statements_per_request']:>6.1f}")
+    t = result["total"]
+    print(f"{'TOTAL':<36} {t['requests']:>6} {t['errors']:>4} {t['rps']:>8.1f} {t['p50_ms']:>8.2f} {t['p95_ms']:>8.2f} {t['p99_ms']:>8.2f}")
+
+def print_comparison(before_path: str, after_path: str) -> None:
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    print(f"{before['meta'].get('commit')} -> {after['meta'].get('commit')}\n")
+    print(f"{'endpoint':<36} {'p50 ms':>16} {'p95 ms':>16} {'stmts':>12}")
+    for name in sorted(set(before["endpoints"]) | set(after["endpoints"])):
+        b, a = before["endpoints"].get(name), after["endpoints"].get(name)
+        if not b or not a:
+            print(f"{name:<36} {'only in ' + ('after' if a else 'before'):>16}")
+            continue
+        print(f"{name:<36} {b['p50_ms']:>7.2f} -> {a['p50_ms']:<6.2f} {b['p95_ms']:>7.2f} -> {a['p95_ms']:<6.2f} "
+              f"{b['statements_per_request']:>4.1f} -> {a['statements_per_request']:<4.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Mixed-workload latency benchmark against a seeded SQLite file")
+    parser.add_argument("--requests", type=int, default=2000, help="scenario runs in total (each is one or more requests)")
+    parser.add_argument("--concurrency", type=int, default=20, help="virtual users running scenarios at once")
+    parser.add_argument("--mix", default="", help="scenario weights, e.g. chat=60,tasks=10 (default %s)" % DEFAULT_MIX)
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--team-size", type=int, default=8)
+    parser.add_argument("--tasks", type=int, default=100, help="seed tasks per project")
+    parser.add_argument("--messages", type=int, default=200, help="seed chat messages per team")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4, help="kept low so logins don't dominate; see login_throughput")
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "taskflow-bench.db"))
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="print the difference between two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        print_comparison(*args.compare)
+        return
+    result = asyncio.run(run(args))
+    print_report(result)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+if __name__ == "__main__":
+    main()
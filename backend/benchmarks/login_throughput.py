@@ -0,0 +1,50 @@
+# Login throughput per bcrypt cost factor
+# Run from the backend folder: python -m benchmarks.login_throughput --rounds 10 11 12 --logins 100
+
+import argparse
+import asyncio
+import statistics
+import time
+from app.core.config import PASSWORD_HASH_WORKERS
+from app.core.security import make_password_context, hash_password, verify_password
+
+async def bench(rounds: int, logins: int, concurrency: int) -> dict:
+    context = make_password_context(rounds)
+    stored = await hash_password("correct horse battery staple", context)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def login():
+        async with semaphore:
+            start = time.perf_counter()
+            ok, _ = await verify_password("correct horse battery staple", stored, context)
+            latencies.append(time.perf_counter() - start)
+            assert ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rounds": rounds,
+        "logins_per_sec": logins / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure login throughput at each bcrypt cost factor")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=50, help="simultaneous login requests")
+    args = parser.parse_args()
+
+    print(f"Hash worker pool: {PASSWORD_HASH_WORKERS} threads, {args.concurrency} concurrent logins\n")
+    print(f"{'rounds':>6} {'logins/s':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for rounds in args.rounds:
+        r = await bench(rounds, args.logins, args.concurrency)
+        print(f"{r['rounds']:>6} {r['logins_per_sec']:>10.1f} {r['p50_ms']:>10.1f} {r['p95_ms']:>10.1f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,229 @@
+# Synthetic production-scale dataset for profiling
+# Run from the backend folder: python -m benchmarks.seed --db seed.db --teams 2000 --tasks-per-project 50 --messages-per-team 500
+# Inspect any database:        python -m benchmarks.seed --summary --db taskflow.db
+#
+# Rows are generated in Python and written with executemany in large
+# transactions, bypassing the repositories. Only the base tables are
+# loaded; the versioned migrations then derive everything else in bulk
+# (full-text indexes, task_tags, task_stats), exactly as they would when
+# upgrading an existing database.
+
+import argparse
+import os
+import random
+import string
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Sequence
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Connection
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S.%f"  # how SQLAlchemy stores DateTime in SQLite
+STATUSES = ["todo", "in-progress", "done"]
+PRIORITIES = ["low", "medium", "high"]
+TAGS = ["backend", "frontend", "api", "bug", "design", "docs", "infra", "ux", "perf", "release"]
+WORDS = ("review deploy fix update design write test refactor migrate plan sync release check "
+         "report meeting sprint backlog api database frontend login chat dashboard invoice").split()
+
+def zipf_weights(n: int, skew: float, rng: random.Random) -> List[float]:
+    """Activity weight per item; skew 0 is uniform, higher concentrates rows on a few items"""
+    weights = [1.0 / (rank ** skew) for rank in range(1, n + 1)]
+    rng.shuffle(weights)
+    total = sum(weights)
+    return [w / total for w in weights]
+
+def spread(total: int, weights: Sequence[float]) -> List[int]:
+    """Split `total` rows across items in proportion to their weights"""
+    counts = [int(total * w) for w in weights]
+    for i in range(total - sum(counts)):
+        counts[i % len(counts)] += 1
+    return counts
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+def stamp(dt: datetime) -> str:
+    return dt.strftime(DATE_FORMAT)
+
+def chunks(rows: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def insert(conn: Connection, table: str, columns: Sequence[str], rows: Iterable[tuple], batch: int) -> int:
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    count = 0
+    for part in chunks(rows, batch):
+        conn.exec_driver_sql(sql, part)
+        count += len(part)
+    print(f"  {table:<14} {count:>10,} rows")
+    return count
+
+def seed(args) -> None:
+    # Importing the models registers every table on Base.metadata
+    from app.db import Base
+    from app.models import models  # noqa: F401
+    from app.migrations import run_migrations
+    from app.core.security import make_password_context
+
+    rng = random.Random(args.seed)
+    now = datetime.utcnow()
+    start = now - timedelta(days=args.days)
+
+    def when() -> datetime:
+        return start + timedelta(seconds=rng.random() * args.days * 86400)
+
+    if os.path.exists(args.db):
+        if not args.force:
+            raise SystemExit(f"{args.db} exists; pass --force to overwrite it")
+        os.remove(args.db)
+
+    engine = create_engine(f"sqlite:///{args.db}")
+    begun = time.perf_counter()
+    with engine.begin() as conn:
+        # A throwaway file: skip the journal while loading
+        conn.exec_driver_sql("PRAGMA journal_mode=OFF")
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        Base.metadata.create_all(conn)
+
+    n_users = args.users or args.teams * args.team_size
+    password = make_password_context(args.bcrypt_rounds).hash(args.password)
+    team_weights = zipf_weights(args.teams, args.skew, rng)
+    user_weights = zipf_weights(n_users, args.skew, rng)
+    user_ids = list(range(1, n_users + 1))
+
+    print(f"Seeding {args.db}")
+    with engine.begin() as conn:
+        insert(conn, "users", ["id", "name", "email", "password", "code_id", "created_at"], (
+            (i, f"User {i}", f"user{i}@seed.local", password, f"{i:06X}", stamp(when()))
+            for i in user_ids
+        ), args.batch)
+
+        members_by_team: List[List[int]] = []
+        member_rows, team_rows = [], []
+        for team_id in range(1, args.teams + 1):
+            size = max(1, min(n_users, int(rng.gauss(args.team_size, args.team_size / 4))))
+            members = list(dict.fromkeys(rng.choices(user_ids, user_weights, k=size * 2)))[:size]
+            members_by_team.append(members)
+            code = "".join(rng.choices(string.ascii_uppercase + string.digits, k=8))
+            team_rows.append((team_id, f"Team {team_id}", f"{code}{team_id}", sentence(rng, 8),
+                              members[0], stamp(when()), len(members)))
+            for j, user_id in enumerate(members):
+                member_rows.append((team_id, user_id, "owner" if j == 0 else "member", "active"))
+        insert(conn, "teams", ["id", "name", "team_code", "description", "owner_id", "created_at", "active_member_count"],
+               team_rows, args.batch)
+        insert(conn, "team_members", ["team_id", "user_id", "role", "status"], member_rows, args.batch)
+
+        project_rows = []
+        for team_id in range(1, args.teams + 1):
+            for _ in range(args.projects_per_team):
+                project_rows.append((len(project_rows) + 1, team_id, sentence(rng, 2), sentence(rng, 12)))
+        insert(conn, "projects", ["id", "team_id", "name", "description"], project_rows, args.batch)
+
+        # Busy teams get proportionally more tasks and chat
+        project_weights = [team_weights[team_id - 1] / args.projects_per_team for _, team_id, _, _ in project_rows]
+        tasks_per_project = spread(args.tasks_per_project * len(project_rows), project_weights)
+        messages_per_team = spread(args.messages_per_team * args.teams, team_weights)
+
+        def task_rows():
+            for (project_id, team_id, _, _), count in zip(project_rows, tasks_per_project):
+                members = members_by_team[team_id - 1]
+                for _ in range(count):
+                    created = when()
+                    due = created + timedelta(days=rng.randint(1, 60)) if rng.random() < 0.7 else None
+                    tags = ", ".join(rng.sample(TAGS, rng.randint(0, 3))) or None
+                    yield (project_id, sentence(rng, 5), sentence(rng, 20), rng.choice(members),
+                           rng.choice(PRIORITIES), rng.choices(STATUSES, [3, 2, 5])[0],
+                           stamp(due) if due else None, rng.choice([None, 30, 60, 120, 240]), tags,
+                           rng.choice(members), stamp(created), stamp(created))
+        insert(conn, "tasks", ["project_id", "title", "description", "assignee_id", "priority", "status",
+                               "due_date", "estimate_minutes", "tags", "created_by", "created_at", "updated_at"],
+               task_rows(), args.batch)
+
+        def message_rows():
+            for team_id, count in enumerate(messages_per_team, start=1):
+                members = members_by_team[team_id - 1]
+                # Ids follow time, as they do for real chat history
+                times = sorted(when() for _ in range(count))
+                for created in times:
+                    yield (team_id, rng.choice(members), sentence(rng, rng.randint(3, 25)), stamp(created))
+        insert(conn, "team_messages", ["team_id", "user_id", "message", "created_at"], message_rows(), args.batch)
+
+        def notification_rows():
+            for user_id in user_ids:
+                for _ in range(args.notifications_per_user):
+                    yield (user_id, "Task Updated", sentence(rng, 8), "info", int(rng.random() < 0.8), stamp(when()))
+        insert(conn, "notifications", ["user_id", "title", "message", "type", "is_read", "created_at"],
+               notification_rows(), args.batch)
+
+        def invitation_rows():
+            for team_id, members in enumerate(members_by_team, start=1):
+                for _ in range(args.invitations_per_team):
+                    receiver = rng.choice(user_ids)
+                    if receiver not in members:
+                        yield (members[0], receiver, team_id, rng.choices(["pending", "accepted", "rejected"], [2, 5, 3])[0],
+                               stamp(when()))
+        insert(conn, "invitations", ["sender_id", "receiver_id", "team_id", "status", "created_at"],
+               invitation_rows(), args.batch)
+
+    print(f"Loaded base tables in {time.perf_counter() - begun:.1f}s; deriving indexes and counters")
+    with engine.begin() as conn:
+        applied = run_migrations(conn)
+        for m in applied:
+            print(f"  - {m}")
+        conn.exec_driver_sql("ANALYZE")
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    engine.dispose()
+    print(f"Done in {time.perf_counter() - begun:.1f}s. Every user's password is {args.password!r}")
+
+def summary(db: str) -> None:
+    """Row counts and schema version of a database (replaces the old check_*.py scripts)"""
+    if not os.path.exists(db):
+        raise SystemExit(f"{db} not found")
+    engine = create_engine(f"sqlite:///{db}")
+    with engine.connect() as conn:
+        tables = sorted(t for t in inspect(conn).get_table_names() if "_fts" not in t)
+        print(f"{db} ({os.path.getsize(db) / 1e6:,.1f} MB)\n")
+        for table in tables:
+            count = conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            print(f"  {table:<16} {count:>12,}")
+        if "schema_version" in tables:
+            latest = conn.execute(text("SELECT version, description FROM schema_version ORDER BY version DESC LIMIT 1")).first()
+            if latest:
+                print(f"\nSchema version {latest[0]}: {latest[1]}")
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a large synthetic TaskFlow database")
+    parser.add_argument("--db", default="seed.db")
+    parser.add_argument("--summary", action="store_true", help="print row counts of --db and exit")
+    parser.add_argument("--force", action="store_true", help="overwrite --db if it exists")
+    parser.add_argument("--teams", type=int, default=1000)
+    parser.add_argument("--team-size", type=int, default=8, help="average members per team")
+    parser.add_argument("--users", type=int, default=0, help="user pool size (default teams x team size)")
+    parser.add_argument("--projects-per-team", type=int, default=3)
+    parser.add_argument("--tasks-per-project", type=int, default=50, help="average; skew concentrates them")
+    parser.add_argument("--messages-per-team", type=int, default=500, help="average; skew concentrates them")
+    parser.add_argument("--notifications-per-user", type=int, default=20)
+    parser.add_argument("--invitations-per-team", type=int, default=3)
+    parser.add_argument("--skew", type=float, default=1.0, help="Zipf exponent for team and user activity (0 = uniform)")
+    parser.add_argument("--days", type=int, default=365, help="history length")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--batch", type=int, default=20000, help="rows per executemany")
+    parser.add_argument("--password", default="password123")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.summary:
+        summary(args.db)
+    else:
+        seed(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Response encoding cost for large lists: FastAPI's default path vs the precompiled adapters
+# Run from the backend folder: python -m benchmarks.serialization --rows 1000 --repeat 50
+
+import argparse
+import json
+import time
+from datetime import datetime
+from fastapi.encoders import jsonable_encoder
+from app.models.models import Task
+from app.api.serializers import json_response, task_list, message_list
+
+def default_path(data) -> bytes:
+    # What FastAPI does for a route without a response_model (JSONResponse.render)
+    return json.dumps(jsonable_encoder(data), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+def make_tasks(rows: int):
+    now = datetime.utcnow()
+    return [
+        Task(id=i, project_id=1, title=f"Task {i}", description="Write the quarterly report " * 3,
+             assignee_id=2, priority="medium", status="todo", due_date=now, estimate_minutes=30,
+             tags="backend, api", created_by=1, created_at=now, updated_at=now)
+        for i in range(rows)
+    ]
+
+def make_messages(rows: int):
+    now = datetime.utcnow().isoformat()
+    return [
+        {"id": i, "team_id": 1, "user": {"id": 1, "name": "Aman", "profile_picture": None},
+         "message": "Pushed the fix, please review " * 2, "created_at": now}
+        for i in range(rows)
+    ]
+
+def cpu_ms(fn, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CPU per list response")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    tasks, messages = make_tasks(args.rows), make_messages(args.rows)
+    cases = [
+        ("tasks", lambda: default_path(tasks), lambda: json_response(task_list, tasks, from_orm=True).body),
+        ("messages", lambda: default_path(messages), lambda: json_response(message_list, messages).body),
+    ]
+    print(f"{args.rows} rows, CPU ms per response\n")
+    print(f"{'list':>10} {'default':>10} {'adapter':>10} {'speedup':>8}")
+    for name, old, new in cases:
+        assert json.loads(old()) == json.loads(new())
+        before, after = cpu_ms(old, args.repeat), cpu_ms(new, args.repeat)
+        print(f"{name:>10} {before:>10.2f} {after:>10.2f} {before / after:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# backend/tests/conftest.py
+import os
+import tempfile
+
+# Settings are read at import time, so point them at a scratch directory
+# before the app is imported
+_tmp = tempfile.mkdtemp(prefix="taskflow-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/test.db"
+os.environ["BLOB_STORAGE_DIR"] = os.path.join(_tmp, "blobs")
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["REMINDERS_ENABLED"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+@pytest.fixture
+def signup(client):
+    """Create a user and return (user_id, headers, token)"""
+    def _signup(name: str):
+        email = f"{name}-{os.urandom(4).hex()}@example.com"
+        r = client.post("/auth/signup", json={"name": name, "email": email, "password": "pw12345"})
+        assert r.status_code == 200, r.text
+        token = client.post("/auth/login", json={"email": email, "password": "pw12345"}).json()["access_token"]
+        return r.json()["user_id"], {"Authorization": f"Bearer {token}"}, token
+    return _signup
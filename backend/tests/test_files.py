@@ -0,0 +1,64 @@
+# backend/tests/test_files.py
+import os
+import pytest
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+@pytest.fixture
+def shared_file(client, signup):
+    """A PNG posted in alice's team, which bob has joined; eve is an outsider"""
+    alice, alice_h, _ = signup("alice")
+    bob, bob_h, bob_token = signup("bob")
+    _, eve_h, eve_token = signup("eve")
+    team = client.post("/teams/", json={"name": "T"}, headers=alice_h).json()
+    inv = client.post("/invitations/", json={"receiver_id": bob, "team_id": team["id"]}, headers=alice_h).json()
+    client.post("/invitations/accept", json={"invitation_id": inv["id"]}, headers=bob_h)
+
+    data = PNG + os.urandom(64)
+    upload = client.post("/files/", files={"file": ("x.png", data, "image/png")}, headers=alice_h).json()
+    client.post("/messages/", json={"team_id": team["id"], "message": "f", "file_id": upload["file_id"]}, headers=alice_h)
+    return {
+        "url": upload["file_url"], "data": data, "team": team,
+        "alice_h": alice_h, "bob_h": bob_h, "bob_token": bob_token,
+        "eve_h": eve_h, "eve_token": eve_token,
+    }
+
+def test_member_can_download(client, shared_file):
+    r = client.get(shared_file["url"], headers=shared_file["alice_h"])
+    assert r.status_code == 200
+    assert r.content == shared_file["data"]
+    assert r.headers["x-content-type-options"] == "nosniff"
+
+def test_member_can_download_with_query_token(client, shared_file):
+    r = client.get(shared_file["url"], params={"token": shared_file["bob_token"]})
+    assert r.status_code == 200
+
+def test_anonymous_is_rejected(client, shared_file):
+    assert client.get(shared_file["url"]).status_code == 401
+    assert client.get(shared_file["url"], headers={"Range": "bytes=0-9"}).status_code == 401
+    assert client.get(shared_file["url"], params={"token": "not-a-jwt"}).status_code == 401
+
+def test_non_member_is_rejected(client, shared_file):
+    assert client.get(shared_file["url"], headers=shared_file["eve_h"]).status_code == 404
+    assert client.get(shared_file["url"], params={"token": shared_file["eve_token"]}).status_code == 404
+
+def test_non_member_with_same_content_is_rejected(client, shared_file):
+    # Identical bytes dedupe to the same id, which must not grant access
+    upload = client.post("/files/", files={"file": ("y.png", shared_file["data"], "image/png")},
+                         headers=shared_file["eve_h"]).json()
+    assert upload["file_url"] == shared_file["url"]
+    assert client.get(shared_file["url"], headers=shared_file["eve_h"]).status_code == 404
+
+def test_former_member_is_rejected(client, shared_file):
+    client.post(f"/teams/{shared_file['team']['id']}/leave", headers=shared_file["bob_h"])
+    assert client.get(shared_file["url"], headers=shared_file["bob_h"]).status_code == 404
+
+def test_html_is_served_as_attachment(client, signup):
+    _, headers, _ = signup("mallory")
+    team = client.post("/teams/", json={"name": "M"}, headers=headers).json()
+    upload = client.post("/files/", files={"file": ("x.html", b"<script>alert(1)</script>", "text/html")},
+                         headers=headers).json()
+    client.post("/messages/", json={"team_id": team["id"], "message": "f", "file_id": upload["file_id"]}, headers=headers)
+    r = client.get(upload["file_url"], headers=headers)
+    assert r.headers["content-type"] == "application/octet-stream"
+    assert r.headers["content-disposition"] == "attachment"
@@ -0,0 +1,32 @@
+# backend/tests/test_migrations.py
+import base64
+import hashlib
+from sqlalchemy import create_engine, text
+from app.db import Base
+from app.core.blob_store import blob_store
+from app.migrations import _backfill_message_blobs
+
+JPEG = b"\xff\xd8\xff\xe0" + b"\x00" * 64
+
+def test_backfill_moves_inline_attachments_to_blobs(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    Base.metadata.create_all(engine)
+    data_url = "data:image/jpeg;base64," + base64.b64encode(JPEG).decode()
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO team_messages (id, team_id, user_id, message, file_url, file_type) VALUES"
+            " (1, 1, 1, 'photo', :url, 'image/jpeg'),"
+            " (2, 1, 1, 'again', :url, NULL),"
+            " (3, 1, 1, 'broken', 'data:image/png;base64,@@@', NULL)"
+        ), {"url": data_url})
+        _backfill_message_blobs(conn)
+        rows = conn.execute(text("SELECT id, blob_id, file_url, file_type FROM team_messages ORDER BY id")).all()
+        blobs = conn.execute(text("SELECT id, size, content_type FROM blobs")).all()
+
+    digest = hashlib.sha256(JPEG).hexdigest()
+    assert rows[0] == (1, digest, None, "image/jpeg")
+    assert rows[1] == (2, digest, None, "image/jpeg")
+    # Undecodable rows keep their original value
+    assert rows[2] == (3, None, "data:image/png;base64,@@@", None)
+    assert blobs == [(digest, len(JPEG), "image/jpeg")]
+    assert blob_store.exists(digest)
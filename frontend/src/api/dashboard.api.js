@@ -0,0 +1,16 @@
+// src/api/dashboard.api.js
+import apiClient from './client';
+import { API_ENDPOINTS } from '../constants';
+
+const DashboardApi = {
+  /**
+   * Precomputed task counts for the current user and their teams' projects
+   * @returns {Promise<object>} { teams, tasks: { total, by_status, overdue, due_this_week, completed }, projects }
+   */
+  getStats: async () => {
+    const response = await apiClient.get(API_ENDPOINTS.DASHBOARD_STATS);
+    return response.data;
+  },
+};
+
+export default DashboardApi;
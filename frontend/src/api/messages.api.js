@@ -1,5 +1,13 @@
 // src/api/messages.api.js
 import apiClient from './client';
+import { API_BASE_URL } from '../constants';
+import StorageService from '../services/storage.service';
+
+const SOCKET_PING_MS = 25000;
+const SOCKET_RETRY_BASE_MS = 1000;
+const SOCKET_RETRY_MAX_MS = 30000;
+// Not signed in, not a member (or removed), team not found: retrying won't help
+const FINAL_CLOSE_CODES = [4401, 4403, 4404];
 
 const MessagesApi = {
   sendMessage: async (teamId, message) => {
@@ -10,22 +18,114 @@ const MessagesApi = {
     return response.data;
   },
 
-  sendMessageWithFile: async (teamId, message, fileData) => {
+  sendMessageWithFile: async (teamId, message, file) => {
+    // Upload the file as multipart first; the message only carries its id
+    const formData = new FormData();
+    formData.append('file', file);
+    const upload = await apiClient.post('/files/', formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+      timeout: 60000
+    });
     const response = await apiClient.post('/messages/', {
       team_id: teamId,
       message,
-      file_data: fileData.file_data,
-      file_name: fileData.file_name,
-      file_type: fileData.file_type
+      file_id: upload.data.file_id,
+      file_name: file.name,
+      file_type: file.type
     });
     return response.data;
   },
 
-  getTeamMessages: async (teamId, limit = 100) => {
+  /**
+   * Absolute URL for a message attachment (legacy messages carry a data: URL).
+   * Downloads need auth and <img src> can't send a header, so the token
+   * goes in the query string.
+   * @param {string} fileUrl - file_url from a message
+   * @returns {string} URL usable in src/href
+   */
+  resolveFileUrl: (fileUrl) => {
+    if (!fileUrl?.startsWith('/')) return fileUrl;
+    const token = StorageService.getToken();
+    return `${API_BASE_URL}${fileUrl}?token=${encodeURIComponent(token)}`;
+  },
+
+  getTeamMessages: async (teamId, limit = 100, cursor = {}) => {
+    // cursor: { after_id } for newer messages, { before_id } for older history
     const response = await apiClient.get(`/messages/${teamId}`, {
-      params: { limit }
+      params: { limit, ...cursor }
     });
     return response.data;
+  },
+
+  /**
+   * Every message newer than afterId, oldest first (pages until caught up)
+   * @param {number} teamId - Team ID
+   * @param {number} afterId - Last message id already shown
+   * @returns {Array} Messages
+   */
+  getMessagesSince: async (teamId, afterId, limit = 100) => {
+    const messages = [];
+    let cursor = afterId;
+    for (;;) {
+      const page = await MessagesApi.getTeamMessages(teamId, limit, { after_id: cursor });
+      messages.push(...page);
+      if (page.length < limit) return messages;
+      cursor = page[page.length - 1].id;
+    }
+  },
+
+  /**
+   * Keep a live chat socket open for a team.
+   * Reconnects with exponential backoff and pings so idle proxies keep it
+   * open. onOpen runs on every (re)connect so the caller can fetch what was
+   * posted while it was down. Auth and membership closes are final.
+   * @param {number} teamId - Team ID
+   * @param {function} onMessage - Called with each pushed message
+   * @param {function} onOpen - Called each time the socket (re)opens
+   * @returns {{close: function}} Handle; close() stops reconnecting
+   */
+  openTeamSocket: (teamId, onMessage, onOpen) => {
+    const wsBase = API_BASE_URL.replace(/^http/, 'ws');
+    let socket = null;
+    let pingTimer = null;
+    let retryTimer = null;
+    let attempt = 0;
+    let stopped = false;
+
+    const connect = () => {
+      const token = StorageService.getToken();
+      socket = new WebSocket(`${wsBase}/ws/teams/${teamId}?token=${encodeURIComponent(token)}`);
+      socket.onopen = () => {
+        attempt = 0;
+        pingTimer = setInterval(() => socket.send('ping'), SOCKET_PING_MS);
+        onOpen?.();
+      };
+      socket.onmessage = (event) => {
+        if (event.data === 'pong') return;
+        const payload = JSON.parse(event.data);
+        if (payload.type === 'message') {
+          onMessage(payload.data);
+        }
+      };
+      // onclose follows every error, so retries are scheduled there
+      socket.onclose = (event) => {
+        clearInterval(pingTimer);
+        if (stopped || FINAL_CLOSE_CODES.includes(event.code)) return;
+        const delay = Math.min(SOCKET_RETRY_MAX_MS, SOCKET_RETRY_BASE_MS * 2 ** attempt);
+        attempt += 1;
+        retryTimer = setTimeout(connect, delay / 2 + Math.random() * delay / 2);
+      };
+    };
+
+    connect();
+    return {
+      close: () => {
+        stopped = true;
+        clearTimeout(retryTimer);
+        clearInterval(pingTimer);
+        socket.close();
+      }
+    };
   }
 };
 
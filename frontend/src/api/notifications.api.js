@@ -1,10 +1,18 @@
 // src/api/notifications.api.js
 import apiClient from './client';
+import { API_BASE_URL } from '../constants';
+import StorageService from '../services/storage.service';
 
 const NotificationsApi = {
-  getNotifications: async (unreadOnly = false) => {
+  /**
+   * One page of notifications, newest first
+   * @param {boolean} unreadOnly - Only unread notifications
+   * @param {string|null} cursor - next_cursor of the previous page
+   * @returns {Promise<object>} { items, next_cursor }
+   */
+  getNotifications: async (unreadOnly = false, cursor = null, limit = 50) => {
     const response = await apiClient.get('/notifications/', {
-      params: { unread_only: unreadOnly }
+      params: { unread_only: unreadOnly, limit, ...(cursor ? { cursor } : {}) }
     });
     return response.data;
   },
@@ -14,6 +22,11 @@ const NotificationsApi = {
     return response.data.count;
   },
 
+  getSummary: async () => {
+    const response = await apiClient.get('/notifications/summary');
+    return response.data;
+  },
+
   markAsRead: async (notificationId) => {
     const response = await apiClient.post('/notifications/mark-read', {
       notification_id: notificationId
@@ -24,6 +37,22 @@ const NotificationsApi = {
   markAllAsRead: async () => {
     const response = await apiClient.post('/notifications/mark-all-read');
     return response.data;
+  },
+
+  /**
+   * Open the live notification stream (Server-Sent Events)
+   * @param {function} onSummary - Called with { unread_notifications, pending_invitations }
+   * @param {function} onNotification - Called with each new notification
+   * @returns {EventSource} Open stream (caller closes it)
+   */
+  openStream: (onSummary, onNotification) => {
+    const token = StorageService.getToken();
+    const source = new EventSource(`${API_BASE_URL}/notifications/stream?token=${encodeURIComponent(token)}`);
+    source.addEventListener('summary', (event) => onSummary(JSON.parse(event.data)));
+    if (onNotification) {
+      source.addEventListener('notification', (event) => onNotification(JSON.parse(event.data)));
+    }
+    return source;
   }
 };
 
@@ -70,6 +70,20 @@ class TasksApi {
     const response = await apiClient.get('/tasks/user/all');
     return response.data;
   }
+
+  /**
+   * Search tasks server-side, one page at a time
+   * @param {object} params - { status, priority, assignee_id, project_id, due_from, due_to, tags, q, sort, order, cursor, limit }
+   * @returns {Promise<object>} { items, next_cursor }
+   */
+  async searchTasks(params = {}) {
+    const response = await apiClient.get(API_ENDPOINTS.SEARCH_TASKS, {
+      params,
+      // Send arrays as status=todo&status=done, which FastAPI expects
+      paramsSerializer: { indexes: null },
+    });
+    return response.data;
+  }
 }
 
 export default new TasksApi();
\ No newline at end of file
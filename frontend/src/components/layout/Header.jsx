@@ -7,7 +7,6 @@ import { useAuth } from '../../hooks/useAuth';
 import { useTheme } from '../../hooks/useTheme';
 import Button from '../common/Button';
 import Avatar from '../common/Avatar';
-import InvitationsApi from '../../api/invitations.api';
 import NotificationsApi from '../../api/notifications.api';
 
 /**
@@ -23,20 +22,30 @@ const Header = () => {
   const [notificationCount, setNotificationCount] = useState(0);
 
   useEffect(() => {
-    loadCounts();
-    // Check for new notifications every 10 seconds
-    const interval = setInterval(loadCounts, 10000);
-    return () => clearInterval(interval);
+    // The server pushes counts as they change; EventSource reconnects by itself
+    const source = NotificationsApi.openStream(applySummary);
+    let interval = null;
+    source.onerror = () => {
+      // A rejected stream (e.g. expired token) is closed for good: fall back to polling
+      if (source.readyState === EventSource.CLOSED && !interval) {
+        loadCounts();
+        interval = setInterval(loadCounts, 30000);
+      }
+    };
+    return () => {
+      source.close();
+      if (interval) clearInterval(interval);
+    };
   }, []);
 
+  const applySummary = (summary) => {
+    setInvitationCount(summary.pending_invitations);
+    setNotificationCount(summary.unread_notifications);
+  };
+
   const loadCounts = async () => {
     try {
-      const [invitations, notifCount] = await Promise.all([
-        InvitationsApi.getReceivedInvitations('pending'),
-        NotificationsApi.getUnreadCount()
-      ]);
-      setInvitationCount(invitations.length);
-      setNotificationCount(notifCount);
+      applySummary(await NotificationsApi.getSummary());
     } catch (error) {
       console.error('Failed to load counts:', error);
     }
@@ -19,23 +19,47 @@ const ChatPanel = ({ team }) => {
   const [isLoading, setIsLoading] = useState(true);
   const [isSending, setIsSending] = useState(false);
   const messagesEndRef = useRef(null);
+  const teamIdRef = useRef(null);
+  const lastIdRef = useRef(null);
 
   useEffect(() => {
     if (team?.id) {
+      teamIdRef.current = team.id;
+      setMessages([]);
       loadMessages();
-      const interval = setInterval(loadMessages, 5000); // Refresh every 5 seconds
-      return () => clearInterval(interval);
+      // New messages are pushed over the team socket; every (re)connect also
+      // fetches whatever was posted while it was not listening
+      const socket = MessagesApi.openTeamSocket(team.id, appendMessage, catchUp);
+      return () => socket.close();
     }
   }, [team?.id]);
 
+  useEffect(() => {
+    lastIdRef.current = messages.length ? messages[messages.length - 1].id : null;
+  }, [messages]);
+
   useEffect(() => {
     scrollToBottom();
   }, [messages]);
 
+  // Add messages not shown yet, keeping id (send) order; responses for a
+  // team the user has since switched away from are dropped
+  const mergeMessages = (teamId, incoming) => {
+    if (teamId !== teamIdRef.current) return;
+    setMessages((prev) => {
+      const seen = new Set(prev.map((m) => m.id));
+      const added = incoming.filter((m) => !seen.has(m.id));
+      return added.length ? [...prev, ...added].sort((a, b) => a.id - b.id) : prev;
+    });
+  };
+
+  const appendMessage = (message) => mergeMessages(team.id, [message]);
+
   const loadMessages = async () => {
+    const teamId = team.id;
     try {
-      const data = await MessagesApi.getTeamMessages(team.id);
-      setMessages(data);
+      const data = await MessagesApi.getTeamMessages(teamId);
+      mergeMessages(teamId, data);
     } catch (error) {
       console.error('Failed to load messages:', error);
     } finally {
@@ -43,6 +67,20 @@ const ChatPanel = ({ team }) => {
     }
   };
 
+  const catchUp = async () => {
+    if (lastIdRef.current == null) {
+      // History may still be loading from before the socket opened; reload it
+      loadMessages();
+      return;
+    }
+    const teamId = team.id;
+    try {
+      mergeMessages(teamId, await MessagesApi.getMessagesSince(teamId, lastIdRef.current));
+    } catch (error) {
+      console.error('Failed to fetch missed messages:', error);
+    }
+  };
+
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
   };
@@ -53,9 +91,9 @@ const ChatPanel = ({ team }) => {
 
     try {
       setIsSending(true);
-      await MessagesApi.sendMessage(team.id, newMessage.trim());
+      const sent = await MessagesApi.sendMessage(team.id, newMessage.trim());
       setNewMessage('');
-      await loadMessages();
+      appendMessage(sent);
     } catch (error) {
       console.error('Failed to send message:', error);
       alert('Failed to send message');
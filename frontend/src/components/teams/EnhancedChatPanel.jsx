@@ -26,6 +26,8 @@ const EnhancedChatPanel = ({ team, onTeamUpdate, onAddMember, onViewProjects, on
   const [showMenu, setShowMenu] = useState(false);
   const [selectedFile, setSelectedFile] = useState(null);
   const messagesEndRef = useRef(null);
+  const teamIdRef = useRef(null);
+  const lastIdRef = useRef(null);
   const fileInputRef = useRef(null);
   const menuRef = useRef(null);
 
@@ -43,14 +45,21 @@ const EnhancedChatPanel = ({ team, onTeamUpdate, onAddMember, onViewProjects, on
 
   useEffect(() => {
     if (team?.id) {
+      teamIdRef.current = team.id;
+      setMessages([]);
       loadMessages();
       loadMembers();
-      // Poll for new messages every 10 seconds
-      const interval = setInterval(loadMessages, 10000);
-      return () => clearInterval(interval);
+      // New messages are pushed over the team socket; every (re)connect also
+      // fetches whatever was posted while it was not listening
+      const socket = MessagesApi.openTeamSocket(team.id, appendMessage, catchUp);
+      return () => socket.close();
     }
   }, [team?.id]);
 
+  useEffect(() => {
+    lastIdRef.current = messages.length ? messages[messages.length - 1].id : null;
+  }, [messages]);
+
   // Remove auto-scroll effect - only scroll when user sends message
 
   useEffect(() => {
@@ -63,10 +72,24 @@ const EnhancedChatPanel = ({ team, onTeamUpdate, onAddMember, onViewProjects, on
     return () => document.removeEventListener('mousedown', handleClickOutside);
   }, []);
 
+  // Add messages not shown yet, keeping id (send) order; responses for a
+  // team the user has since switched away from are dropped
+  const mergeMessages = (teamId, incoming) => {
+    if (teamId !== teamIdRef.current) return;
+    setMessages((prev) => {
+      const seen = new Set(prev.map((m) => m.id));
+      const added = incoming.filter((m) => !seen.has(m.id));
+      return added.length ? [...prev, ...added].sort((a, b) => a.id - b.id) : prev;
+    });
+  };
+
+  const appendMessage = (message) => mergeMessages(team.id, [message]);
+
   const loadMessages = async () => {
+    const teamId = team.id;
     try {
-      const data = await MessagesApi.getTeamMessages(team.id);
-      setMessages(data);
+      const data = await MessagesApi.getTeamMessages(teamId);
+      mergeMessages(teamId, data);
     } catch (error) {
       console.error('Failed to load messages:', error);
     } finally {
@@ -74,6 +97,20 @@ const EnhancedChatPanel = ({ team, onTeamUpdate, onAddMember, onViewProjects, on
     }
   };
 
+  const catchUp = async () => {
+    if (lastIdRef.current == null) {
+      // History may still be loading from before the socket opened; reload it
+      loadMessages();
+      return;
+    }
+    const teamId = team.id;
+    try {
+      mergeMessages(teamId, await MessagesApi.getMessagesSince(teamId, lastIdRef.current));
+    } catch (error) {
+      console.error('Failed to fetch missed messages:', error);
+    }
+  };
+
   const loadMembers = async () => {
     try {
       const data = await TeamsApi.getTeamMembers(team.id);
@@ -96,36 +133,17 @@ const EnhancedChatPanel = ({ team, onTeamUpdate, onAddMember, onViewProjects, on
       setIsSending(true);
       
       if (selectedFile) {
-        // Convert file to base64
-        const reader = new FileReader();
-        reader.onloadend = async () => {
-          try {
-            const base64File = reader.result;
-            await MessagesApi.sendMessageWithFile(team.id, newMessage.trim() || 'Sent a file', {
-              file_data: base64File,
-              file_name: selectedFile.name,
-              file_type: selectedFile.type
-            });
-            setSelectedFile(null);
-            setNewMessage('');
-            await loadMessages();
-            scrollToBottom();
-            showSuccess('File sent successfully');
-          } catch (error) {
-            console.error('Failed to send file:', error);
-            showError('Failed to send file');
-          } finally {
-            setIsSending(false);
-          }
-        };
-        reader.readAsDataURL(selectedFile);
-        return;
+        const sent = await MessagesApi.sendMessageWithFile(team.id, newMessage.trim() || 'Sent a file', selectedFile);
+        setSelectedFile(null);
+        setNewMessage('');
+        appendMessage(sent);
+        showSuccess('File sent successfully');
       } else {
-        await MessagesApi.sendMessage(team.id, newMessage.trim());
+        const sent = await MessagesApi.sendMessage(team.id, newMessage.trim());
         setNewMessage('');
+        appendMessage(sent);
       }
       
-      await loadMessages();
       scrollToBottom();
     } catch (error) {
       console.error('Failed to send message:', error);
@@ -331,13 +349,17 @@ const EnhancedChatPanel = ({ team, onTeamUpdate, onAddMember, onViewProjects, on
                               <div className="flex items-center gap-2 text-sm">
                                 {getFileIcon(message.file_type)}
                                 <span>{message.file_name}</span>
-                                <button className="hover:opacity-70">
+                                <a
+                                  href={MessagesApi.resolveFileUrl(message.file_url)}
+                                  download={message.file_name}
+                                  className="hover:opacity-70"
+                                >
                                   <Download className="h-4 w-4" />
-                                </button>
+                                </a>
                               </div>
                               {message.file_type?.startsWith('image/') && (
                                 <img 
-                                  src={message.file_url} 
+                                  src={MessagesApi.resolveFileUrl(message.file_url)} 
                                   alt={message.file_name}
                                   className="max-w-full rounded"
                                 />
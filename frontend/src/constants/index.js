@@ -31,6 +31,10 @@ export const API_ENDPOINTS = {
   CHANGE_TASK_STATUS: (taskId) => `/tasks/${taskId}/status`,
   DELETE_TASK: (taskId) => `/tasks/${taskId}`,
   ALL_USER_TASKS: '/tasks/user/all',
+  SEARCH_TASKS: '/tasks/search',
+
+  // Dashboard
+  DASHBOARD_STATS: '/dashboard/stats',
 };
 
 // ============================================
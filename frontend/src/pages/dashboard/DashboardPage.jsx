@@ -7,7 +7,7 @@ import DashboardLayout from '../../components/layout/DashboardLayout';
 import StatsCard from '../../components/dashboard/StatsCard';
 import QuickActions from '../../components/dashboard/QuickActions';
 import RecentTasks from '../../components/dashboard/RecentTasks';
-import TeamsApi from '../../api/teams.api';
+import DashboardApi from '../../api/dashboard.api';
 import TasksApi from '../../api/tasks.api';
 
 /**
@@ -34,42 +34,23 @@ const DashboardPage = () => {
     try {
       setIsLoading(true);
       
-      // Load teams
-      const teams = await TeamsApi.getMyTeams();
-      
-      // Load all tasks to get stats
-      let allTasks = [];
-      let allProjects = [];
-      
-      try {
-        allTasks = await TasksApi.getAllUserTasks();
-      } catch (err) {
-        console.error('Failed to load tasks:', err);
-      }
-      
-      // Load projects from all teams
-      for (const team of teams) {
-        try {
-          const { default: ProjectsApi } = await import('../../api/projects.api');
-          const teamProjects = await ProjectsApi.getTeamProjects(team.id);
-          allProjects.push(...teamProjects);
-        } catch (err) {
-          console.error('Failed to load projects:', err);
-        }
-      }
-      
-      // Calculate stats
-      const completedTasks = allTasks.filter(task => task.status === 'done').length;
-      
+      // Counts come precomputed from the server; only the 5 newest tasks are fetched
+      const [dashboardStats, recent] = await Promise.all([
+        DashboardApi.getStats(),
+        TasksApi.searchTasks({ sort: 'created_at', order: 'desc', limit: 5 }).catch((err) => {
+          console.error('Failed to load tasks:', err);
+          return { items: [] };
+        }),
+      ]);
+
       setStats({
-        teams: teams.length,
-        projects: allProjects.length,
-        tasks: allTasks.length,
-        completed: completedTasks,
+        teams: dashboardStats.teams,
+        projects: dashboardStats.projects.length,
+        tasks: dashboardStats.tasks.total,
+        completed: dashboardStats.tasks.completed,
       });
-      
-      // Set recent tasks (last 5 tasks)
-      setRecentTasks(allTasks.slice(0, 5));
+
+      setRecentTasks(recent.items);
       
     } catch (error) {
       console.error('Failed to load dashboard data:', error);
@@ -1,7 +1,7 @@
 // src/pages/notifications/NotificationsPage.jsx
 
 import { useState, useEffect } from 'react';
-import { Bell, CheckCircle, AlertCircle, Info, Trash2 } from 'lucide-react';
+import { Bell, CheckCircle, AlertCircle, Info, Trash2, Clock } from 'lucide-react';
 import DashboardLayout from '../../components/layout/DashboardLayout';
 import Card from '../../components/common/Card';
 import Button from '../../components/common/Button';
@@ -17,6 +17,8 @@ const NotificationsPage = () => {
   const [notifications, setNotifications] = useState([]);
   const [isLoading, setIsLoading] = useState(true);
   const [filter, setFilter] = useState('all'); // all, unread
+  const [nextCursor, setNextCursor] = useState(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     loadNotifications();
@@ -25,8 +27,9 @@ const NotificationsPage = () => {
   const loadNotifications = async () => {
     try {
       setIsLoading(true);
-      const data = await NotificationsApi.getNotifications(filter === 'unread');
-      setNotifications(data);
+      const page = await NotificationsApi.getNotifications(filter === 'unread');
+      setNotifications(page.items);
+      setNextCursor(page.next_cursor);
     } catch (error) {
       console.error('Failed to load notifications:', error);
     } finally {
@@ -34,10 +37,32 @@ const NotificationsPage = () => {
     }
   };
 
+  const loadMore = async () => {
+    try {
+      setIsLoadingMore(true);
+      const page = await NotificationsApi.getNotifications(filter === 'unread', nextCursor);
+      setNotifications((prev) => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } catch (error) {
+      console.error('Failed to load more notifications:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
+  // Update loaded pages in place rather than refetching from the first page
+  const applyRead = (isTarget) => {
+    setNotifications((prev) =>
+      filter === 'unread'
+        ? prev.filter((n) => !isTarget(n))
+        : prev.map((n) => (isTarget(n) ? { ...n, is_read: true } : n))
+    );
+  };
+
   const handleMarkAsRead = async (notificationId) => {
     try {
       await NotificationsApi.markAsRead(notificationId);
-      await loadNotifications();
+      applyRead((n) => n.id === notificationId);
     } catch (error) {
       console.error('Failed to mark as read:', error);
     }
@@ -46,7 +71,7 @@ const NotificationsPage = () => {
   const handleMarkAllAsRead = async () => {
     try {
       await NotificationsApi.markAllAsRead();
-      await loadNotifications();
+      applyRead(() => true);
     } catch (error) {
       console.error('Failed to mark all as read:', error);
     }
@@ -60,6 +85,10 @@ const NotificationsPage = () => {
         return <AlertCircle className="h-5 w-5 text-yellow-500" />;
       case 'project_created':
         return <Info className="h-5 w-5 text-green-500" />;
+      case 'task_due_soon':
+        return <Clock className="h-5 w-5 text-orange-500" />;
+      case 'task_overdue':
+        return <AlertCircle className="h-5 w-5 text-red-500" />;
       default:
         return <Bell className="h-5 w-5 text-gray-500" />;
     }
@@ -167,6 +196,13 @@ const NotificationsPage = () => {
                 </div>
               </Card>
             ))}
+            {nextCursor && (
+              <div className="flex justify-center pt-2">
+                <Button variant="outline" size="sm" onClick={loadMore} isLoading={isLoadingMore}>
+                  Load more
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>